@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+"""
+Deck loading benchmark for large generated decks
+
+Builds slides from an already parsed slides.yaml of increasing size and reports
+build time and memory per slide for the compact slide table, next to an eager
+model that creates a full object with its own style dict per slide and writes a
+temporary file for every inline slide. Then times opening slides.yaml from disk
+with the pure-Python and libyaml loaders and from the parsed-deck cache.
+"""
+
+import argparse
+import os
+import shutil
+import sys
+import tempfile
+import time
+import tracemalloc
+
+import yaml
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import slides.config.slide_config as slide_config_module  # noqa: E402
+from slides.config.deck_cache import DeckCache  # noqa: E402
+from slides.config.slide_config import SlideConfig  # noqa: E402
+
+
+class EagerSlide:
+    """Per-slide object holding its own copies of everything"""
+
+    def __init__(self, index, style):
+        """Initialize slide"""
+        self.index = index
+        self.style = style
+        self.path = None
+        self.content = None
+
+
+def build_eager(config, base_dir):
+    """Build slides the eager way; returns the list of slides"""
+    global_style = SlideConfig.DEFAULT_STYLE.copy()
+    global_style.update(config.get("style", {}))
+    slides = []
+    for index, slide_data in enumerate(config["slides"]):
+        style = global_style.copy()
+        style.update(slide_data.get("style", {}))
+        slide = EagerSlide(index, style)
+        if "path" in slide_data:
+            slide.path = os.path.join(base_dir, slide_data["path"])
+        else:
+            slide.content = slide_data["content"]
+            fd, slide.path = tempfile.mkstemp(suffix=".md", prefix=f"slide_{index}_")
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(slide.content)
+        slides.append(slide)
+    return slides
+
+
+def build_compact(config, base_dir):
+    """Build slides into a SlideTable; returns the table"""
+    slide_config = SlideConfig()
+    slide_config.config = config
+    slide_config.base_dir = base_dir
+    slide_config._process_slides()
+    return slide_config.slides
+
+
+def generated_config(count):
+    """Return a parsed slides.yaml for a generated deck of count slides"""
+    slides = []
+    for index in range(count):
+        if index % 10 == 9:
+            slides.append({"content": f"# Generated {index}\n\nInline slide"})
+        elif index % 10 == 5:
+            slides.append({"path": f"slides/{index:05d}.md", "style": {"fontSize": 32}})
+        else:
+            slides.append({"path": f"slides/{index:05d}.md"})
+    return {"title": "Generated", "style": {"font": "Arial"}, "slides": slides}
+
+
+def measure(build, config, base_dir):
+    """Return (build ms, retained bytes) for one build"""
+    tracemalloc.start()
+    start = time.perf_counter()
+    slides = build(config, base_dir)
+    elapsed = (time.perf_counter() - start) * 1000
+    retained, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del slides
+    return elapsed, retained
+
+
+def time_load(yaml_path, deck_cache, loader=None):
+    """Return ms taken by SlideConfig.load_config with a given loader"""
+    original_loader = slide_config_module.safe_loader
+    if loader is not None:
+        slide_config_module.safe_loader = lambda: loader
+    try:
+        start = time.perf_counter()
+        SlideConfig(deck_cache).load_config(yaml_path)
+        return (time.perf_counter() - start) * 1000
+    finally:
+        slide_config_module.safe_loader = original_loader
+
+
+def report_yaml_load(count, temp_dir):
+    """Time opening a generated slides.yaml with large inline slides"""
+    config = generated_config(count)
+    for slide in config["slides"]:
+        if "content" in slide:
+            slide["content"] += "\n\n" + "Generated paragraph text. " * 200
+    yaml_path = os.path.join(temp_dir, f"deck-{count}.yaml")
+    with open(yaml_path, "w", encoding="utf-8") as f:
+        yaml.dump(config, f, Dumper=getattr(yaml, "CSafeDumper", yaml.SafeDumper))
+    # Dated back so the cache trusts the file's mtime
+    os.utime(yaml_path, (1000000000, 1000000000))
+
+    cache_dir = os.path.join(temp_dir, f"cache-{count}")
+    print(f"opening slides.yaml ({count} slides, {os.path.getsize(yaml_path) / 1024:.0f} KiB)")
+    print(f"  {'SafeLoader':<12} {time_load(yaml_path, DeckCache(), yaml.SafeLoader):9.2f} ms")
+    if hasattr(yaml, "CSafeLoader"):
+        print(f"  {'CSafeLoader':<12} {time_load(yaml_path, DeckCache(), yaml.CSafeLoader):9.2f} ms")
+    deck_cache = DeckCache(cache_dir=cache_dir)
+    time_load(yaml_path, deck_cache)
+    print(f"  {'memory hit':<12} {time_load(yaml_path, deck_cache):9.2f} ms")
+    print(f"  {'disk hit':<12} {time_load(yaml_path, DeckCache(cache_dir=cache_dir)):9.2f} ms")
+
+
+def main():
+    """Run the benchmark"""
+    arg_parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    arg_parser.add_argument("--max-slides", type=int, default=10000,
+                            help="largest deck size to build")
+    args = arg_parser.parse_args()
+
+    temp_dir = tempfile.mkdtemp(prefix="glider-bench-")
+    original_tempdir = tempfile.tempdir
+    tempfile.tempdir = temp_dir
+    try:
+        count = 100
+        while count <= args.max_slides:
+            config = generated_config(count)
+            print(f"{count} slides")
+            for label, build in (("eager", build_eager), ("compact", build_compact)):
+                before = len(os.listdir(temp_dir))
+                elapsed, retained = measure(build, config, temp_dir)
+                written = len(os.listdir(temp_dir)) - before
+                print(f"  {label:<8} {elapsed:9.2f} ms  {elapsed * 1000 / count:7.2f} us/slide  "
+                      f"{retained / 1024:9.1f} KiB  {retained / count:7.1f} B/slide  "
+                      f"{written:6d} temp files")
+            count *= 10
+        report_yaml_load(args.max_slides, temp_dir)
+    finally:
+        tempfile.tempdir = original_tempdir
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark for per-event hotkey hook overhead
+
+Compares the time spent in the keyboard hook for every key press when each
+binding is rebuilt from config strings and checked in turn against the
+precompiled lookup used by HotkeyManager, for an increasing number of bindings.
+"""
+
+import argparse
+import os
+import statistics
+import string
+import sys
+import time
+
+from pynput import keyboard
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from slides.hotkeys.manager import HotkeyManager  # noqa: E402
+
+
+class BenchmarkConfig:
+    """Minimal stand-in for AppConfig holding only hotkeys"""
+
+    def __init__(self, hotkeys):
+        """Initialize with a hotkey configuration"""
+        self.hotkeys = hotkeys
+
+    def get_hotkey_config(self):
+        """Return hotkey configuration"""
+        return self.hotkeys
+
+
+def make_hotkeys(count):
+    """Return a configuration with count goto_slide bindings plus the defaults"""
+    hotkeys = {
+        "next_slide": ["cmd", "alt", "shift", "right"],
+        "previous_slide": ["cmd", "alt", "shift", "left"],
+    }
+    letters = string.ascii_lowercase + string.digits
+    for index in range(count):
+        hotkeys[f"goto_slide_{index + 1}"] = ["ctrl", "alt", letters[index % len(letters)]]
+    return hotkeys
+
+
+def scan_on_key_press(manager, key):
+    """The per-event scan: rebuild every binding's key set and test it"""
+    manager.active_keys.add(key)
+    for key_names in manager.hotkey_config.values():
+        required = set()
+        for key_name in key_names:
+            if key_name in HotkeyManager.KEY_MAPPING:
+                required.add(HotkeyManager.KEY_MAPPING[key_name])
+            else:
+                required.add(keyboard.KeyCode.from_char(key_name))
+        if required.issubset(manager.active_keys):
+            break
+    return True
+
+
+def time_events(on_press, on_release, events, repeat):
+    """Return per-event hook times in microseconds"""
+    timings = []
+    for _ in range(repeat):
+        for key in events:
+            start = time.perf_counter()
+            on_press(key)
+            on_release(key)
+            timings.append((time.perf_counter() - start) * 1e6)
+    return timings
+
+
+def report(label, timings):
+    """Print a summary line for a set of timings"""
+    print(f"  {label:<10} mean {statistics.mean(timings):8.3f} us  "
+          f"median {statistics.median(timings):8.3f} us  "
+          f"max {max(timings):9.3f} us")
+
+
+def main():
+    """Run the benchmark"""
+    arg_parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    arg_parser.add_argument("--repeat", type=int, default=2000,
+                            help="number of times the typed text is replayed")
+    args = arg_parser.parse_args()
+
+    # Ordinary typing: none of these presses match a binding
+    events = [keyboard.KeyCode.from_char(char) for char in "the quick brown fox"]
+
+    for count in (2, 10, 50, 200):
+        manager = HotkeyManager(BenchmarkConfig(make_hotkeys(count)))
+        print(f"{len(manager.hotkey_config)} bindings")
+        report("scan", time_events(
+            lambda key: scan_on_key_press(manager, key),
+            manager._on_key_release, events, args.repeat))
+        report("compiled", time_events(
+            manager._on_key_press, manager._on_key_release, events, args.repeat))
+
+
+if __name__ == "__main__":
+    main()
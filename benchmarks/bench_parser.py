@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark for markdown parsing
+
+Compares per-slide parse time of a fresh markdown.markdown() call per slide
+against the pooled engine used by MarkdownParser, on the sample deck and on a
+synthetic deck.
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import time
+
+import markdown
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from slides.markdown.parser import MarkdownParser  # noqa: E402
+
+SAMPLE_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "sample")
+
+SYNTHETIC_SLIDE = """# Slide {index}
+
+Some **bold** text and a [link](https://example.com/{index}).
+
+- First point
+- Second point
+
+| Metric | Value |
+| ------ | ----- |
+| index  | {index} |
+
+```python
+def slide_{index}():
+    return {index} * 2
+```
+"""
+
+
+def load_sample_deck():
+    """Return markdown text of the sample deck slides"""
+    texts = []
+    for name in sorted(os.listdir(SAMPLE_DIR)):
+        if name.endswith(".md"):
+            with open(os.path.join(SAMPLE_DIR, name), "r", encoding="utf-8") as f:
+                texts.append(f.read())
+    return texts
+
+
+def synthetic_deck(count):
+    """Return markdown text of a synthetic deck"""
+    return [SYNTHETIC_SLIDE.format(index=index) for index in range(count)]
+
+
+def time_per_slide(parse, texts):
+    """Return per-slide parse times in milliseconds"""
+    timings = []
+    for text in texts:
+        start = time.perf_counter()
+        parse(text)
+        timings.append((time.perf_counter() - start) * 1000)
+    return timings
+
+
+def report(label, timings):
+    """Print a summary line for a set of timings"""
+    print(f"  {label:<10} mean {statistics.mean(timings):8.3f} ms  "
+          f"median {statistics.median(timings):8.3f} ms  "
+          f"total {sum(timings):9.1f} ms")
+
+
+def main():
+    """Run the benchmark"""
+    arg_parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    arg_parser.add_argument("--slides", type=int, default=500,
+                            help="number of slides in the synthetic deck")
+    args = arg_parser.parse_args()
+
+    parser = MarkdownParser()
+    extensions = parser.extensions
+
+    def parse_fresh(text):
+        return markdown.markdown(text, extensions=extensions)
+
+    decks = [("sample deck", load_sample_deck()),
+             (f"{args.slides}-slide synthetic deck", synthetic_deck(args.slides))]
+
+    for name, texts in decks:
+        print(f"{name} ({len(texts)} slides)")
+        report("before", time_per_slide(parse_fresh, texts))
+        report("after", time_per_slide(parser.parse_text, texts))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+Slide switch latency benchmark
+
+Measures how long a slide switch takes with a setHtml() call per slide
+("page" mode) and with one deck document whose sections are toggled via
+runJavaScript ("deck" mode). Requires PyQt6-WebEngine and a display.
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import time
+
+from PyQt6.QtCore import QTimer
+from PyQt6.QtWidgets import QApplication
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from slides.config.slide_config import SlideConfig  # noqa: E402
+from slides.markdown.parser import MarkdownParser  # noqa: E402
+from slides.markdown.renderer import HTMLRenderer  # noqa: E402
+from slides.presentation.slide_view import SlideView  # noqa: E402
+
+SAMPLE_YAML = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "sample", "slides.yaml"
+)
+
+
+class SwitchBenchmark:
+    """Drives a SlideView through a sequence of switches in one mode"""
+
+    def __init__(self, view, slides, mode, switches, done):
+        """Initialize benchmark state"""
+        self.view = view
+        self.mode = mode
+        self.switches = switches
+        self.done = done
+        self.timings = []
+        self.step = 0
+        self.start = 0.0
+
+        parser = MarkdownParser()
+        renderer = HTMLRenderer()
+        fragments = [parser.parse_source(slide.source) for slide in slides]
+        self.pages = [renderer.create_slide_html(fragment, slide.style)
+                      for fragment, slide in zip(fragments, slides)]
+        self.deck_html = renderer.create_deck_html(
+            [(slide.index, fragment, slide.style) for fragment, slide in zip(fragments, slides)]
+        )
+
+    def run(self):
+        """Start the benchmark"""
+        if self.mode == "page":
+            self.view.web_view.loadFinished.connect(self._on_page_loaded)
+            self._next_page()
+        else:
+            self.view.web_view.loadFinished.connect(self._on_deck_loaded)
+            self.view.web_view.setHtml(self.deck_html)
+
+    def _next_page(self):
+        self.start = time.perf_counter()
+        self.view.web_view.setHtml(self.pages[self.step % len(self.pages)])
+
+    def _on_page_loaded(self, ok):
+        self._record()
+        if self.step < self.switches:
+            self._next_page()
+
+    def _on_deck_loaded(self, ok):
+        self.view.web_view.loadFinished.disconnect(self._on_deck_loaded)
+        self._next_section()
+
+    def _next_section(self):
+        self.start = time.perf_counter()
+        index = self.step % len(self.pages)
+        self.view.web_view.page().runJavaScript(f"gliderShow({index})", self._on_section_shown)
+
+    def _on_section_shown(self, result):
+        self._record()
+        if self.step < self.switches:
+            self._next_section()
+
+    def _record(self):
+        self.timings.append((time.perf_counter() - self.start) * 1000)
+        self.step += 1
+        if self.step >= self.switches:
+            QTimer.singleShot(0, self.done)
+
+
+def main():
+    """Run the benchmark"""
+    arg_parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    arg_parser.add_argument("config", nargs="?", default=SAMPLE_YAML, help="path to slides.yaml")
+    arg_parser.add_argument("--switches", type=int, default=50)
+    args = arg_parser.parse_args()
+
+    app = QApplication(sys.argv[:1])
+    slide_config = SlideConfig()
+    slide_config.load_config(args.config)
+    slides = slide_config.get_slides()
+
+    results = {}
+    for mode in ("page", "deck"):
+        view = SlideView()
+        view.resize(800, 600)
+        view.show()
+        benchmark = SwitchBenchmark(view, slides, mode, args.switches, app.quit)
+        QTimer.singleShot(0, benchmark.run)
+        app.exec()
+        results[mode] = benchmark.timings
+        view.close()
+
+    for mode, timings in results.items():
+        ordered = sorted(timings)
+        p95 = ordered[int(len(ordered) * 0.95) - 1]
+        print(f"{mode:<5} switches {len(timings):4d}  median {statistics.median(timings):8.2f} ms  "
+              f"p95 {p95:8.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,38 @@
+#!/usr/bin/env python3
+"""
+Headless deck compiler ("glider build")
+Renders every slide of a slides.yaml deck to static HTML without Qt
+"""
+
+import argparse
+import sys
+
+from slides.build.builder import DeckBuilder
+from slides.utils.error_handler import ErrorHandler
+from slides.utils.logging_setup import setup_logging
+
+
+def main():
+    """Build entry point"""
+    parser = argparse.ArgumentParser(description="Compile a slides.yaml deck to static HTML")
+    parser.add_argument("config", help="path to slides.yaml")
+    parser.add_argument("-o", "--output", default="build", help="output directory")
+    parser.add_argument("-j", "--workers", type=int, default=None,
+                        help="number of worker processes (default: CPU count)")
+    args = parser.parse_args()
+    setup_logging()
+
+    try:
+        manifest = DeckBuilder(args.config, args.output, args.workers).build()
+    except Exception as e:
+        ErrorHandler.handle_application_error(e)
+        print(f"Build failed: {e}", file=sys.stderr)
+        sys.exit(1)
+
+    for slide in manifest["slides"]:
+        print(f"{slide['file']}  {slide['render_ms']:8.2f} ms")
+    print(f"Built {manifest['slide_count']} slides in {manifest['build_ms']:.1f} ms -> {args.output}")
+
+
+if __name__ == "__main__":
+    main()
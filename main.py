@@ -4,47 +4,107 @@ Markdown Slides Application for macOS
 Entry point for the application
 """
 
+import argparse
 import os
 import sys
 
-from PyQt6.QtWidgets import QApplication
-
-from slides.config.app_config import AppConfig
-from slides.config.slide_config import SlideConfig
-from slides.hotkeys.manager import HotkeyManager
-from slides.presentation.window import PresentationWindow
 from slides.utils.error_handler import ErrorHandler
-from slides.utils.file_utils import ensure_config_directory
+from slides.utils.instrumentation import profiler
+
+# Everything else is imported in main() so --profile-startup can time it, and
+# pynput is only imported once the window is up
+
+
+def parse_arguments(argv):
+    """Parse command line arguments, leaving Qt arguments untouched"""
+    parser = argparse.ArgumentParser(description="Markdown slides presenter")
+    # A flag rather than a positional, so values of Qt options such as
+    # -style fusion are not taken for the deck
+    parser.add_argument(
+        "--deck",
+        metavar="PATH",
+        help="deck directory or slides.yaml to open instead of prompting",
+    )
+    parser.add_argument(
+        "--slide",
+        type=int,
+        metavar="N",
+        help="start on slide N (1-based)",
+    )
+    parser.add_argument(
+        "--no-resume",
+        action="store_true",
+        help="do not reopen the last deck and slide from the saved session",
+    )
+    parser.add_argument(
+        "--clear-cache",
+        action="store_true",
+        help="remove every persistent cache (render, highlight, images, decks) before starting",
+    )
+    parser.add_argument(
+        "--profile-startup",
+        action="store_true",
+        help="print import and startup phase times once the first slide is shown",
+    )
+    args, qt_args = parser.parse_known_args(argv[1:])
+    return args, argv[:1] + qt_args
 
 
 def main():
     """Application entry point"""
     try:
+        args, qt_argv = parse_arguments(sys.argv)
+        if args.profile_startup:
+            profiler.start()
+
+        with profiler.phase("imports"):
+            from PyQt6.QtWidgets import QApplication
+
+            from slides.config.app_config import AppConfig
+            from slides.presentation.scheme import register_scheme
+            from slides.presentation.window import PresentationWindow
+            from slides.utils.file_utils import clear_cache_directory, ensure_config_directory
+            from slides.utils.instrumentation import configure_tracing
+            from slides.utils.logging_setup import setup_logging
+
         # Ensure configuration directory exists
         ensure_config_directory()
 
+        if args.clear_cache:
+            clear_cache_directory()
+
+        # Custom URL schemes must be registered before the application exists
+        register_scheme()
+
         # Initialize application
-        app = QApplication(sys.argv)
+        with profiler.phase("QApplication"):
+            app = QApplication(qt_argv)
 
         # Load application configuration
-        app_config = AppConfig()
-        config_path = os.path.expanduser("~/.config/glider/config.json")
-        app_config.load_config(config_path)
+        with profiler.phase("config"):
+            app_config = AppConfig()
+            config_path = os.path.expanduser("~/.config/glider/config.json")
+            app_config.load_config(config_path)
+
+            # Errors are logged from a background thread into a rotating file
+            setup_logging(app_config.get_logging_config())
+
+            # Record navigation latency spans when enabled
+            configure_tracing(app_config.get_instrumentation_config())
 
         # Initialize presentation window
-        window = PresentationWindow(app_config)
+        with profiler.phase("window"):
+            start_slide = args.slide - 1 if args.slide is not None else None
+            window = PresentationWindow(
+                app_config, args.deck, start_slide, resume=not args.no_resume
+            )
+        if profiler.enabled:
+            window.slide_view.slide_shown.connect(report_startup)
 
         # Initialize hotkey manager with safe defaults
         try:
-            # Initialize hotkey manager
-            hotkey_manager = HotkeyManager(app_config)
-
-            # Set up hotkey handlers
-            hotkey_manager.set_next_handler(window.next_slide)
-            hotkey_manager.set_previous_handler(window.previous_slide)
-
-            # Register hotkeys
-            hotkey_manager.register_hotkeys()
+            with profiler.phase("hotkeys"):
+                hotkey_manager = setup_hotkeys(app_config, window)
 
             # Clean up on exit (in try block)
             exit_code = app.exec()
@@ -67,5 +127,38 @@ def main():
         sys.exit(1)
 
 
+def setup_hotkeys(app_config, window):
+    """Create the global hotkey manager, bind it to the window and start listening"""
+    from slides.hotkeys.dispatcher import HotkeyDispatcher
+    from slides.hotkeys.manager import HotkeyManager
+
+    # Initialize hotkey manager
+    hotkey_manager = HotkeyManager(app_config)
+
+    # Hotkeys fire on the listener thread; the dispatcher queues them
+    # for the GUI thread and coalesces repeated presses
+    dispatcher = HotkeyDispatcher(parent=window)
+    window.slide_view.slide_shown.connect(dispatcher.mark_painted)
+
+    # Set up hotkey handlers
+    hotkey_manager.set_next_handler(dispatcher.bind(
+        'next_slide', lambda count: window.step_slide(count), counted=True))
+    hotkey_manager.set_previous_handler(dispatcher.bind(
+        'previous_slide', lambda count: window.step_slide(-count), counted=True))
+    hotkey_manager.set_first_handler(dispatcher.bind('first_slide', window.first_slide))
+    hotkey_manager.set_last_handler(dispatcher.bind('last_slide', window.last_slide))
+    hotkey_manager.set_goto_handler(dispatcher.bind('goto_slide', window.go_to_slide))
+
+    # Register hotkeys
+    hotkey_manager.register_hotkeys()
+    return hotkey_manager
+
+
+def report_startup():
+    """Print the startup profile the first time a slide is shown"""
+    profiler.mark("first slide shown")
+    profiler.report()
+
+
 if __name__ == "__main__":
     main()
@@ -0,0 +1,3 @@
+"""
+Headless deck compilation for the Slides application
+"""
@@ -0,0 +1,86 @@
+"""
+Parallel static deck builder
+
+This module must stay free of PyQt6 imports so decks can be compiled on
+machines without a display or Qt installation.
+"""
+
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from slides.config.slide_config import SlideConfig
+from slides.markdown.parser import MarkdownParser
+from slides.markdown.renderer import HTMLRenderer
+from slides.utils.file_utils import write_file
+
+# Per-process parser and renderer, created on first use in each worker
+_parser = None
+_renderer = None
+
+
+def render_slide_job(job):
+    """Render one slide in a worker process and return its timing"""
+    global _parser, _renderer
+    if _parser is None:
+        _parser = MarkdownParser()
+        _renderer = HTMLRenderer()
+
+    index, source, style = job
+    start = time.perf_counter()
+    html_content = _parser.parse_source(source)
+    html = _renderer.create_slide_html(html_content, style)
+    elapsed_ms = (time.perf_counter() - start) * 1000
+    return index, html, elapsed_ms
+
+
+class DeckBuilder:
+    """Compiles a slides.yaml deck into a static output directory"""
+
+    def __init__(self, yaml_path, output_dir, max_workers=None):
+        """Initialize builder for a deck and output directory"""
+        self.yaml_path = yaml_path
+        self.output_dir = output_dir
+        self.max_workers = max_workers
+
+    def build(self):
+        """Render every slide in parallel and write HTML files plus a manifest"""
+        start = time.perf_counter()
+
+        slide_config = SlideConfig()
+        slide_config.load_config(self.yaml_path)
+        slides = slide_config.get_slides()
+        if not slides:
+            raise ValueError(f"No slides found in {self.yaml_path}")
+
+        jobs = [(slide.index, slide.source, slide.style) for slide in slides]
+        results = {}
+        with ProcessPoolExecutor(max_workers=self.max_workers) as executor:
+            for index, html, elapsed_ms in executor.map(render_slide_job, jobs):
+                results[index] = (html, elapsed_ms)
+
+        os.makedirs(self.output_dir, exist_ok=True)
+        manifest_slides = []
+        for slide in slides:
+            html, elapsed_ms = results[slide.index]
+            file_name = f"slide-{slide.index + 1:03d}.html"
+            write_file(os.path.join(self.output_dir, file_name), html)
+            manifest_slides.append({
+                "index": slide.index,
+                "file": file_name,
+                "source": slide.path,
+                "render_ms": round(elapsed_ms, 3)
+            })
+
+        manifest = {
+            "title": slide_config.get_title(),
+            "slide_count": len(slides),
+            "build_ms": round((time.perf_counter() - start) * 1000, 3),
+            "slides": manifest_slides
+        }
+        write_file(
+            os.path.join(self.output_dir, "manifest.json"),
+            json.dumps(manifest, indent=2)
+        )
+        return manifest
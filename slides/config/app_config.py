@@ -14,7 +14,9 @@ class AppConfig:
     DEFAULT_CONFIG = {
         "hotkeys": {
             "next_slide": ["cmd", "alt", "shift", "right"],
-            "previous_slide": ["cmd", "alt", "shift", "left"]
+            "previous_slide": ["cmd", "alt", "shift", "left"],
+            "first_slide": ["cmd", "alt", "shift", "up"],
+            "last_slide": ["cmd", "alt", "shift", "down"]
         },
         "window": {
             "width": 800,
@@ -23,6 +25,58 @@ class AppConfig:
         },
         "slides": {
             "default_directory": "~"
+        },
+        "navigation": {
+            "settle_ms": 80
+        },
+        "presentation": {
+            "mode": "page",
+            "deck_window": 2,
+            "view_pool_size": 3
+        },
+        "cache": {
+            "max_entries": 64,
+            "max_bytes": 33554432,
+            "disk_enabled": True,
+            "disk_max_bytes": 268435456,
+            "highlight_max_entries": 2048,
+            "highlight_disk_enabled": True,
+            "highlight_disk_max_bytes": 67108864,
+            "asset_max_bytes": 67108864,
+            "asset_max_mapped": 16,
+            "deck_disk_enabled": True
+        },
+        "prefetch": {
+            "enabled": True,
+            "ahead": 2,
+            "behind": 1,
+            "workers": 2
+        },
+        "images": {
+            "enabled": True,
+            "workers": 2,
+            "resize_threshold": 0.25,
+            "disk_max_bytes": 268435456
+        },
+        "watch": {
+            "enabled": True,
+            "debounce_ms": 250,
+            "poll_interval_ms": 1000,
+            "polling": False
+        },
+        "instrumentation": {
+            "enabled": False,
+            "dump_path": None,
+            "capacity": 4096
+        },
+        "logging": {
+            "level": "INFO",
+            "max_bytes": 1048576,
+            "backup_count": 3
+        },
+        "session": {
+            "enabled": True,
+            "resume": True
         }
     }
     
@@ -64,6 +118,60 @@ class AppConfig:
             if 'slides' not in self.config:
                 self.config['slides'] = {}
             self.config['slides'].update(loaded_config['slides'])
+
+        # Update navigation settings if present
+        if 'navigation' in loaded_config:
+            if 'navigation' not in self.config:
+                self.config['navigation'] = {}
+            self.config['navigation'].update(loaded_config['navigation'])
+
+        # Update presentation settings if present
+        if 'presentation' in loaded_config:
+            if 'presentation' not in self.config:
+                self.config['presentation'] = {}
+            self.config['presentation'].update(loaded_config['presentation'])
+
+        # Update cache settings if present
+        if 'cache' in loaded_config:
+            if 'cache' not in self.config:
+                self.config['cache'] = {}
+            self.config['cache'].update(loaded_config['cache'])
+
+        # Update prefetch settings if present
+        if 'prefetch' in loaded_config:
+            if 'prefetch' not in self.config:
+                self.config['prefetch'] = {}
+            self.config['prefetch'].update(loaded_config['prefetch'])
+
+        # Update image settings if present
+        if 'images' in loaded_config:
+            if 'images' not in self.config:
+                self.config['images'] = {}
+            self.config['images'].update(loaded_config['images'])
+
+        # Update watch settings if present
+        if 'watch' in loaded_config:
+            if 'watch' not in self.config:
+                self.config['watch'] = {}
+            self.config['watch'].update(loaded_config['watch'])
+
+        # Update instrumentation settings if present
+        if 'instrumentation' in loaded_config:
+            if 'instrumentation' not in self.config:
+                self.config['instrumentation'] = {}
+            self.config['instrumentation'].update(loaded_config['instrumentation'])
+
+        # Update logging settings if present
+        if 'logging' in loaded_config:
+            if 'logging' not in self.config:
+                self.config['logging'] = {}
+            self.config['logging'].update(loaded_config['logging'])
+
+        # Update session settings if present
+        if 'session' in loaded_config:
+            if 'session' not in self.config:
+                self.config['session'] = {}
+            self.config['session'].update(loaded_config['session'])
     
     def _create_default_config(self):
         """Create default configuration file"""
@@ -84,3 +192,39 @@ class AppConfig:
     def get_slides_config(self):
         """Return slides configuration"""
         return self.config.get('slides', {})
+
+    def get_navigation_config(self):
+        """Return navigation configuration"""
+        return self.config.get('navigation', {})
+
+    def get_presentation_config(self):
+        """Return presentation mode configuration"""
+        return self.config.get('presentation', {})
+
+    def get_cache_config(self):
+        """Return render cache configuration"""
+        return self.config.get('cache', {})
+
+    def get_prefetch_config(self):
+        """Return neighbouring slide prefetch configuration"""
+        return self.config.get('prefetch', {})
+
+    def get_images_config(self):
+        """Return image downscaling configuration"""
+        return self.config.get('images', {})
+
+    def get_watch_config(self):
+        """Return live reload file watching configuration"""
+        return self.config.get('watch', {})
+
+    def get_instrumentation_config(self):
+        """Return latency instrumentation configuration"""
+        return self.config.get('instrumentation', {})
+
+    def get_logging_config(self):
+        """Return log file configuration"""
+        return self.config.get('logging', {})
+
+    def get_session_config(self):
+        """Return session snapshot and resume configuration"""
+        return self.config.get('session', {})
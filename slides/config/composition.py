@@ -0,0 +1,173 @@
+"""
+Deck composition: include: entries and glob paths in slides.yaml
+"""
+
+import glob
+import os
+import re
+from concurrent.futures import ThreadPoolExecutor
+
+GLOB_CHARS_RE = re.compile(r'[*?[]')
+DIGITS_RE = re.compile(r'(\d+)')
+
+
+def has_glob(path):
+    """Return whether a path contains glob wildcards"""
+    return GLOB_CHARS_RE.search(path) is not None
+
+
+def glob_prefix(pattern):
+    """Return the leading part of pattern that contains no wildcards"""
+    match = GLOB_CHARS_RE.search(pattern)
+    return pattern if match is None else pattern[:match.start()]
+
+
+def natural_sort_key(path):
+    """Sort key ordering embedded numbers numerically, so 2 sorts before 10"""
+    return [int(part) if part.isdigit() else part.lower() for part in DIGITS_RE.split(path)]
+
+
+def expand_glob(base_dir, pattern):
+    """Return normalized paths of files matching pattern under base_dir, in natural order"""
+    matches = glob.glob(os.path.join(base_dir, pattern), recursive=True)
+    return sorted((os.path.abspath(path) for path in matches if os.path.isfile(path)),
+                  key=natural_sort_key)
+
+
+class DeckResolver:
+    """Flattens a deck and the decks it includes into a slide table
+
+    Included decks are loaded and glob patterns expanded on a thread pool, one
+    level of the include tree at a time, before slides are assembled in order.
+    """
+
+    MAX_WORKERS = 8
+
+    def __init__(self, load_document, max_workers=None):
+        """Initialize resolver; load_document(path) returns (document, file state)"""
+        self.load_document = load_document
+        self.max_workers = max_workers or self.MAX_WORKERS
+        self.documents = {}
+        self.file_states = {}
+        self.globs = {}
+        self.full_paths = {}
+        self._executor = None
+
+    def resolve(self, document, base_dir, style, table, root_path=None):
+        """Append the slides of document and its includes to table"""
+        try:
+            self._discover(document, base_dir)
+        finally:
+            if self._executor is not None:
+                self._executor.shutdown()
+                self._executor = None
+
+        chain = (os.path.abspath(root_path),) if root_path else ()
+        self._assemble(document, base_dir, style, chain, table)
+
+    def get_dependencies(self):
+        """Return the included files and glob expansions the result depends on"""
+        return {
+            "files": {path: state for path, state in self.file_states.items()},
+            "globs": [[base_dir, pattern, matches]
+                      for (base_dir, pattern), matches in self.globs.items()],
+        }
+
+    def _discover(self, document, base_dir):
+        """Load every included deck and expand every glob, in parallel per level"""
+        level = [(document, base_dir)]
+        while level:
+            patterns = []
+            includes = []
+            for level_document, level_dir in level:
+                for slide_data in level_document.get('slides') or []:
+                    if isinstance(slide_data, dict) and 'include' in slide_data:
+                        includes.append((level_dir, slide_data['include']))
+                        if has_glob(slide_data['include']):
+                            patterns.append((level_dir, slide_data['include']))
+                        continue
+                    relative_path = slide_data.get('path') if isinstance(slide_data, dict) else slide_data
+                    if isinstance(relative_path, str) and has_glob(relative_path):
+                        patterns.append((level_dir, relative_path))
+
+            patterns = [key for key in dict.fromkeys(patterns) if key not in self.globs]
+            for key, matches in zip(patterns, self._map(lambda key: expand_glob(*key), patterns)):
+                self.globs[key] = matches
+
+            paths = []
+            for include_dir, include in includes:
+                for path in self._include_paths(include_dir, include):
+                    if path not in self.documents and path not in paths:
+                        paths.append(path)
+
+            level = []
+            for path, (included, state) in zip(paths, self._map(self.load_document, paths)):
+                if not isinstance(included, dict) or not isinstance(included.get('slides'), list):
+                    raise ValueError(f"Invalid included deck: 'slides' section missing ({path})")
+                self.documents[path] = included
+                self.file_states[path] = state
+                level.append((included, os.path.dirname(path)))
+
+    def _assemble(self, document, base_dir, style, chain, table):
+        """Append the slides of one deck to table in order"""
+        for index, slide_data in enumerate(document['slides']):
+            slide_style = style
+
+            if isinstance(slide_data, dict):
+                # Extract style if present
+                slide_style = style.derive(slide_data.get('style'))
+
+                if 'include' in slide_data:
+                    for path in self._include_paths(base_dir, slide_data['include']):
+                        if path in chain:
+                            raise ValueError(f"Include cycle: {' -> '.join(chain + (path,))}")
+                        included = self.documents[path]
+
+                        # Included deck style, then the include entry's overrides
+                        included_style = style.derive(included.get('style'))
+                        included_style = included_style.derive(slide_data.get('style'))
+                        self._assemble(included, os.path.dirname(path), included_style,
+                                       chain + (path,), table)
+                    continue
+
+                # Handle path or content
+                if 'path' in slide_data:
+                    relative_path = slide_data['path']
+                elif 'content' in slide_data:
+                    # Use direct markdown content
+                    table.append_content(slide_data['content'], slide_style)
+                    continue
+                else:
+                    raise ValueError(f"Slide {index} must have either 'path' or 'content' defined")
+            else:
+                # Simple string path
+                relative_path = slide_data
+
+            if has_glob(relative_path):
+                for path in self.globs[(base_dir, relative_path)]:
+                    table.append_path(path, slide_style)
+                continue
+
+            # Resolve relative path; normalized so it matches the paths the watcher reports
+            key = (base_dir, relative_path)
+            full_path = self.full_paths.get(key)
+            if full_path is None:
+                full_path = os.path.abspath(os.path.join(base_dir, relative_path))
+                self.full_paths[key] = full_path
+            table.append_path(full_path, slide_style)
+
+    def _include_paths(self, base_dir, include):
+        """Return the absolute deck paths an include entry refers to"""
+        if has_glob(include):
+            return self.globs[(base_dir, include)]
+        return [os.path.abspath(os.path.join(base_dir, include))]
+
+    def _map(self, function, items):
+        """Run function over items, on the thread pool when there is more than one"""
+        if len(items) <= 1:
+            return [function(item) for item in items]
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.max_workers, thread_name_prefix="glider-resolve"
+            )
+        return list(self._executor.map(function, items))
@@ -0,0 +1,220 @@
+"""
+Cache of parsed slides.yaml decks
+"""
+
+import hashlib
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+
+from slides.config.composition import expand_glob
+from slides.utils.error_handler import ErrorHandler
+from slides.utils.file_utils import write_file_atomic
+
+
+def safe_loader():
+    """Return the YAML safe loader, importing PyYAML on first use"""
+    import yaml
+    # libyaml's loader is many times faster than the pure-Python one
+    return getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
+
+class DeckCache:
+    """Parsed deck settings and slide tables keyed by the yaml file's state
+
+    Entries are valid while the file's mtime and size are unchanged, or while
+    its content hash matches after a touch, and while every included deck and
+    glob expansion is unchanged. The disk tier lets a relaunch skip YAML
+    parsing for decks that have not changed.
+    """
+
+    DEFAULT_MAX_ENTRIES = 8
+    DOCUMENT_MAX_ENTRIES = 64
+    FORMAT_VERSION = 3
+
+    # Files modified this recently may change again within the mtime granularity
+    RACY_WINDOW_NS = 2 * 1000 * 1000 * 1000
+
+    def __init__(self, max_entries=None, cache_dir=None):
+        """Initialize deck cache, persisting to cache_dir when given"""
+        self.max_entries = max_entries or self.DEFAULT_MAX_ENTRIES
+        self.cache_dir = cache_dir
+        if self.cache_dir:
+            os.makedirs(self.cache_dir, exist_ok=True)
+        self.entries = OrderedDict()
+        self.documents = OrderedDict()
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+    def load(self, yaml_path, build):
+        """Return (settings, slide table, dependencies) for a deck file
+
+        build(text) parses the file's text into (settings, slide table,
+        dependencies) and is only called when no cached entry matches the file.
+        """
+        yaml_path = os.path.abspath(yaml_path)
+        stat = os.stat(yaml_path)
+        state = (stat.st_mtime_ns, stat.st_size)
+
+        with self._lock:
+            entry = self.entries.get(yaml_path)
+        if entry is not None and entry["state"] == state and self._dependencies_valid(entry):
+            with self._lock:
+                self.entries.move_to_end(yaml_path)
+                self.hits += 1
+            return entry["settings"], entry["table"], entry["dependencies"]
+
+        with open(yaml_path, "rb") as file:
+            data = file.read()
+        digest = hashlib.sha256(data).hexdigest()
+
+        # A touched but unchanged file still matches by content hash
+        if entry is None or entry["digest"] != digest or not self._dependencies_valid(entry):
+            entry = self._read_disk(yaml_path, digest)
+            hit_counter = "disk_hits"
+        else:
+            hit_counter = "hits"
+
+        if entry is None:
+            hit_counter = "misses"
+            settings, table, dependencies = build(data.decode("utf-8"))
+            entry = {
+                "digest": digest, "settings": settings, "table": table, "dependencies": dependencies
+            }
+            self._write_disk(yaml_path, entry)
+
+        # Recently modified files are always verified by content hash
+        if time.time_ns() - stat.st_mtime_ns < self.RACY_WINDOW_NS:
+            state = None
+        entry["state"] = state
+        with self._lock:
+            setattr(self, hit_counter, getattr(self, hit_counter) + 1)
+            self.entries[yaml_path] = entry
+            self.entries.move_to_end(yaml_path)
+            while len(self.entries) > self.max_entries:
+                self.entries.popitem(last=False)
+        return entry["settings"], entry["table"], entry["dependencies"]
+
+    def load_document(self, path):
+        """Return (parsed YAML, file state) for an included deck file
+
+        The state is None when the file was modified too recently to be trusted.
+        Unchanged files are returned from memory without parsing them again.
+        """
+        stat = os.stat(path)
+        state = (stat.st_mtime_ns, stat.st_size)
+        with self._lock:
+            entry = self.documents.get(path)
+        if entry is None or entry["state"] != state:
+            with open(path, "rb") as file:
+                data = file.read()
+            digest = hashlib.sha256(data).hexdigest()
+            if entry is None or entry["digest"] != digest:
+                import yaml
+                entry = {"digest": digest, "document": yaml.load(data, Loader=safe_loader())}
+
+        if time.time_ns() - stat.st_mtime_ns < self.RACY_WINDOW_NS:
+            state = None
+        entry["state"] = state
+        with self._lock:
+            self.documents[path] = entry
+            self.documents.move_to_end(path)
+            while len(self.documents) > self.DOCUMENT_MAX_ENTRIES:
+                self.documents.popitem(last=False)
+        return entry["document"], state
+
+    def get_stats(self):
+        """Return cache statistics"""
+        with self._lock:
+            return {
+                "entries": len(self.entries),
+                "hits": self.hits,
+                "disk_hits": self.disk_hits,
+                "misses": self.misses
+            }
+
+    def clear(self):
+        """Drop every cached deck, in memory and on disk"""
+        with self._lock:
+            self.entries.clear()
+            self.documents.clear()
+        if self.cache_dir:
+            for name in os.listdir(self.cache_dir):
+                if name.endswith(".json"):
+                    try:
+                        os.remove(os.path.join(self.cache_dir, name))
+                    except OSError as e:
+                        ErrorHandler.handle_file_error(e, name)
+
+    def _dependencies_valid(self, entry):
+        """Return whether every included deck and glob expansion is unchanged"""
+        dependencies = entry["dependencies"]
+        for path, state in dependencies.get("files", {}).items():
+            if state is None:
+                return False
+            try:
+                stat = os.stat(path)
+            except OSError:
+                return False
+            if (stat.st_mtime_ns, stat.st_size) != tuple(state):
+                return False
+        for base_dir, pattern, matches in dependencies.get("globs", []):
+            if expand_glob(base_dir, pattern) != list(matches):
+                return False
+        return True
+
+    def _disk_path(self, yaml_path):
+        """Return the disk entry path for a deck file"""
+        name = hashlib.sha256(yaml_path.encode("utf-8")).hexdigest()[:32]
+        return os.path.join(self.cache_dir, name + ".json")
+
+    def _read_disk(self, yaml_path, digest):
+        """Return a disk entry matching digest, or None"""
+        if not self.cache_dir:
+            return None
+        # Imported here to avoid a circular import with slide_config
+        from slides.config.slide_config import SlideTable
+        try:
+            with open(self._disk_path(yaml_path), "r", encoding="utf-8") as file:
+                stored = json.load(file)
+            if stored.get("version") != self.FORMAT_VERSION or stored.get("digest") != digest:
+                return None
+            entry = {
+                "digest": digest,
+                "settings": stored["settings"],
+                "table": SlideTable.from_dict(stored["table"]),
+                "dependencies": stored["dependencies"],
+            }
+            if not self._dependencies_valid(entry):
+                return None
+            return entry
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+
+    def _write_disk(self, yaml_path, entry):
+        """Persist an entry; decks with values JSON cannot hold are skipped"""
+        if not self.cache_dir:
+            return
+        try:
+            data = json.dumps({
+                "version": self.FORMAT_VERSION,
+                "path": yaml_path,
+                "digest": entry["digest"],
+                "settings": entry["settings"],
+                "table": entry["table"].to_dict(),
+                "dependencies": entry["dependencies"],
+            })
+        except (TypeError, ValueError):
+            return
+        try:
+            write_file_atomic(self._disk_path(yaml_path), data)
+        except OSError as e:
+            ErrorHandler.handle_file_error(e, yaml_path)
+
+
+# Shared in-memory cache used when no other cache is configured
+default_cache = DeckCache()
@@ -0,0 +1,91 @@
+"""
+Structural diff between two versions of a deck's slides
+"""
+
+from difflib import SequenceMatcher
+
+
+def slide_identity(slide):
+    """Return what makes two slides render the same: source key and style"""
+    return slide.source.key, slide.style
+
+
+class DeckDiff:
+    """Maps slides of an old deck onto a reloaded one
+
+    Slides are matched by source (file path, or content hash for inline
+    slides) and resolved style, so a slide keeps its match when others are
+    inserted or removed around it.
+    """
+
+    def __init__(self, old_slides, new_slides):
+        """Diff old_slides against new_slides"""
+        old_keys = [slide_identity(slide) for slide in old_slides]
+        new_keys = [slide_identity(slide) for slide in new_slides]
+        self.old_keys = old_keys
+        self.new_keys = new_keys
+
+        # Old index -> new index of the same slide, or of the slide now in its place
+        self.positions = [0] * len(old_keys)
+        self.matched = set()
+
+        # Edits are usually local, so only the differing middle is matched
+        prefix = 0
+        limit = min(len(old_keys), len(new_keys))
+        while prefix < limit and old_keys[prefix] == new_keys[prefix]:
+            prefix += 1
+        suffix = 0
+        while (suffix < limit - prefix
+               and old_keys[-1 - suffix] == new_keys[-1 - suffix]):
+            suffix += 1
+
+        for index in range(prefix):
+            self._match(index, index)
+        for offset in range(1, suffix + 1):
+            self._match(len(old_keys) - offset, len(new_keys) - offset)
+
+        matcher = SequenceMatcher(
+            None,
+            old_keys[prefix:len(old_keys) - suffix],
+            new_keys[prefix:len(new_keys) - suffix],
+            autojunk=False
+        )
+        last = max(0, len(new_keys) - 1)
+        for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+            for offset in range(i2 - i1):
+                old_index = prefix + i1 + offset
+                if tag == 'equal':
+                    self._match(old_index, prefix + j1 + offset)
+                elif offset < j2 - j1:
+                    # Edited in place: stay on the slide at the same position
+                    self.positions[old_index] = prefix + j1 + offset
+                else:
+                    # Deleted: move to the slide that now follows
+                    self.positions[old_index] = min(prefix + j2, last)
+
+    def _match(self, old_index, new_index):
+        """Record that a slide is unchanged"""
+        self.positions[old_index] = new_index
+        self.matched.add(old_index)
+
+    def is_unchanged(self, old_index):
+        """Return whether a slide is in the new deck with the same source and style"""
+        return old_index in self.matched
+
+    def new_index(self, old_index):
+        """Return where a presenter on old_index should be in the new deck"""
+        if not self.positions:
+            return 0
+        return self.positions[min(max(old_index, 0), len(self.positions) - 1)]
+
+    def is_identity(self):
+        """Return whether every slide is unchanged and in the same place"""
+        return self.old_keys == self.new_keys
+
+    def removed_keys(self):
+        """Return source keys of old slides that no new slide uses"""
+        new_sources = {source_key for source_key, _ in self.new_keys}
+        return {
+            self.old_keys[index][0] for index in range(len(self.old_keys))
+            if index not in self.matched and self.old_keys[index][0] not in new_sources
+        }
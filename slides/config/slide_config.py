@@ -3,49 +3,130 @@ Slide configuration handling
 """
 
 import os
-import yaml
-import tempfile
+from array import array
+from collections.abc import Sequence
+
+from slides.config.composition import DeckResolver, glob_prefix
+from slides.config.deck_cache import default_cache as default_deck_cache, safe_loader
+from slides.config.slide_source import FileSource, InlineSource
+from slides.config.style import Style
 from slides.utils.error_handler import ErrorHandler
-from slides.utils.file_utils import file_exists, read_file
+from slides.utils.file_utils import file_exists
 
 
 class Slide:
-    """Represents a single slide"""
+    """Represents a single slide; a lightweight view of a row in a SlideTable"""
+    
+    __slots__ = ('table', 'index')
     
-    def __init__(self, index, style=None):
-        """Initialize a slide object"""
+    def __init__(self, table, index):
+        """Initialize a view of slide index in table"""
+        self.table = table
         self.index = index
-        self.style = style or {}
-        self.path = None
-        self.content = None
-        self.html = None
-        self.is_temp_file = False
-    
-    def set_path(self, path):
-        """Set the path to the markdown file"""
-        self.path = path
-        self.is_temp_file = False
-    
-    def set_content(self, content):
-        """Set direct markdown content"""
-        self.content = content
-        # Create a temporary file for the content
-        fd, temp_path = tempfile.mkstemp(suffix='.md', prefix=f'slide_{self.index}_')
-        os.close(fd)
-        
-        with open(temp_path, 'w', encoding='utf-8') as f:
-            f.write(content)
-        
-        self.path = temp_path
-        self.is_temp_file = True
-    
-    def cleanup(self):
-        """Clean up temporary files if needed"""
-        if self.is_temp_file and self.path and os.path.exists(self.path):
-            try:
-                os.remove(self.path)
-            except Exception as e:
-                ErrorHandler.handle_file_error(e, self.path)
+    
+    @property
+    def source(self):
+        """FileSource or InlineSource the slide's markdown comes from"""
+        return self.table.sources[self.table.source_ids[self.index]]
+    
+    @property
+    def path(self):
+        """Path to the markdown file, or None for inline slides"""
+        return self.source.path
+    
+    @property
+    def content(self):
+        """Inline markdown content, or None for file-backed slides"""
+        return self.source.content
+    
+    @property
+    def style(self):
+        """Shared resolved style of the slide"""
+        return self.table.styles[self.table.style_ids[self.index]]
+
+
+class SlideTable(Sequence):
+    """Compact, array-backed storage for the slides of a deck
+    
+    Sources and styles are stored once and referenced by index, and Slide
+    objects are only created when a slide is accessed.
+    """
+    
+    def __init__(self):
+        """Initialize an empty table"""
+        self.source_ids = array('I')
+        self.style_ids = array('I')
+        self.sources = []
+        self.path_lookup = {}
+        self.styles = []
+        self.style_lookup = {}
+    
+    def append_path(self, path, style):
+        """Add a file-backed slide"""
+        source_id = self.path_lookup.get(path)
+        if source_id is None:
+            source_id = self.path_lookup[path] = len(self.sources)
+            self.sources.append(FileSource(path))
+        self.source_ids.append(source_id)
+        self.style_ids.append(self._style_id(style))
+    
+    def append_content(self, content, style):
+        """Add a slide with inline markdown content, kept in memory"""
+        self.source_ids.append(len(self.sources))
+        self.sources.append(InlineSource(content))
+        self.style_ids.append(self._style_id(style))
+    
+    def to_dict(self):
+        """Return a JSON-serializable form of the table"""
+        return {
+            "sources": [
+                {"content": source.content} if source.is_inline else source.path
+                for source in self.sources
+            ],
+            "source_ids": self.source_ids.tolist(),
+            "styles": [style.to_dict() for style in self.styles],
+            "style_ids": self.style_ids.tolist(),
+        }
+    
+    @classmethod
+    def from_dict(cls, data):
+        """Rebuild a table from to_dict() output"""
+        table = cls()
+        for source in data["sources"]:
+            if isinstance(source, dict):
+                table.sources.append(InlineSource(source["content"]))
+            else:
+                table.path_lookup[source] = len(table.sources)
+                table.sources.append(FileSource(source))
+        for style in data["styles"]:
+            table._style_id(Style.intern(style))
+        table.source_ids = array('I', data["source_ids"])
+        table.style_ids = array('I', data["style_ids"])
+        return table
+    
+    def file_paths(self):
+        """Return the distinct markdown files referenced by the deck"""
+        return list(self.path_lookup)
+    
+    def _style_id(self, style):
+        """Return the table index of a shared style"""
+        style_id = self.style_lookup.get(style)
+        if style_id is None:
+            style_id = self.style_lookup[style] = len(self.styles)
+            self.styles.append(style)
+        return style_id
+    
+    def __len__(self):
+        return len(self.source_ids)
+    
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [Slide(self, i) for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("slide index out of range")
+        return Slide(self, index)
 
 
 class SlideConfig:
@@ -59,11 +140,17 @@ class SlideConfig:
         "justify": "left"
     }
     
-    def __init__(self):
-        """Initialize slide configuration"""
+    # Root of every resolved style chain
+    DEFAULTS = Style.intern(DEFAULT_STYLE)
+    
+    def __init__(self, deck_cache=None):
+        """Initialize slide configuration with an optional parsed-deck cache"""
         self.config = {}
-        self.slides = []
+        self.slides = SlideTable()
         self.base_dir = ""
+        self.yaml_path = None
+        self.dependencies = {}
+        self.deck_cache = deck_cache or default_deck_cache
     
     def load_config(self, yaml_path):
         """Load slide configuration from YAML file"""
@@ -72,69 +159,48 @@ class SlideConfig:
                 raise FileNotFoundError(f"Slide configuration file not found: {yaml_path}")
             
             # Store the base directory for resolving relative paths
-            self.base_dir = os.path.dirname(os.path.abspath(yaml_path))
-            
-            # Read and parse YAML file
-            yaml_content = read_file(yaml_path)
-            self.config = yaml.safe_load(yaml_content)
+            self.yaml_path = os.path.abspath(yaml_path)
+            self.base_dir = os.path.dirname(self.yaml_path)
             
-            # Clean up any existing slides
-            self._cleanup_slides()
-            self.slides = []
+            self.slides = SlideTable()
             
-            # Process slides
-            self._process_slides()
+            # Unchanged decks are served from the cache without parsing YAML
+            self.config, self.slides, self.dependencies = self.deck_cache.load(
+                yaml_path, self._parse_deck
+            )
             
         except Exception as e:
+            # A deck that fails part way through, e.g. on an include cycle, has no slides
+            self.slides = SlideTable()
             ErrorHandler.handle_config_error(e, yaml_path)
     
-    def _cleanup_slides(self):
-        """Clean up temporary files from slides"""
-        for slide in self.slides:
-            slide.cleanup()
+    def _parse_deck(self, yaml_content):
+        """Parse and validate slides.yaml text into (settings, slide table, dependencies)"""
+        # Imported here so decks served from the cache never load PyYAML
+        import yaml
+        self.config = yaml.load(yaml_content, Loader=safe_loader())
+        self.slides = SlideTable()
+        
+        # Process slides
+        self._process_slides()
+        
+        # The raw slide list is fully captured by the table
+        settings = {key: value for key, value in self.config.items() if key != 'slides'}
+        return settings, self.slides, self.dependencies
     
     def _process_slides(self):
-        """Process slides from configuration"""
+        """Process slides from configuration, expanding includes and globs"""
         if not self.config or 'slides' not in self.config:
             raise ValueError("Invalid slide configuration: 'slides' section missing")
         
-        # Get global style
-        global_style = self.DEFAULT_STYLE.copy()
-        if 'style' in self.config:
-            global_style.update(self.config['style'])
-        
-        # Process each slide
-        for index, slide_data in enumerate(self.config['slides']):
-            style = global_style.copy()
-            
-            if isinstance(slide_data, dict):
-                # Extract style if present
-                if 'style' in slide_data:
-                    style.update(slide_data['style'])
-                
-                # Create slide object
-                slide = Slide(index, style)
-                
-                # Handle path or content
-                if 'path' in slide_data:
-                    # Resolve relative path
-                    full_path = os.path.join(self.base_dir, slide_data['path'])
-                    slide.set_path(full_path)
-                elif 'content' in slide_data:
-                    # Use direct markdown content
-                    slide.set_content(slide_data['content'])
-                else:
-                    raise ValueError(f"Slide {index} must have either 'path' or 'content' defined")
-            else:
-                # Simple string path
-                slide = Slide(index, style)
-                full_path = os.path.join(self.base_dir, slide_data)
-                slide.set_path(full_path)
-            
-            self.slides.append(slide)
+        resolver = DeckResolver(self.deck_cache.load_document)
+        resolver.resolve(
+            self.config, self.base_dir, self.get_global_style(), self.slides, self.yaml_path
+        )
+        self.dependencies = resolver.get_dependencies()
     
     def get_slides(self):
-        """Return list of slide objects"""
+        """Return the sequence of slides"""
         return self.slides
     
     def get_slide_count(self):
@@ -144,20 +210,23 @@ class SlideConfig:
     def get_slide(self, index):
         """Return slide at specified index"""
         if 0 <= index < len(self.slides):
-            return self.slides[index]
+            return Slide(self.slides, index)
         return None
     
+    def get_dependency_paths(self):
+        """Return included decks and glob directories whose changes affect the deck"""
+        paths = list(self.dependencies.get('files', {}))
+        for base_dir, pattern, matches in self.dependencies.get('globs', []):
+            # New files can appear next to existing matches or under the pattern's fixed prefix
+            paths.append(os.path.dirname(os.path.join(base_dir, glob_prefix(pattern))))
+            paths.extend(os.path.dirname(path) for path in matches)
+        return list(dict.fromkeys(paths))
+    
     def get_title(self):
         """Return presentation title"""
         return self.config.get('title', 'Markdown Presentation')
     
     def get_global_style(self):
-        """Return global styling configuration"""
-        style = self.DEFAULT_STYLE.copy()
-        if 'style' in self.config:
-            style.update(self.config['style'])
-        return style
-    
-    def __del__(self):
-        """Destructor to clean up temporary files"""
-        self._cleanup_slides()
+        """Return global styling configuration, the deck's style over the defaults"""
+        return self.DEFAULTS.derive(self.config.get('style'))
+
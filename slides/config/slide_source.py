@@ -0,0 +1,74 @@
+"""
+Where a slide's markdown comes from
+"""
+
+import hashlib
+import os
+
+from slides.utils.file_utils import read_file
+
+
+class FileSource:
+    """Markdown read from a file on disk"""
+
+    __slots__ = ('path',)
+
+    is_inline = False
+    content = None
+
+    def __init__(self, path):
+        """Initialize source for a markdown file"""
+        self.path = path
+
+    @property
+    def key(self):
+        """Identity of the source in caches"""
+        return self.path
+
+    def read(self):
+        """Return the markdown text"""
+        return read_file(self.path)
+
+    def state(self):
+        """Return (mtime_ns, size) of the file, or None if it cannot be read"""
+        try:
+            stat = os.stat(self.path)
+        except OSError:
+            return None
+        return (stat.st_mtime_ns, stat.st_size)
+
+    def __repr__(self):
+        return f"FileSource({self.path!r})"
+
+
+class InlineSource:
+    """Markdown given inline in slides.yaml and kept in memory"""
+
+    __slots__ = ('content', '_key')
+
+    is_inline = True
+    path = None
+
+    def __init__(self, content):
+        """Initialize source for inline markdown content"""
+        self.content = content
+        self._key = None
+
+    @property
+    def key(self):
+        """Identity of the source in caches, derived from the content"""
+        if self._key is None:
+            digest = hashlib.sha256(self.content.encode('utf-8')).hexdigest()
+            self._key = f"inline:{digest[:32]}"
+        return self._key
+
+    def read(self):
+        """Return the markdown text"""
+        return self.content
+
+    def state(self):
+        """Inline content never changes behind the key, so it has no state"""
+        return None
+
+    def __repr__(self):
+        return f"InlineSource({self.content[:20]!r}...)"
@@ -0,0 +1,102 @@
+"""
+Immutable, interned slide styles
+"""
+
+import threading
+from collections.abc import Mapping
+
+
+class Style(Mapping):
+    """Read-only style mapping shared by every slide with the same values
+
+    Resolved styles form a chain, defaults -> deck -> include -> slide, built
+    with derive(); each link is memoized on its parent so resolving the same
+    overrides again is a dict lookup rather than a copy and an intern.
+    """
+
+    __slots__ = ('_items', '_values', '_hash', '_derived')
+
+    _interned = {}
+    _lock = threading.Lock()
+
+    def __init__(self, items):
+        """Initialize style from a sorted tuple of (key, value) pairs; use intern()"""
+        self._items = items
+        self._values = dict(items)
+        self._hash = hash(items)
+        self._derived = {}
+
+    @classmethod
+    def intern(cls, values):
+        """Return the shared Style instance for a mapping of style values"""
+        if isinstance(values, Style):
+            return values
+
+        items = tuple(sorted(values.items()))
+        with cls._lock:
+            style = cls._interned.get(items)
+            if style is None:
+                style = cls(items)
+                cls._interned[items] = style
+        return style
+
+    def derive(self, overrides):
+        """Return the shared style for overrides applied on top of this one
+
+        Raises ValueError for overrides that are not a mapping of single values,
+        such as a list or nested mapping from slides.yaml.
+        """
+        if not overrides:
+            return self
+        if not isinstance(overrides, Mapping):
+            raise ValueError(f"Invalid style: expected a mapping, got {overrides!r}")
+        for name, value in overrides.items():
+            try:
+                hash(value)
+            except TypeError:
+                raise ValueError(
+                    f"Invalid style value for {name!r}: {value!r} is not a single value"
+                ) from None
+
+        key = tuple(sorted(overrides.items()))
+        derived = self._derived.get(key)
+        if derived is None:
+            values = dict(self._values)
+            values.update(overrides)
+            derived = Style.intern(values)
+            with Style._lock:
+                self._derived[key] = derived
+        return derived
+
+    def __getitem__(self, key):
+        return self._values[key]
+
+    def __iter__(self):
+        return iter(self._values)
+
+    def __len__(self):
+        return len(self._values)
+
+    def __hash__(self):
+        return self._hash
+
+    def __eq__(self, other):
+        if self is other:
+            return True
+        if isinstance(other, Style):
+            return self._hash == other._hash and self._items == other._items
+        return Mapping.__eq__(self, other)
+
+    def __ne__(self, other):
+        return not self == other
+
+    def __reduce__(self):
+        # Unpickled styles are interned in the receiving process too
+        return (Style.intern, (self._values,))
+
+    def __repr__(self):
+        return f"Style({self._values!r})"
+
+    def to_dict(self):
+        """Return a mutable copy of the style values"""
+        return dict(self._values)
@@ -0,0 +1,102 @@
+"""
+Queued hand-off of hotkey actions from the listener thread to the GUI thread
+"""
+
+import time
+from collections import deque
+
+from PyQt6.QtCore import QObject, Qt, pyqtSignal
+
+from slides.utils.error_handler import ErrorHandler
+from slides.utils.instrumentation import tracer
+
+
+class HotkeyDispatcher(QObject):
+    """Posts hotkey actions to the GUI thread and runs them there"""
+
+    # Internal wake-up, delivered on the dispatcher's (GUI) thread
+    _wake = pyqtSignal()
+
+    HISTORY_SIZE = 512
+
+    def __init__(self, parent=None):
+        """Initialize dispatcher; must be created on the GUI thread"""
+        super().__init__(parent)
+        self.handlers = {}
+
+        # deque.append and popleft are atomic, so the hook never takes a lock
+        self.queue = deque()
+        self._wake_pending = False
+
+        # Completed events as dicts of perf_counter timestamps
+        self.history = deque(maxlen=self.HISTORY_SIZE)
+        self.unpainted = []
+
+        self._wake.connect(self._drain, Qt.ConnectionType.QueuedConnection)
+
+    def bind(self, name, handler, counted=False):
+        """Register a GUI-thread handler and return a callable for the listener thread
+
+        Consecutive identical presses are coalesced into one call. A counted
+        handler receives the number of coalesced presses as its last argument.
+        """
+        self.handlers[name] = (handler, counted)
+        return lambda *args: self.post(name, *args)
+
+    def post(self, name, *args):
+        """Queue an action; safe to call from any thread and returns immediately"""
+        self.queue.append((name, args, time.perf_counter()))
+        if not self._wake_pending:
+            self._wake_pending = True
+            self._wake.emit()
+
+    def mark_painted(self):
+        """Record that the results of dispatched events are on screen"""
+        if not self.unpainted:
+            return
+        painted = time.perf_counter()
+        for event in self.unpainted:
+            event["painted"] = painted
+        self.unpainted = []
+
+    def get_latencies(self):
+        """Return (name, hook-to-dispatch ms, hook-to-paint ms or None) per event"""
+        latencies = []
+        for event in list(self.history):
+            painted = event.get("painted")
+            latencies.append((
+                event["name"],
+                (event["dispatched"] - event["posted"]) * 1000,
+                (painted - event["posted"]) * 1000 if painted is not None else None,
+            ))
+        return latencies
+
+    def _drain(self):
+        """Run queued actions on the GUI thread"""
+        # Cleared before reading so a concurrent post always wakes us again
+        self._wake_pending = False
+        events = []
+        while self.queue:
+            name, args, posted = self.queue.popleft()
+            if events and events[-1]["name"] == name and events[-1]["args"] == args:
+                events[-1]["count"] += 1
+                continue
+            events.append({"name": name, "args": args, "count": 1, "posted": posted})
+
+        for event in events:
+            handler, counted = self.handlers.get(event["name"], (None, False))
+            if handler is None:
+                continue
+            event["dispatched"] = time.perf_counter()
+            tracer.begin_navigation("hotkey", start=event["posted"])
+            tracer.record("hotkey_queue", event["posted"], event["dispatched"])
+            try:
+                if counted:
+                    handler(*event["args"], event["count"])
+                else:
+                    handler(*event["args"])
+            except Exception as e:
+                ErrorHandler.handle_hotkey_error(e)
+                continue
+            self.history.append(event)
+            self.unpainted.append(event)
@@ -17,3 +17,15 @@ class HotkeyHandlers:
     def previous_slide(self):
         """Handle previous slide hotkey"""
         self.presentation_window.previous_slide()
+    
+    def first_slide(self):
+        """Handle first slide hotkey"""
+        self.presentation_window.first_slide()
+    
+    def last_slide(self):
+        """Handle last slide hotkey"""
+        self.presentation_window.last_slide()
+    
+    def go_to_slide(self, slide_index):
+        """Handle jump-to-slide hotkey"""
+        self.presentation_window.go_to_slide(slide_index)
@@ -23,14 +23,75 @@ class HotkeyManager:
         'esc': keyboard.Key.esc
     }
     
+    # Left/right and generic modifier keys normalized to one name
+    MODIFIER_NAMES = {
+        getattr(keyboard.Key, key_name): modifier
+        for modifier, key_names in (
+            ('cmd', ('cmd', 'cmd_l', 'cmd_r')),
+            ('alt', ('alt', 'alt_l', 'alt_r', 'alt_gr')),
+            ('shift', ('shift', 'shift_l', 'shift_r')),
+            ('ctrl', ('ctrl', 'ctrl_l', 'ctrl_r')),
+        )
+        for key_name in key_names
+        if hasattr(keyboard.Key, key_name)
+    }
+    
+    # Config names dispatched to fixed handlers, in priority order
+    HANDLER_NAMES = (
+        ('next_slide', 'next_handler'),
+        ('previous_slide', 'previous_handler'),
+        ('first_slide', 'first_handler'),
+        ('last_slide', 'last_handler'),
+    )
+    
     def __init__(self, config):
         """Initialize hotkey manager with configuration"""
         self.config = config
-        self.hotkey_config = config.get_hotkey_config()
         self.next_handler = None
         self.previous_handler = None
+        self.first_handler = None
+        self.last_handler = None
+        self.goto_handler = None
         self.listener = None
         self.active_keys = set()
+        self.pressed_modifiers = {}
+        self.modifier_state = frozenset()
+        self.reload_config()
+    
+    def reload_config(self):
+        """Re-read hotkey configuration and recompile the binding table"""
+        self.hotkey_config = self.config.get_hotkey_config()
+        self.combinations = {}
+        self.bindings = {}
+        
+        actions = [(name, handler_attr, ()) for name, handler_attr in self.HANDLER_NAMES]
+        for hotkey_name in self.hotkey_config:
+            slide_number = self._goto_slide_number(hotkey_name)
+            if slide_number is not None:
+                actions.append((hotkey_name, 'goto_handler', (slide_number - 1,)))
+        
+        for hotkey_name, handler_attr, args in actions:
+            key_names = self.hotkey_config.get(hotkey_name)
+            if not key_names:
+                continue
+            pynput_keys = [self._to_pynput_key(key_name) for key_name in key_names]
+            if pynput_keys[-1] in self.MODIFIER_NAMES:
+                ErrorHandler.handle_hotkey_error(ValueError(
+                    f"{hotkey_name} must end with a non-modifier key: {key_names}"
+                ))
+                continue
+            self.combinations[hotkey_name] = set(pynput_keys)
+            
+            # The last key of a combination triggers it, the rest are held modifiers
+            modifiers = frozenset(self._normalize_key(key) for key in pynput_keys[:-1])
+            trigger = self._normalize_key(pynput_keys[-1])
+            candidates = self.bindings.setdefault(trigger, [])
+            if all(required != modifiers for required, _, _ in candidates):
+                candidates.append((modifiers, handler_attr, args))
+        
+        # Bindings needing the most modifiers are tried first, so the most specific one wins
+        for candidates in self.bindings.values():
+            candidates.sort(key=lambda candidate: len(candidate[0]), reverse=True)
     
     def register_hotkeys(self):
         """Register global hotkeys"""
@@ -74,46 +135,84 @@ class HotkeyManager:
         """Set handler for previous slide hotkey"""
         self.previous_handler = handler
     
+    def set_first_handler(self, handler):
+        """Set handler for first slide hotkey"""
+        self.first_handler = handler
+    
+    def set_last_handler(self, handler):
+        """Set handler for last slide hotkey"""
+        self.last_handler = handler
+    
+    def set_goto_handler(self, handler):
+        """Set handler for goto_slide_<N> hotkeys; called with a zero-based index"""
+        self.goto_handler = handler
+    
     def _on_key_press(self, key):
         """Handle key press events"""
         # Add key to active keys set
         self.active_keys.add(key)
         
-        # Check if next slide hotkey combination is pressed
-        if self._check_hotkey_combination('next_slide') and self.next_handler:
-            self.next_handler()
+        trigger = self._normalize_key(key)
+        if key in self.MODIFIER_NAMES:
+            # Modifiers never trigger a binding themselves
+            self.pressed_modifiers[key] = trigger
+            self.modifier_state = frozenset(self.pressed_modifiers.values())
             return True
         
-        # Check if previous slide hotkey combination is pressed
-        if self._check_hotkey_combination('previous_slide') and self.previous_handler:
-            self.previous_handler()
-            return True
+        # A binding fires when at least its modifiers are held
+        for modifiers, handler_attr, args in self.bindings.get(trigger, ()):
+            if modifiers <= self.modifier_state:
+                handler = getattr(self, handler_attr)
+                if handler:
+                    handler(*args)
+                break
         
         return True
     
     def _on_key_release(self, key):
         """Handle key release events"""
         # Remove key from active keys set
-        if key in self.active_keys:
-            self.active_keys.remove(key)
+        self.active_keys.discard(key)
+        
+        if key in self.pressed_modifiers:
+            del self.pressed_modifiers[key]
+            self.modifier_state = frozenset(self.pressed_modifiers.values())
         
         return True
     
+    @staticmethod
+    def _goto_slide_number(hotkey_name):
+        """Return N for a goto_slide_<N> hotkey name, or None"""
+        prefix = 'goto_slide_'
+        if hotkey_name.startswith(prefix) and hotkey_name[len(prefix):].isdigit():
+            return int(hotkey_name[len(prefix):])
+        return None
+    
+    @classmethod
+    def _to_pynput_key(cls, key_name):
+        """Convert a configured key name to a pynput key"""
+        if key_name in cls.KEY_MAPPING:
+            return cls.KEY_MAPPING[key_name]
+        if len(key_name) > 1 and hasattr(keyboard.Key, key_name):
+            return getattr(keyboard.Key, key_name)
+        # For single character keys
+        return keyboard.KeyCode.from_char(key_name)
+    
+    @classmethod
+    def _normalize_key(cls, key):
+        """Return a hashable form of a key that ignores left/right and case"""
+        if key in cls.MODIFIER_NAMES:
+            return cls.MODIFIER_NAMES[key]
+        char = getattr(key, 'char', None)
+        if char is not None:
+            return char.lower()
+        return key
+    
     def _check_hotkey_combination(self, hotkey_name):
         """Check if a specific hotkey combination is currently pressed"""
-        if hotkey_name not in self.hotkey_config:
+        required_pynput_keys = self.combinations.get(hotkey_name)
+        if required_pynput_keys is None:
             return False
         
-        required_keys = self.hotkey_config[hotkey_name]
-        
-        # Convert string keys to pynput keys
-        required_pynput_keys = set()
-        for key_name in required_keys:
-            if key_name in self.KEY_MAPPING:
-                required_pynput_keys.add(self.KEY_MAPPING[key_name])
-            else:
-                # For single character keys
-                required_pynput_keys.add(keyboard.KeyCode.from_char(key_name))
-        
         # Check if all required keys are in the active keys set
         return required_pynput_keys.issubset(self.active_keys)
@@ -0,0 +1,115 @@
+"""
+In-memory cache of rendered slide HTML
+"""
+
+import os
+import threading
+from collections import OrderedDict
+from collections.abc import Hashable
+
+
+class RenderCache:
+    """Bounded LRU cache of rendered slide documents"""
+
+    DEFAULT_MAX_ENTRIES = 64
+    DEFAULT_MAX_BYTES = 32 * 1024 * 1024
+
+    def __init__(self, max_entries=None, max_bytes=None):
+        """Initialize render cache with entry and byte budgets"""
+        self.max_entries = max_entries or self.DEFAULT_MAX_ENTRIES
+        self.max_bytes = max_bytes or self.DEFAULT_MAX_BYTES
+        self.entries = OrderedDict()
+        self.total_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(path, style, extensions=(), variant=None):
+        """Build a cache key from slide path, file state, style and extensions
+
+        path may also be a slide source, which supplies its own key and state.
+        variant distinguishes renders of the same slide for different outputs,
+        such as image sizes for different window sizes.
+        """
+        if isinstance(path, str):
+            try:
+                stat = os.stat(path)
+                file_state = (stat.st_mtime_ns, stat.st_size)
+            except OSError:
+                file_state = None
+        else:
+            file_state = path.state()
+            path = path.key
+
+        # Interned styles are hashable and can be used as keys directly
+        if isinstance(style, Hashable):
+            style_key = style
+        else:
+            style_key = tuple(sorted((style or {}).items()))
+        return (path, file_state, style_key, tuple(extensions), variant)
+
+    def get(self, key):
+        """Return cached HTML for key, or None on a miss"""
+        with self._lock:
+            entry = self.entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+
+            # Mark entry as most recently used
+            self.entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def contains(self, key):
+        """Return whether key is cached without counting a hit or miss"""
+        with self._lock:
+            return key in self.entries
+
+    def peek(self, key):
+        """Return cached HTML for key without counting a hit or miss"""
+        with self._lock:
+            entry = self.entries.get(key)
+            return entry[0] if entry is not None else None
+
+    def put(self, key, html):
+        """Store rendered HTML, evicting least recently used entries"""
+        size = len(html.encode("utf-8"))
+        if size > self.max_bytes:
+            return
+
+        with self._lock:
+            if key in self.entries:
+                self.total_bytes -= self.entries.pop(key)[1]
+
+            self.entries[key] = (html, size)
+            self.total_bytes += size
+
+            # Evict until both budgets are satisfied
+            while (len(self.entries) > self.max_entries
+                   or self.total_bytes > self.max_bytes):
+                _, evicted = self.entries.popitem(last=False)
+                self.total_bytes -= evicted[1]
+
+    def invalidate_path(self, path):
+        """Remove all cached entries for a slide path"""
+        with self._lock:
+            for key in [key for key in self.entries if key[0] == path]:
+                self.total_bytes -= self.entries.pop(key)[1]
+
+    def clear(self):
+        """Remove all cached entries"""
+        with self._lock:
+            self.entries.clear()
+            self.total_bytes = 0
+
+    def get_stats(self):
+        """Return cache statistics"""
+        with self._lock:
+            return {
+                "entries": len(self.entries),
+                "bytes": self.total_bytes,
+                "hits": self.hits,
+                "misses": self.misses
+            }
@@ -0,0 +1,135 @@
+"""
+Persistent on-disk cache of rendered markdown fragments
+"""
+
+import hashlib
+import os
+import shutil
+import threading
+
+from slides.utils.error_handler import ErrorHandler
+from slides.utils.file_utils import ensure_cache_directory, read_file, write_file_atomic
+
+
+def _library_versions():
+    """Return installed markdown and Pygments versions as a cache key prefix"""
+    import markdown
+    return f"markdown={markdown.__version__};pygments={_pygments_version()}"
+
+
+def _pygments_version():
+    """Return the installed Pygments version, if any"""
+    try:
+        import pygments
+        return pygments.__version__
+    except ImportError:
+        return "none"
+
+
+class DiskRenderCache:
+    """Content-addressed cache of HTML fragments under ~/.cache/glider"""
+
+    DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+    def __init__(self, cache_dir=None, max_bytes=None):
+        """Initialize disk cache in cache_dir with a size cap"""
+        self.cache_dir = cache_dir or ensure_cache_directory("render")
+        os.makedirs(self.cache_dir, exist_ok=True)
+        self.max_bytes = max_bytes or self.DEFAULT_MAX_BYTES
+        # Filled in on first use so creating the cache does not import markdown
+        self.version_key = None
+        self.total_bytes = None
+        self._lock = threading.Lock()
+
+    def make_key(self, markdown_text, extensions):
+        """Build a key from source text, library versions and extensions"""
+        if self.version_key is None:
+            self.version_key = _library_versions()
+        digest = hashlib.sha256()
+        digest.update(self.version_key.encode("utf-8"))
+        digest.update(("\0" + ",".join(extensions) + "\0").encode("utf-8"))
+        digest.update(markdown_text.encode("utf-8"))
+        return digest.hexdigest()
+
+    def get(self, key):
+        """Return the cached fragment for key, or None on a miss"""
+        entry_path = self._entry_path(key)
+        try:
+            html = read_file(entry_path)
+        except OSError:
+            return None
+
+        # Bump the modification time so pruning treats the entry as recently used
+        try:
+            os.utime(entry_path)
+        except OSError:
+            pass
+        return html
+
+    def put(self, key, html):
+        """Store a fragment atomically and prune the cache if over its cap"""
+        entry_path = self._entry_path(key)
+        with self._lock:
+            # An existing entry is replaced, so only the size difference is added
+            try:
+                old_size = os.path.getsize(entry_path)
+            except OSError:
+                old_size = 0
+            try:
+                write_file_atomic(entry_path, html)
+            except OSError as e:
+                ErrorHandler.handle_file_error(e, entry_path)
+                return
+
+            if self.total_bytes is None:
+                self.total_bytes = self._scan_size()
+            else:
+                self.total_bytes += os.path.getsize(entry_path) - old_size
+
+            if self.total_bytes > self.max_bytes:
+                self._prune()
+
+    def clear(self):
+        """Remove every cached fragment"""
+        with self._lock:
+            shutil.rmtree(self.cache_dir, ignore_errors=True)
+            os.makedirs(self.cache_dir, exist_ok=True)
+            self.total_bytes = 0
+
+    def _entry_path(self, key):
+        """Return the file path for a cache key"""
+        return os.path.join(self.cache_dir, key[:2], key + ".html")
+
+    def _entries(self):
+        """Return (mtime, size, path) for every cached fragment"""
+        entries = []
+        for root, _, files in os.walk(self.cache_dir):
+            for name in files:
+                if not name.endswith(".html"):
+                    continue
+                path = os.path.join(root, name)
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, path))
+        return entries
+
+    def _scan_size(self):
+        """Return the total size of cached fragments"""
+        return sum(size for _, size, _ in self._entries())
+
+    def _prune(self):
+        """Remove least recently used fragments until under 90% of the cap"""
+        target = self.max_bytes * 0.9
+        entries = sorted(self._entries())
+        self.total_bytes = sum(size for _, size, _ in entries)
+
+        for _, size, path in entries:
+            if self.total_bytes <= target:
+                break
+            try:
+                os.remove(path)
+                self.total_bytes -= size
+            except OSError:
+                pass
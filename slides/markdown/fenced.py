@@ -0,0 +1,78 @@
+"""
+Fenced code extension that highlights through a HighlightCache
+
+Loaded by markdown by module name, so markdown is only imported once the first
+slide is converted rather than when the application starts.
+"""
+
+from markdown.extensions.codehilite import CodeHiliteExtension
+from markdown.extensions.fenced_code import FencedBlockPreprocessor, FencedCodeExtension
+
+from slides.markdown.highlight import HIGHLIGHT_OPTIONS, default_cache
+
+
+class CachedFencedBlockPreprocessor(FencedBlockPreprocessor):
+    """Fenced block preprocessor that highlights through a HighlightCache"""
+
+    def __init__(self, md, config, cache):
+        """Initialize preprocessor with the highlight cache"""
+        super().__init__(md, config)
+        self.cache = cache
+
+    def run(self, lines):
+        """Highlight plain fenced blocks from the cache, then defer to the stock processor"""
+        options = self._highlight_options()
+        if options is None:
+            return super().run(lines)
+
+        text = "\n".join(lines)
+        index = 0
+        while True:
+            m = self.FENCED_BLOCK_RE.search(text, index)
+            if not m:
+                break
+
+            # Blocks with attributes or highlighted lines take the stock path
+            if m.group('attrs') or m.group('hl_lines'):
+                index = m.end()
+                continue
+
+            code = self.cache.highlight(m.group('code'), m.group('lang') or None, options)
+            placeholder = self.md.htmlStash.store(code)
+            text = f'{text[:m.start()]}\n{placeholder}\n{text[m.end():]}'
+            index = m.start() + 1 + len(placeholder)
+
+        return super().run(text.split("\n"))
+
+    def _highlight_options(self):
+        """Return codehilite options, or None when highlighting is disabled"""
+        for ext in self.md.registeredExtensions:
+            if isinstance(ext, CodeHiliteExtension):
+                config = ext.getConfigs()
+                if not config.get('use_pygments', True):
+                    return None
+                return {name: config[name] for name in HIGHLIGHT_OPTIONS if name in config}
+        return None
+
+
+class CachedFencedCodeExtension(FencedCodeExtension):
+    """Drop-in replacement for fenced_code that caches highlighted blocks"""
+
+    def __init__(self, **kwargs):
+        """Initialize extension with an optional highlight cache"""
+        self.cache = kwargs.pop('cache', None) or default_cache
+        super().__init__(**kwargs)
+
+    def extendMarkdown(self, md):
+        """Register the caching fenced block preprocessor"""
+        md.registerExtension(self)
+        md.preprocessors.register(
+            CachedFencedBlockPreprocessor(md, self.getConfigs(), self.cache),
+            'fenced_code_block',
+            25
+        )
+
+
+def makeExtension(**kwargs):
+    """Return the extension so it can be loaded by module name"""
+    return CachedFencedCodeExtension(**kwargs)
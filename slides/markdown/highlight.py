@@ -0,0 +1,119 @@
+"""
+Cached syntax highlighting for fenced code blocks
+"""
+
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+
+from slides.markdown.disk_cache import DiskRenderCache
+
+# Codehilite options that change the highlighted output
+HIGHLIGHT_OPTIONS = ('pygments_style', 'css_class', 'noclasses', 'linenums',
+                     'guess_lang', 'pygments_formatter', 'lang_prefix')
+
+
+class HighlightCache:
+    """LRU cache of highlighted code with an optional disk tier"""
+
+    DEFAULT_MAX_ENTRIES = 2048
+    DEFAULT_DISK_MAX_BYTES = 64 * 1024 * 1024
+
+    def __init__(self, max_entries=None, cache_dir=None, disk_max_bytes=None):
+        """Initialize highlight cache, persisting to cache_dir when given"""
+        self.max_entries = max_entries or self.DEFAULT_MAX_ENTRIES
+        self.cache_dir = cache_dir
+        # The disk tier is a size-capped fragment store, pruned like the render cache
+        self.disk_cache = None
+        if self.cache_dir:
+            self.disk_cache = DiskRenderCache(
+                cache_dir=cache_dir, max_bytes=disk_max_bytes or self.DEFAULT_DISK_MAX_BYTES
+            )
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.highlight_seconds = 0.0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(code, lang, options):
+        """Build a key from code text, language and highlighting options"""
+        digest = hashlib.sha256()
+        digest.update(repr((lang, sorted(options.items()))).encode("utf-8"))
+        digest.update(b"\0")
+        digest.update(code.encode("utf-8"))
+        return digest.hexdigest()
+
+    def highlight(self, code, lang, options):
+        """Return highlighted HTML for a code block, using the cache"""
+        key = self.make_key(code, lang, options)
+
+        with self._lock:
+            html = self.entries.get(key)
+            if html is not None:
+                self.entries.move_to_end(key)
+                self.hits += 1
+                return html
+
+        html = self._read_disk(key)
+        if html is not None:
+            with self._lock:
+                self.disk_hits += 1
+        else:
+            # Imported on first use to keep markdown and Pygments out of startup
+            from markdown.extensions.codehilite import CodeHilite
+
+            start = time.perf_counter()
+            local_options = dict(options)
+            highlighter = CodeHilite(
+                code,
+                lang=lang,
+                style=local_options.pop('pygments_style', 'default'),
+                **local_options
+            )
+            html = highlighter.hilite(shebang=False)
+            elapsed = time.perf_counter() - start
+
+            with self._lock:
+                self.misses += 1
+                self.highlight_seconds += elapsed
+            self._write_disk(key, html)
+
+        with self._lock:
+            self.entries[key] = html
+            while len(self.entries) > self.max_entries:
+                self.entries.popitem(last=False)
+        return html
+
+    def get_stats(self):
+        """Return cache statistics for profiling"""
+        with self._lock:
+            return {
+                "entries": len(self.entries),
+                "hits": self.hits,
+                "disk_hits": self.disk_hits,
+                "misses": self.misses,
+                "highlight_ms": round(self.highlight_seconds * 1000, 3)
+            }
+
+    def clear(self):
+        """Remove all in-memory entries"""
+        with self._lock:
+            self.entries.clear()
+
+    def _read_disk(self, key):
+        """Return highlighted HTML from the disk tier, if present"""
+        if not self.disk_cache:
+            return None
+        return self.disk_cache.get(key)
+
+    def _write_disk(self, key, html):
+        """Store highlighted HTML in the disk tier"""
+        if self.disk_cache:
+            self.disk_cache.put(key, html)
+
+
+# Shared by every parser unless one is configured explicitly
+default_cache = HighlightCache()
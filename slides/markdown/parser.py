@@ -2,36 +2,96 @@
 Markdown parsing functionality
 """
 
-import markdown
+import threading
+
+from slides.markdown import highlight
 from slides.utils.error_handler import ErrorHandler
 from slides.utils.file_utils import read_file
 
+# Exercises tables, fenced code and Pygments when warming up the engine
+WARM_UP_SAMPLE = """# Glider
+
+| a | b |
+|---|---|
+| 1 | 2 |
+
+```python
+print("glider")
+```
+"""
+
 
 class MarkdownParser:
     """Handles markdown parsing and conversion to HTML"""
-    
-    def __init__(self, config=None):
-        """Initialize markdown parser with configuration"""
+
+    # Markdown engines are not thread-safe, so each thread keeps its own pool
+    _local = threading.local()
+
+    def __init__(self, config=None, disk_cache=None, highlight_cache=None):
+        """Initialize markdown parser with configuration and optional caches"""
         self.config = config or {}
-        self.extensions = ['tables', 'fenced_code', 'codehilite']
-    
+        # Fenced code goes through the highlight cache instead of plain fenced_code
+        self.extensions = ['tables', 'slides.markdown.fenced', 'codehilite']
+        self.disk_cache = disk_cache
+        self.highlight_cache = highlight_cache or highlight.default_cache
+
     def parse_file(self, file_path):
         """Parse markdown file and return HTML"""
         try:
-            markdown_text = read_file(file_path)
-            return self.parse_text(markdown_text)
+            return self._parse_cached(read_file(file_path))
         except Exception as e:
             ErrorHandler.handle_markdown_error(e, file_path)
             return f"<p>Error loading slide: {str(e)}</p>"
-    
+
+    def parse_source(self, source):
+        """Parse a slide source (file-backed or inline) and return HTML"""
+        try:
+            return self._parse_cached(source.read())
+        except Exception as e:
+            ErrorHandler.handle_markdown_error(e, source.key)
+            return f"<p>Error loading slide: {str(e)}</p>"
+
     def parse_text(self, markdown_text):
         """Parse markdown text and return HTML"""
         try:
-            html = markdown.markdown(
-                markdown_text,
-                extensions=self.extensions
-            )
-            return html
+            return self._convert(markdown_text)
         except Exception as e:
             ErrorHandler.handle_markdown_error(e)
             return f"<p>Error parsing markdown: {str(e)}</p>"
+
+    def _parse_cached(self, markdown_text):
+        """Convert markdown text to HTML through the disk cache, raising on failure"""
+        if self.disk_cache is None:
+            return self._convert(markdown_text)
+
+        # Unchanged sources are served without running markdown at all
+        cache_key = self.disk_cache.make_key(markdown_text, self.extensions)
+        html = self.disk_cache.get(cache_key)
+        if html is None:
+            html = self._convert(markdown_text)
+            self.disk_cache.put(cache_key, html)
+        return html
+
+    def _convert(self, markdown_text):
+        """Convert markdown text to HTML, raising on failure"""
+        return self._get_engine().reset().convert(markdown_text)
+
+    def _get_engine(self):
+        """Return the calling thread's Markdown engine for this extension set"""
+        engines = getattr(self._local, 'engines', None)
+        if engines is None:
+            engines = self._local.engines = {}
+
+        engine_key = (tuple(self.extensions), id(self.highlight_cache))
+        engine = engines.get(engine_key)
+        if engine is None:
+            # Imported on first use to keep markdown out of startup
+            import markdown
+            engine = markdown.Markdown(
+                extensions=self.extensions,
+                extension_configs={
+                    'slides.markdown.fenced': {'cache': self.highlight_cache}
+                }
+            )
+            engines[engine_key] = engine
+        return engine
@@ -2,14 +2,26 @@
 HTML rendering utilities for markdown slides
 """
 
+import threading
+
+from slides.config.style import Style
+
 
 class HTMLRenderer:
     """Handles HTML rendering and styling for slides"""
-    
+
     def __init__(self, config=None):
         """Initialize HTML renderer with configuration"""
         self.config = config or {}
-    
+        self.code_theme = self.config.get('code_theme', 'default')
+
+        # Compiled CSS keyed by interned style and by Pygments theme
+        self._stylesheets = {}
+        self._code_stylesheets = {}
+        # Deck section class names, kept stable so sections can be added to loaded decks
+        self._style_classes = {}
+        self._lock = threading.Lock()
+
     def apply_styling(self, html_content, slide_style):
         """Apply styling to HTML content"""
         # We'll handle all styling in the CSS now
@@ -19,12 +31,152 @@ class HTMLRenderer:
         </div>
         """
         return styled_html
-    
+
+    def get_stylesheet(self, slide_style):
+        """Return compiled CSS for a style, compiling each distinct style once"""
+        style = Style.intern(slide_style)
+        stylesheet = self._stylesheets.get(style)
+        if stylesheet is None:
+            stylesheet = self._compile_stylesheet(style) + self.get_code_stylesheet()
+            with self._lock:
+                self._stylesheets[style] = stylesheet
+        return stylesheet
+
+    def get_code_stylesheet(self, theme=None):
+        """Return Pygments CSS for codehilite classes, generated once per theme"""
+        theme = theme or self.code_theme
+        stylesheet = self._code_stylesheets.get(theme)
+        if stylesheet is None:
+            try:
+                from pygments.formatters import HtmlFormatter
+                stylesheet = HtmlFormatter(style=theme).get_style_defs('.codehilite')
+            except Exception:
+                # Highlighted code still renders, just without colours
+                stylesheet = ''
+            with self._lock:
+                self._code_stylesheets[theme] = stylesheet
+        return stylesheet
+
+    def get_scoped_stylesheet(self, slide_style, scope):
+        """Return compiled CSS for a style with every rule scoped under scope"""
+        style = Style.intern(slide_style)
+        stylesheet = self._stylesheets.get((style, scope))
+        if stylesheet is None:
+            stylesheet = self._compile_stylesheet(style, root=scope, prefix=scope + ' ')
+            with self._lock:
+                self._stylesheets[(style, scope)] = stylesheet
+        return stylesheet
+
+    def create_deck_html(self, sections):
+        """Create one HTML document holding a section per slide
+
+        sections is a list of (index, html_content, slide_style) tuples. Only
+        the section passed to gliderShow() is visible at a time, and more can
+        be added later with gliderAddSection().
+        """
+        stylesheets = {}
+        section_html = []
+        for index, html_content, slide_style in sections:
+            style_class, stylesheet, markup = self.create_deck_section(
+                index, html_content, slide_style
+            )
+            stylesheets.setdefault(style_class, stylesheet)
+            section_html.append(markup)
+
+        sections_markup = "\n".join(section_html)
+        style_elements = "\n".join(
+            f'<style id="{style_class}">{stylesheet}</style>'
+            for style_class, stylesheet in stylesheets.items()
+        )
+
+        return f"""
+        <!DOCTYPE html>
+        <html>
+        <head>
+            <meta charset="UTF-8">
+            <style>
+                html, body {{
+                    margin: 0;
+                    padding: 0;
+                    overflow: hidden;
+                }}
+
+                section {{
+                    display: none;
+                    box-sizing: border-box;
+                    min-height: 100vh;
+                }}
+
+                section.active {{
+                    display: block;
+                }}
+            </style>
+            {style_elements}
+            <style id="glider-code">{self.get_code_stylesheet()}</style>
+            <script>
+                var gliderActive = null;
+                function gliderShow(index) {{
+                    var next = document.querySelector('section[data-index="' + index + '"]');
+                    if (!next) {{
+                        return false;
+                    }}
+                    if (gliderActive) {{
+                        gliderActive.classList.remove('active');
+                    }}
+                    next.classList.add('active');
+                    gliderActive = next;
+                    return true;
+                }}
+                function gliderAddSection(index, styleClass, stylesheet, markup) {{
+                    if (document.querySelector('section[data-index="' + index + '"]')) {{
+                        return false;
+                    }}
+                    if (!document.getElementById(styleClass)) {{
+                        var style = document.createElement('style');
+                        style.id = styleClass;
+                        style.textContent = stylesheet;
+                        document.head.insertBefore(style, document.getElementById('glider-code'));
+                    }}
+                    var template = document.createElement('template');
+                    template.innerHTML = markup;
+                    document.body.appendChild(template.content.firstElementChild);
+                    return true;
+                }}
+                function gliderRemoveSections(indices) {{
+                    indices.forEach(function (index) {{
+                        var section = document.querySelector('section[data-index="' + index + '"]');
+                        if (section && section !== gliderActive) {{
+                            section.remove();
+                        }}
+                    }});
+                }}
+            </script>
+        </head>
+        <body>
+            {sections_markup}
+        </body>
+        </html>
+        """
+
+    def create_deck_section(self, index, html_content, slide_style):
+        """Return (style class, scoped stylesheet, markup) of one deck section"""
+        style = Style.intern(slide_style)
+        style_class = self._style_classes.get(style)
+        if style_class is None:
+            with self._lock:
+                style_class = self._style_classes.setdefault(
+                    style, f"glider-style-{len(self._style_classes)}"
+                )
+        stylesheet = self.get_scoped_stylesheet(style, f"section.{style_class}")
+        markup = (f'<section class="{style_class}" data-index="{index}">'
+                  f'{self.apply_styling(html_content, style)}</section>')
+        return style_class, stylesheet, markup
+
     def create_slide_html(self, html_content, slide_style):
         """Create complete HTML document for slide"""
         styled_content = self.apply_styling(html_content, slide_style)
-        justify = slide_style.get('justify', 'left')
-        
+        stylesheet = self.get_stylesheet(slide_style)
+
         # Create a complete HTML document with styling
         html_document = f"""
         <!DOCTYPE html>
@@ -32,7 +184,27 @@ class HTMLRenderer:
         <head>
             <meta charset="UTF-8">
             <style>
-                body {{
+                {stylesheet}
+            </style>
+        </head>
+        <body>
+            {styled_content}
+        </body>
+        </html>
+        """
+
+        return html_document
+
+    def _compile_stylesheet(self, slide_style, root='body', prefix=''):
+        """Compile the slide CSS for a resolved style
+
+        root is the selector holding the page-level rules and prefix scopes
+        every content rule, so several styles can share one document.
+        """
+        justify = slide_style.get('justify', 'left')
+
+        return f"""
+                {root} {{
                     margin: 0;
                     padding: 20px;
                     background-color: {slide_style.get('backgroundColor', '#FFFFFF')};
@@ -41,28 +213,28 @@ class HTMLRenderer:
                     font-size: {slide_style.get('fontSize', 24)}px;
                     color: {slide_style.get('textColor', '#000000')};
                 }}
-                
-                .slide-content {{
+
+                {prefix}.slide-content {{
                     width: 100%;
                     text-align: {justify};
                 }}
-                
+
                 /* Center justification specific styles */
                 {f'''
                 /* Center everything except lists */
-                .slide-content h1, 
-                .slide-content h2, 
-                .slide-content h3, 
-                .slide-content h4, 
-                .slide-content h5, 
-                .slide-content h6,
-                .slide-content p {{
+                {prefix}.slide-content h1,
+                {prefix}.slide-content h2,
+                {prefix}.slide-content h3,
+                {prefix}.slide-content h4,
+                {prefix}.slide-content h5,
+                {prefix}.slide-content h6,
+                {prefix}.slide-content p {{
                     text-align: center;
                 }}
-                
+
                 /* For lists, we need to center the container but left-align the content */
-                .slide-content ul,
-                .slide-content ol {{
+                {prefix}.slide-content ul,
+                {prefix}.slide-content ol {{
                     width: fit-content;
                     margin-left: auto;
                     margin-right: auto;
@@ -70,8 +242,8 @@ class HTMLRenderer:
                     padding-left: 40px;
                 }}
                 ''' if justify == 'center' else ''}
-                
-                pre {{
+
+                {prefix}pre {{
                     background-color: #f5f5f5;
                     padding: 10px;
                     border-radius: 5px;
@@ -79,48 +251,40 @@ class HTMLRenderer:
                     text-align: left;
                     {f'margin: 0 auto;' if justify == 'center' else ''}
                 }}
-                
-                code {{
+
+                {prefix}code {{
                     font-family: monospace;
                 }}
-                
-                img {{
+
+                {prefix}img {{
                     max-width: 100%;
                     height: auto;
                     {f'display: block; margin: 0 auto;' if justify == 'center' else ''}
                 }}
-                
+
                 /* Tables should always be full width */
-                table {{
+                {prefix}table {{
                     border-collapse: collapse;
                     width: 100%;
                     margin: 0 auto;
                 }}
-                
-                th, td {{
+
+                {prefix}th, {prefix}td {{
                     border: 1px solid #ddd;
                     padding: 8px;
                     text-align: left;
                 }}
-                
-                th {{
+
+                {prefix}th {{
                     background-color: #f2f2f2;
                 }}
-                
+
                 /* Blockquotes styling */
-                blockquote {{
+                {prefix}blockquote {{
                     border-left: 5px solid #ddd;
                     padding-left: 10px;
                     margin-left: 20px;
                     font-style: italic;
                     {f'margin-left: auto; margin-right: auto; width: 80%;' if justify == 'center' else ''}
                 }}
-            </style>
-        </head>
-        <body>
-            {styled_content}
-        </body>
-        </html>
         """
-        
-        return html_document
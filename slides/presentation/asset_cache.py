@@ -0,0 +1,186 @@
+"""
+In-memory and mmap-backed cache of deck assets
+"""
+
+import hashlib
+import mimetypes
+import mmap
+import os
+import threading
+from collections import OrderedDict
+
+
+class AssetCache:
+    """Serves deck files and generated pages from memory"""
+
+    DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+    DEFAULT_MMAP_THRESHOLD = 1024 * 1024
+    DEFAULT_MAX_MAPPED = 16
+    MAX_PAGES = 8
+
+    # URL path prefix of roots serving slide directories outside the deck directory
+    DIRECTORY_ROOT_PREFIX = "__dir-"
+
+    def __init__(self, base_dir=None, max_bytes=None, mmap_threshold=None, max_mapped=None):
+        """Initialize asset cache rooted at base_dir"""
+        self.base_dir = base_dir
+        self.roots = {}
+        self.max_bytes = max_bytes or self.DEFAULT_MAX_BYTES
+        self.mmap_threshold = mmap_threshold or self.DEFAULT_MMAP_THRESHOLD
+        self.max_mapped = max_mapped or self.DEFAULT_MAX_MAPPED
+        self.entries = OrderedDict()
+        self.total_bytes = 0
+        self.mapped_count = 0
+        self.pages = OrderedDict()
+        self.page_counter = 0
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+    def set_base_dir(self, base_dir):
+        """Serve assets relative to a new deck directory"""
+        with self._lock:
+            if base_dir != self.base_dir:
+                self._clear_entries()
+            self.base_dir = base_dir
+
+    def add_root(self, name, directory):
+        """Serve files in directory under the /name/ URL path"""
+        self.roots[name] = directory
+
+    def add_slide_directory(self, directory):
+        """Serve a slide directory, under its own root when it is outside the deck"""
+        directory = os.path.realpath(directory)
+        if self.url_for(directory) is None:
+            digest = hashlib.sha1(directory.encode("utf-8")).hexdigest()[:12]
+            self.add_root(self.DIRECTORY_ROOT_PREFIX + digest, directory)
+
+    def url_for(self, path):
+        """Return the absolute URL path serving a file, or None if it is not served"""
+        path = os.path.realpath(path)
+        roots = [("", self.base_dir)] if self.base_dir else []
+        roots += [("/" + name, directory) for name, directory in list(self.roots.items())]
+        for prefix, directory in roots:
+            directory = os.path.realpath(directory)
+            if os.path.commonpath([directory, path]) == directory:
+                relative_path = os.path.relpath(path, directory).replace(os.sep, "/")
+                return prefix + "/" + ("" if relative_path == "." else relative_path)
+        return None
+
+    def resolve(self, relative_path):
+        """Return the absolute path of an asset, or None if it is outside the deck"""
+        relative_path = relative_path.lstrip("/")
+        root_name, _, remainder = relative_path.partition("/")
+        if root_name in self.roots:
+            base_dir, relative_path = self.roots[root_name], remainder
+        else:
+            base_dir = self.base_dir
+        if not base_dir:
+            return None
+
+        base_dir = os.path.realpath(base_dir)
+        path = os.path.realpath(os.path.join(base_dir, relative_path))
+        if os.path.commonpath([base_dir, path]) != base_dir:
+            return None
+        return path
+
+    def get(self, relative_path):
+        """Return (data, mime type) for an asset, or None if it cannot be served"""
+        path = self.resolve(relative_path)
+        if path is None:
+            return None
+
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+        state = (stat.st_mtime_ns, stat.st_size)
+
+        with self._lock:
+            entry = self.entries.get(path)
+            if entry is not None and entry[0] == state:
+                self.entries.move_to_end(path)
+                self.hits += 1
+                return entry[1], self.mime_type(path)
+            self.misses += 1
+
+        data = self._load(path, stat.st_size)
+        with self._lock:
+            if path in self.entries:
+                self._drop(path)
+            self.entries[path] = (state, data)
+            if isinstance(data, mmap.mmap):
+                self.mapped_count += 1
+            else:
+                self.total_bytes += len(data)
+
+            # Heap copies count against the byte budget; mapped files hold a
+            # descriptor and address space each, so their number is capped
+            while self.total_bytes > self.max_bytes and len(self.entries) > 1:
+                self._drop(next(iter(self.entries)))
+            while self.mapped_count > self.max_mapped:
+                self._drop(next(
+                    key for key, (_, value) in self.entries.items()
+                    if isinstance(value, mmap.mmap)
+                ))
+        return data, self.mime_type(path)
+
+    def store_page(self, html):
+        """Keep a generated HTML page in memory and return its name"""
+        with self._lock:
+            self.page_counter += 1
+            name = f"{self.page_counter}.html"
+            self.pages[name] = html.encode("utf-8")
+            while len(self.pages) > self.MAX_PAGES:
+                self.pages.popitem(last=False)
+        return name
+
+    def get_page(self, name):
+        """Return a stored page, or None if it has been dropped"""
+        with self._lock:
+            return self.pages.get(name)
+
+    def get_stats(self):
+        """Return cache statistics"""
+        with self._lock:
+            return {
+                "entries": len(self.entries),
+                "bytes": self.total_bytes,
+                "mapped": self.mapped_count,
+                "pages": len(self.pages),
+                "hits": self.hits,
+                "misses": self.misses
+            }
+
+    def clear(self):
+        """Drop every cached asset and page"""
+        with self._lock:
+            self._clear_entries()
+            self.pages.clear()
+
+    @staticmethod
+    def mime_type(path):
+        """Return the MIME type for a file path"""
+        return mimetypes.guess_type(path)[0] or "application/octet-stream"
+
+    def _load(self, path, size):
+        """Read a file, mapping it into memory when it is large"""
+        with open(path, "rb") as file:
+            if size >= self.mmap_threshold:
+                return mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+            return file.read()
+
+    def _drop(self, path):
+        """Remove one cached asset; the lock must be held"""
+        _, data = self.entries.pop(path)
+        if isinstance(data, mmap.mmap):
+            # Not closed here: a request may still be copying from it, and the
+            # mapping is unmapped once the last reference is released
+            self.mapped_count -= 1
+        else:
+            self.total_bytes -= len(data)
+
+    def _clear_entries(self):
+        """Remove every cached asset; the lock must be held"""
+        for path in list(self.entries):
+            self._drop(path)
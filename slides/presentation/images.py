@@ -0,0 +1,265 @@
+"""
+Resolution-aware downscaling of slide images
+"""
+
+import hashlib
+import os
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from PyQt6.QtCore import QObject, QSize, Qt, pyqtSignal
+from PyQt6.QtGui import QImageReader
+
+from slides.utils.error_handler import ErrorHandler
+
+IMG_SRC_RE = re.compile(r'(<img\b[^>]*?\bsrc=)(["\'])([^"\']+)\2', re.IGNORECASE)
+
+# URL path under which the asset cache serves generated variants
+VARIANT_PREFIX = "__image__"
+
+
+def is_relative_url(src):
+    """Return whether an image source is a path relative to its slide"""
+    return not (re.match(r'^[a-z][a-z0-9+.-]*:', src, re.IGNORECASE) or src.startswith('/'))
+
+
+def rebase_image_sources(html, slide_dir, url_for):
+    """Point relative <img> sources, written against slide_dir, at deck URL paths
+
+    url_for maps an absolute file path to its URL path, or None when it
+    cannot be served; such sources are left unchanged.
+    """
+    def replace(match):
+        src = match.group(3)
+        if not is_relative_url(src):
+            return match.group(0)
+
+        url = url_for(os.path.normpath(os.path.join(slide_dir, src)))
+        if url is None:
+            return match.group(0)
+        return f'{match.group(1)}{match.group(2)}{url}{match.group(2)}'
+
+    return IMG_SRC_RE.sub(replace, html)
+
+
+class ImagePipeline(QObject):
+    """Produces downscaled image variants sized to the slide window"""
+
+    # Emitted on the GUI thread with the source paths that gained a variant
+    variants_ready = pyqtSignal(list)
+
+    DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+    def __init__(self, cache_dir, max_workers=2, resize_threshold=0.25, max_bytes=None,
+                 parent=None):
+        """Initialize pipeline writing variants to cache_dir with a size cap"""
+        super().__init__(parent)
+        self.cache_dir = cache_dir
+        os.makedirs(self.cache_dir, exist_ok=True)
+        self.resize_threshold = resize_threshold
+        self.max_bytes = max_bytes or self.DEFAULT_MAX_BYTES
+        # Scanned when the first variant is written
+        self.total_bytes = None
+        self.target = None
+
+        # Source (path, mtime, size) -> content hash, and hash -> pixel size
+        self.source_hashes = {}
+        self.source_sizes = {}
+        # Image path -> slide paths whose HTML references it
+        self.references = {}
+        self.pending = set()
+        self._lock = threading.Lock()
+        self._disk_lock = threading.Lock()
+        self.executor = ThreadPoolExecutor(
+            max_workers=max(1, max_workers), thread_name_prefix="glider-images"
+        )
+
+    def set_target_size(self, width, height, device_pixel_ratio=1.0):
+        """Update the target size; return True if variants should be regenerated"""
+        target = (int(width * device_pixel_ratio), int(height * device_pixel_ratio))
+        if self.target is not None:
+            grow_w = abs(target[0] - self.target[0]) / max(1, self.target[0])
+            grow_h = abs(target[1] - self.target[1]) / max(1, self.target[1])
+            if max(grow_w, grow_h) < self.resize_threshold:
+                return False
+        self.target = target
+        return True
+
+    def restore_target(self, target):
+        """Use a target size saved by an earlier run, so its render cache keys match"""
+        self.target = (int(target[0]), int(target[1]))
+
+    def rewrite(self, html, base_dir, slide_path=None):
+        """Point local <img> references at downscaled variants where available
+
+        Safe to call from worker threads. Missing variants are scheduled and
+        the original reference is kept until they are ready.
+        """
+        if self.target is None or not base_dir:
+            return html
+
+        def replace(match):
+            src = match.group(3)
+            if not is_relative_url(src):
+                return match.group(0)
+
+            image_path = os.path.normpath(os.path.join(base_dir, src))
+            if slide_path:
+                with self._lock:
+                    self.references.setdefault(image_path, set()).add(slide_path)
+
+            variant_name = self._variant_name(image_path)
+            if variant_name is None:
+                return match.group(0)
+            return f'{match.group(1)}{match.group(2)}/{VARIANT_PREFIX}/{variant_name}{match.group(2)}'
+
+        return IMG_SRC_RE.sub(replace, html)
+
+    def referencing_slides(self, image_paths):
+        """Return slide paths whose HTML references any of image_paths"""
+        with self._lock:
+            slides = set()
+            for image_path in image_paths:
+                slides |= self.references.get(image_path, set())
+            return slides
+
+    def shutdown(self):
+        """Stop the worker pool"""
+        self.executor.shutdown(wait=False, cancel_futures=True)
+
+    def _variant_name(self, image_path):
+        """Return the file name of an existing variant, scheduling one if needed"""
+        try:
+            stat = os.stat(image_path)
+        except OSError:
+            return None
+
+        target = self.target
+        source_key = (image_path, stat.st_mtime_ns, stat.st_size)
+        with self._lock:
+            source_hash = self.source_hashes.get(source_key)
+            pixel_size = self.source_sizes.get(source_hash)
+
+        if source_hash is not None and pixel_size is not None:
+            if pixel_size[0] <= target[0] and pixel_size[1] <= target[1]:
+                # Already small enough to use as is
+                return None
+            name = self._file_name(source_hash, target, image_path)
+            try:
+                # Bump the modification time so pruning treats the variant as recently used
+                os.utime(os.path.join(self.cache_dir, name))
+                return name
+            except OSError:
+                pass
+
+        self._schedule(source_key, target)
+        return None
+
+    def _schedule(self, source_key, target):
+        """Generate a variant on the worker pool unless already pending"""
+        job = (source_key, target)
+        with self._lock:
+            if job in self.pending:
+                return
+            self.pending.add(job)
+        self.executor.submit(self._generate, source_key, target)
+
+    def _generate(self, source_key, target):
+        """Hash, measure and downscale a source image; runs on a worker thread"""
+        image_path = source_key[0]
+        try:
+            with self._lock:
+                source_hash = self.source_hashes.get(source_key)
+            if source_hash is None:
+                source_hash = self._hash_file(image_path)
+            reader = QImageReader(image_path)
+            reader.setAutoTransform(True)
+            size = reader.size()
+
+            with self._lock:
+                self.source_hashes[source_key] = source_hash
+                self.source_sizes[source_hash] = (size.width(), size.height())
+
+            if size.isValid() and (size.width() > target[0] or size.height() > target[1]):
+                variant_path = os.path.join(self.cache_dir, self._file_name(source_hash, target, image_path))
+                if not os.path.exists(variant_path):
+                    # Decode straight to the smaller size instead of scaling a full decode
+                    reader.setScaledSize(size.scaled(QSize(*target), Qt.AspectRatioMode.KeepAspectRatio))
+                    image = reader.read()
+                    if image.isNull():
+                        raise ValueError(reader.errorString())
+
+                    temp_path = variant_path + ".tmp"
+                    if not image.save(temp_path, self._format(image_path), 90):
+                        raise OSError(f"Could not write {temp_path}")
+                    os.replace(temp_path, variant_path)
+                    self._account(os.path.getsize(variant_path))
+                self.variants_ready.emit([image_path])
+        except Exception as e:
+            ErrorHandler.handle_file_error(e, image_path)
+        finally:
+            with self._lock:
+                self.pending.discard((source_key, target))
+
+    def _account(self, size):
+        """Count a newly written variant and prune the cache if over its cap"""
+        with self._disk_lock:
+            if self.total_bytes is None:
+                self.total_bytes = sum(entry[1] for entry in self._entries())
+            else:
+                self.total_bytes += size
+
+            if self.total_bytes > self.max_bytes:
+                self._prune()
+
+    def _entries(self):
+        """Return (mtime, size, path) for every cached variant"""
+        entries = []
+        for name in os.listdir(self.cache_dir):
+            if name.endswith(".tmp"):
+                continue
+            path = os.path.join(self.cache_dir, name)
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+        return entries
+
+    def _prune(self):
+        """Remove least recently used variants until under 90% of the cap"""
+        target = self.max_bytes * 0.9
+        entries = sorted(self._entries())
+        self.total_bytes = sum(size for _, size, _ in entries)
+
+        for _, size, path in entries:
+            if self.total_bytes <= target:
+                break
+            try:
+                os.remove(path)
+                self.total_bytes -= size
+            except OSError:
+                pass
+
+    @staticmethod
+    def _hash_file(path):
+        """Return the SHA-256 of a file's contents"""
+        digest = hashlib.sha256()
+        with open(path, "rb") as file:
+            for chunk in iter(lambda: file.read(1024 * 1024), b""):
+                digest.update(chunk)
+        return digest.hexdigest()
+
+    @classmethod
+    def _file_name(cls, source_hash, target, image_path):
+        """Return the variant file name for a source hash and target size"""
+        extension = "jpg" if cls._format(image_path) == "JPEG" else "png"
+        return f"{source_hash[:32]}-{target[0]}x{target[1]}.{extension}"
+
+    @staticmethod
+    def _format(image_path):
+        """Return the output format for a source image"""
+        if image_path.lower().endswith((".jpg", ".jpeg")):
+            return "JPEG"
+        return "PNG"
@@ -0,0 +1,78 @@
+"""
+Background pre-rendering of neighbouring slides
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+
+from PyQt6.QtCore import QObject, pyqtSignal
+
+from slides.utils.error_handler import ErrorHandler
+
+
+class SlidePrefetcher(QObject):
+    """Renders slides around the current one on a worker pool"""
+
+    # Emitted on the GUI thread with (generation, cache key, html)
+    slide_rendered = pyqtSignal(int, object, str)
+
+    def __init__(self, render_job, ahead=2, behind=1, max_workers=2, parent=None):
+        """Initialize prefetcher with a render job and window depth
+
+        render_job(slide) must be safe to call off the GUI thread and return a
+        (cache key, html) tuple, or None when there is nothing to render.
+        """
+        super().__init__(parent)
+        self.render_job = render_job
+        self.ahead = ahead
+        self.behind = behind
+        self.generation = 0
+        self.pending = []
+        self.executor = ThreadPoolExecutor(
+            max_workers=max(1, max_workers), thread_name_prefix="glider-prefetch"
+        )
+
+    def prefetch(self, slides, current_index):
+        """Schedule rendering of the slides around current_index"""
+        self.cancel()
+
+        # Closest neighbours first so the likely next slide is ready soonest
+        indices = [current_index + offset for offset in range(1, self.ahead + 1)]
+        indices += [current_index - offset for offset in range(1, self.behind + 1)]
+
+        generation = self.generation
+        for index in indices:
+            if 0 <= index < len(slides):
+                future = self.executor.submit(self._run, generation, slides[index])
+                self.pending.append(future)
+
+    def cancel(self):
+        """Cancel all outstanding prefetch work"""
+        # Bumping the generation makes jobs that already started discard results
+        self.generation += 1
+        for future in self.pending:
+            future.cancel()
+        self.pending = []
+
+    def is_current(self, generation):
+        """Return whether results from generation are still wanted"""
+        return generation == self.generation
+
+    def shutdown(self):
+        """Stop the worker pool"""
+        self.cancel()
+        self.executor.shutdown(wait=False, cancel_futures=True)
+
+    def _run(self, generation, slide):
+        """Render a slide on a worker thread"""
+        if not self.is_current(generation):
+            return
+
+        try:
+            result = self.render_job(slide)
+        except Exception as e:
+            ErrorHandler.handle_markdown_error(e, slide.source.key)
+            return
+
+        if result is not None and self.is_current(generation):
+            cache_key, html = result
+            self.slide_rendered.emit(generation, cache_key, html)
@@ -0,0 +1,81 @@
+"""
+glider:// URL scheme serving deck assets from memory
+"""
+
+from PyQt6.QtCore import QBuffer, QByteArray, QIODevice, QUrl
+from PyQt6.QtWebEngineCore import (QWebEngineUrlRequestJob, QWebEngineUrlScheme,
+                                   QWebEngineUrlSchemeHandler)
+
+SCHEME_NAME = b"glider"
+DECK_BASE_URL = "glider://deck/"
+PAGE_PREFIX = "/__page__/"
+
+# setHtml() loads a percent-encoded data: URL and rejects URLs longer than
+# 2 MB, so bigger pages go through the scheme
+SET_HTML_LIMIT = 2 * 1024 * 1024 - 1024
+
+
+def fits_set_html(html):
+    """Return whether html is small enough to be loaded with setHtml()"""
+    # A character is at most 4 UTF-8 bytes, and percent-encoding at most triples each
+    if len(html) * 12 <= SET_HTML_LIMIT:
+        return True
+    data = html.encode("utf-8")
+    if len(data) * 3 <= SET_HTML_LIMIT:
+        return True
+    return QByteArray(data).toPercentEncoding().size() <= SET_HTML_LIMIT
+
+
+def register_scheme():
+    """Register the glider scheme; must run before QApplication is created"""
+    scheme = QWebEngineUrlScheme(SCHEME_NAME)
+    scheme.setSyntax(QWebEngineUrlScheme.Syntax.Host)
+    scheme.setFlags(
+        QWebEngineUrlScheme.Flag.SecureScheme
+        | QWebEngineUrlScheme.Flag.LocalAccessAllowed
+        | QWebEngineUrlScheme.Flag.CorsEnabled
+    )
+    QWebEngineUrlScheme.registerScheme(scheme)
+
+
+def page_url(name):
+    """Return the URL of a page stored in the asset cache"""
+    return QUrl(DECK_BASE_URL.rstrip("/") + PAGE_PREFIX + name)
+
+
+class DeckSchemeHandler(QWebEngineUrlSchemeHandler):
+    """Answers glider://deck/... requests from an AssetCache"""
+
+    def __init__(self, asset_cache, max_age=3600, parent=None):
+        """Initialize handler with the asset cache it serves from"""
+        super().__init__(parent)
+        self.asset_cache = asset_cache
+        self.max_age = max_age
+
+    def requestStarted(self, job):
+        """Serve a single request"""
+        path = job.requestUrl().path()
+
+        if path.startswith(PAGE_PREFIX):
+            data = self.asset_cache.get_page(path[len(PAGE_PREFIX):])
+            mime_type = "text/html"
+            cache_control = b"no-store"
+        else:
+            asset = self.asset_cache.get(path)
+            data, mime_type = asset if asset is not None else (None, None)
+            cache_control = f"max-age={self.max_age}".encode("ascii")
+
+        if data is None:
+            job.fail(QWebEngineUrlRequestJob.Error.UrlNotFound)
+            return
+
+        # setAdditionalResponseHeaders is only available from Qt 6.6
+        if hasattr(job, "setAdditionalResponseHeaders"):
+            job.setAdditionalResponseHeaders({b"Cache-Control": [cache_control]})
+
+        # The buffer is parented to the job so it lives until the reply is sent.
+        # Mapped files are copied once, straight from the mapping
+        buffer = QBuffer(job)
+        buffer.setData(QByteArray(data))
+        buffer.open(QIODevice.OpenModeFlag.ReadOnly)
+        job.reply(mime_type.encode("ascii"), buffer)
@@ -0,0 +1,70 @@
+"""
+Session snapshot for resuming a presentation after a restart
+"""
+
+import hashlib
+import json
+import os
+
+from slides.utils.error_handler import ErrorHandler
+from slides.utils.file_utils import write_file_atomic
+
+
+def fingerprint(cache_key):
+    """Return a stable string for a render cache key, comparable across runs"""
+    # Keys hold paths, file states, interned styles and extensions, all with stable reprs
+    return hashlib.sha256(repr(cache_key).encode("utf-8")).hexdigest()
+
+
+class SessionStore:
+    """Last deck, slide and pre-rendered HTML around it, kept in one JSON file
+
+    Rendered slides are stored with a fingerprint of their render cache key,
+    so they are only reused while the slide's source, style and render
+    settings are unchanged.
+    """
+
+    FORMAT_VERSION = 2
+
+    def __init__(self, path):
+        """Initialize session store backed by path"""
+        self.path = path
+
+    def load(self):
+        """Return the saved session, or None when there is none or it is unreadable"""
+        try:
+            with open(self.path, "r", encoding="utf-8") as file:
+                session = json.load(file)
+            if session.get("version") != self.FORMAT_VERSION:
+                return None
+            if not isinstance(session.get("yaml_path"), str):
+                return None
+            session["slide_index"] = int(session.get("slide_index", 0))
+            session.setdefault("slides", [])
+            session.setdefault("image_target", None)
+            session.setdefault("window", None)
+            return session
+        except (OSError, ValueError, TypeError):
+            return None
+
+    def save(self, yaml_path, slide_index, rendered=(), image_target=None, window=None):
+        """Save the deck, current slide and (index, cache key, html) rendered slides
+
+        image_target is the image variant size the renders were made for, and
+        window the geometry and fullscreen state they were shown in.
+        """
+        session = {
+            "version": self.FORMAT_VERSION,
+            "yaml_path": os.path.abspath(yaml_path),
+            "slide_index": slide_index,
+            "image_target": list(image_target) if image_target else None,
+            "window": window,
+            "slides": [
+                {"index": index, "fingerprint": fingerprint(cache_key), "html": html}
+                for index, cache_key, html in rendered
+            ],
+        }
+        try:
+            write_file_atomic(self.path, json.dumps(session))
+        except OSError as e:
+            ErrorHandler.handle_file_error(e, self.path)
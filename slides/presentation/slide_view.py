@@ -2,39 +2,188 @@
 Slide display component
 """
 
-from PyQt6.QtWidgets import QWidget, QVBoxLayout
+import json
+
+from PyQt6.QtWidgets import QStackedLayout, QVBoxLayout, QWidget
 from PyQt6.QtWebEngineWidgets import QWebEngineView
-from PyQt6.QtCore import QUrl, Qt
+from PyQt6.QtCore import QUrl, Qt, pyqtSignal
+
+from slides.presentation.scheme import DECK_BASE_URL, fits_set_html, page_url
+from slides.utils.instrumentation import tracer
 
 
 class SlideView(QWidget):
     """Widget for displaying slides as HTML"""
+
+    # Emitted once a requested slide is visible on screen
+    slide_shown = pyqtSignal()
     
-    def __init__(self, parent=None):
-        """Initialize slide view component"""
+    def __init__(self, parent=None, pool_size=1, asset_cache=None):
+        """Initialize slide view component with a pool of web views"""
         super().__init__(parent)
+
+        # Relative asset URLs resolve against the glider scheme when it is served
+        self.asset_cache = asset_cache
+        self.base_url = QUrl(DECK_BASE_URL) if asset_cache is not None else QUrl()
         
         # Set up layout
         self.layout = QVBoxLayout(self)
         self.layout.setContentsMargins(0, 0, 0, 0)
-        
-        # Create web view for rendering HTML
-        self.web_view = QWebEngineView()
-        self.web_view.setAttribute(Qt.WidgetAttribute.WA_OpaquePaintEvent, False)
-        self.web_view.setStyleSheet("""
+
+        # Web views are stacked so off-screen views can load ahead of time
+        self.stack_widget = QWidget()
+        self.stack = QStackedLayout(self.stack_widget)
+        self.stack.setContentsMargins(0, 0, 0, 0)
+        self.layout.addWidget(self.stack_widget)
+
+        self.views = []
+        self.view_keys = {}
+        self.view_ready = {}
+        self.pending_key = None
+        for _ in range(max(1, pool_size)):
+            self._add_view()
+
+        # The visible view; the only view when the pool has a single entry
+        self.web_view = self.views[0]
+        self.stack.setCurrentWidget(self.web_view)
+
+        # State for single-document deck mode
+        self.deck_indices = set()
+        self.deck_ready = False
+        self.pending_section = None
+        self.pending_scripts = []
+
+        # Set initial content
+        self.clear()
+
+    def _add_view(self):
+        """Create a web view for rendering HTML and add it to the pool"""
+        view = QWebEngineView()
+        view.setAttribute(Qt.WidgetAttribute.WA_OpaquePaintEvent, False)
+        view.setStyleSheet("""
             QWebEngineView {
                 background: transparent;
             }
         """)
-        self.layout.addWidget(self.web_view)
-        
-        # Set initial content
-        self.clear()
-    
+        view.loadFinished.connect(lambda ok, view=view: self._on_view_loaded(view, ok))
+        self.stack.addWidget(view)
+        self.views.append(view)
+        self.view_keys[view] = None
+        self.view_ready[view] = False
+
     def set_content(self, html_content):
         """Set HTML content to display"""
+        self.invalidate_deck()
+        self.pending_key = None
+        self.view_keys[self.web_view] = None
+        self._set_html(self.web_view, self._wrap_content(html_content))
+
+    def show_slide(self, key, html_content):
+        """Show a slide, swapping in a preloaded view when one is available"""
+        if len(self.views) == 1:
+            self.set_content(html_content)
+            self.view_keys[self.web_view] = key
+            return
+
+        view = self._find_view(key)
+        if view is None:
+            view = self._load_offscreen(key, html_content)
+
+        if self.view_ready[view]:
+            self._swap_to(view)
+        else:
+            # The current slide stays on screen until the new one has painted
+            self.pending_key = key
+
+    def preload(self, key, html_content, keep=()):
+        """Load a slide into an off-screen view so it can be shown instantly
+
+        Views holding a key in keep are only reused when no other view is free.
+        """
+        if len(self.views) > 1 and self._find_view(key) is None:
+            self._load_offscreen(key, html_content, keep)
+
+    def forget_slides(self, keep=(), include_current=False):
+        """Drop preloaded slides so nothing stale can be swapped in
+
+        Views holding a key in keep stay loaded. With include_current the
+        visible slide is loaded again the next time it is shown.
+        """
+        self.pending_key = None
+        for view in self.views:
+            if self.view_keys[view] in keep:
+                continue
+            if view is self.web_view:
+                if include_current:
+                    # Stays on screen until its replacement has loaded
+                    self.view_keys[view] = None
+                continue
+            self.view_keys[view] = None
+            self.view_ready[view] = False
+
+    def _find_view(self, key):
+        """Return the view holding key, if any"""
+        for view in self.views:
+            if self.view_keys[view] == key:
+                return view
+        return None
+
+    def _load_offscreen(self, key, html_content, keep=()):
+        """Load content into the least recently used hidden view"""
+        # Views are kept in least-recently-used order
+        hidden = [view for view in self.views if view is not self.web_view]
+        pending = self.pending_key
+        free = [view for view in hidden
+                if self.view_keys[view] not in keep
+                and (pending is None or self.view_keys[view] != pending)]
+        view = (free or hidden)[0]
+
+        self.views.remove(view)
+        self.views.append(view)
+        self.view_keys[view] = key
+        self.view_ready[view] = False
+        self._set_html(view, self._wrap_content(html_content))
+        return view
+
+    def _swap_to(self, view):
+        """Make a loaded view the visible one"""
+        self.pending_key = None
+        self.stack.setCurrentWidget(view)
+        self.web_view = view
+        self.views.remove(view)
+        self.views.append(view)
+        self.slide_shown.emit()
+
+    def _on_view_loaded(self, view, ok):
+        """Handle a finished load in any pooled view"""
+        self.view_ready[view] = ok
+        if view is self.web_view:
+            if self.pending_key == self.view_keys[view]:
+                self.pending_key = None
+            if ok and not self.deck_indices:
+                self.slide_shown.emit()
+            self._on_load_finished(ok)
+        elif ok and self.pending_key is not None and self.view_keys[view] == self.pending_key:
+            self._swap_to(view)
+
+    def _set_html(self, view, html):
+        """Load an HTML document into a view"""
+        with tracer.span("set_html"):
+            self._load_html(view, html)
+
+    def _load_html(self, view, html):
+        """Load HTML with setHtml, or through the scheme when it is too large"""
+        if self.asset_cache is not None and not fits_set_html(html):
+            # Over the setHtml size limit, so serve it as a page instead
+            view.load(page_url(self.asset_cache.store_page(html)))
+            return
+        view.setHtml(html, self.base_url)
+
+    @staticmethod
+    def _wrap_content(html_content):
+        """Wrap slide HTML in the view's rounded-corner document"""
         # Add border-radius to the HTML content
-        styled_html = f"""
+        return f"""
         <html>
         <head>
             <style>
@@ -51,8 +200,84 @@ class SlideView(QWidget):
         </body>
         </html>
         """
-        self.web_view.setHtml(styled_html)
-    
+
+    def load_deck(self, deck_html, indices, show_index, callback=None):
+        """Load a multi-section deck document and show one of its sections"""
+        self.deck_indices = set(indices)
+        self.deck_ready = False
+        self.pending_section = (show_index, callback)
+        self.pending_scripts = []
+        self._set_html(self.web_view, deck_html)
+
+    def add_section(self, index, style_class, stylesheet, markup):
+        """Add a section to the loaded deck document without reloading it"""
+        if not self.deck_indices or index in self.deck_indices:
+            return
+        self.deck_indices.add(index)
+        self._run_deck_script(
+            f"gliderAddSection({int(index)}, {json.dumps(style_class)}, "
+            f"{json.dumps(stylesheet)}, {json.dumps(markup)})"
+        )
+
+    def remove_sections(self, indices):
+        """Remove sections other than the visible one from the loaded deck document"""
+        indices = [index for index in indices if index in self.deck_indices]
+        if not indices:
+            return
+        self.deck_indices.difference_update(indices)
+        self._run_deck_script(f"gliderRemoveSections({json.dumps(sorted(indices))})")
+
+    def _run_deck_script(self, script):
+        """Run a script in the deck document, once it has loaded"""
+        if self.deck_ready:
+            self.web_view.page().runJavaScript(script)
+        else:
+            self.pending_scripts.append(script)
+
+    def has_section(self, index):
+        """Return whether the loaded deck document contains a slide"""
+        return index in self.deck_indices
+
+    def show_section(self, index, callback=None):
+        """Switch the visible section of the loaded deck document"""
+        if not self.deck_ready:
+            # Shown as soon as the document finishes loading
+            self.pending_section = (index, callback)
+            return
+
+        def shown(result):
+            self.slide_shown.emit()
+            if callback:
+                callback(result)
+
+        self.web_view.page().runJavaScript(f"gliderShow({int(index)})", shown)
+
+    def invalidate_deck(self):
+        """Forget the loaded deck document"""
+        self.deck_indices = set()
+        self.deck_ready = False
+        self.pending_section = None
+        self.pending_scripts = []
+
+    def _on_load_finished(self, ok):
+        """Show the pending section once a deck document has loaded"""
+        if not self.deck_indices:
+            return
+
+        self.deck_ready = ok
+        if ok:
+            # Sections added while loading go in before the pending one is shown
+            for script in self.pending_scripts:
+                self.web_view.page().runJavaScript(script)
+            self.pending_scripts = []
+        if ok and self.pending_section:
+            index, callback = self.pending_section
+            self.pending_section = None
+            self.show_section(index, callback)
+
     def clear(self):
         """Clear current content"""
+        self.invalidate_deck()
+        self.forget_slides()
+        self.view_keys[self.web_view] = None
         self.web_view.setHtml("<html><body style='border-radius: 10px; padding: 10px;'><p>No slide loaded</p></body></html>")
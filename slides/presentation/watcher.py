@@ -0,0 +1,103 @@
+"""
+File watching for live deck reloading
+"""
+
+import os
+
+from PyQt6.QtCore import QFileSystemWatcher, QObject, QTimer, pyqtSignal
+
+
+class DeckWatcher(QObject):
+    """Watches deck sources and directories and reports debounced batches of changed paths"""
+
+    # Emitted with the sorted list of paths that changed since the last batch
+    files_changed = pyqtSignal(list)
+
+    def __init__(self, debounce_ms=250, poll_interval_ms=1000, use_polling=False, parent=None):
+        """Initialize watcher with debounce and polling settings"""
+        super().__init__(parent)
+        self.use_polling = use_polling
+        self.paths = set()
+        self.polled_paths = {}
+        self.pending = set()
+
+        self.fs_watcher = QFileSystemWatcher(self)
+        self.fs_watcher.fileChanged.connect(self._on_file_changed)
+        self.fs_watcher.directoryChanged.connect(self._on_file_changed)
+
+        # Editors often save in bursts, so changes are collected before emitting
+        self.debounce_timer = QTimer(self)
+        self.debounce_timer.setSingleShot(True)
+        self.debounce_timer.setInterval(debounce_ms)
+        self.debounce_timer.timeout.connect(self._flush)
+
+        self.poll_timer = QTimer(self)
+        self.poll_timer.setInterval(poll_interval_ms)
+        self.poll_timer.timeout.connect(self._poll)
+
+    def watch(self, paths):
+        """Replace the watched set with paths"""
+        self.clear()
+        self.paths = {os.path.abspath(path) for path in paths if path}
+
+        failed = set()
+        if not self.use_polling:
+            existing = [path for path in self.paths if os.path.exists(path)]
+            if existing:
+                failed = set(self.fs_watcher.addPaths(existing))
+            failed |= {path for path in self.paths if not os.path.exists(path)}
+        else:
+            failed = set(self.paths)
+
+        # Paths the native watcher could not take are polled instead
+        self.polled_paths = {path: self._file_state(path) for path in failed}
+        if self.polled_paths:
+            self.poll_timer.start()
+
+    def clear(self):
+        """Stop watching all paths"""
+        watched = self.fs_watcher.files() + self.fs_watcher.directories()
+        if watched:
+            self.fs_watcher.removePaths(watched)
+        self.poll_timer.stop()
+        self.debounce_timer.stop()
+        self.paths = set()
+        self.polled_paths = {}
+        self.pending = set()
+
+    def _on_file_changed(self, path):
+        """Record a change reported by the native watcher"""
+        self.pending.add(path)
+        self.debounce_timer.start()
+
+    def _poll(self):
+        """Compare file states of polled paths"""
+        for path, state in list(self.polled_paths.items()):
+            new_state = self._file_state(path)
+            if new_state != state:
+                self.polled_paths[path] = new_state
+                self._on_file_changed(path)
+
+    def _flush(self):
+        """Emit the collected batch of changes"""
+        changed = sorted(self.pending)
+        self.pending = set()
+
+        # Saving via rename drops the file from the native watcher, so re-add it
+        if not self.use_polling:
+            watched = set(self.fs_watcher.files()) | set(self.fs_watcher.directories())
+            for path in changed:
+                if path not in watched and path not in self.polled_paths and os.path.exists(path):
+                    self.fs_watcher.addPath(path)
+
+        if changed:
+            self.files_changed.emit(changed)
+
+    @staticmethod
+    def _file_state(path):
+        """Return modification time and size of a path, or None if missing"""
+        try:
+            stat = os.stat(path)
+            return (stat.st_mtime_ns, stat.st_size)
+        except OSError:
+            return None
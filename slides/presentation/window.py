@@ -3,33 +3,185 @@ Main presentation window
 """
 
 import os
+import threading
 
-from PyQt6.QtCore import QPoint, QSize, Qt
+from PyQt6.QtCore import QPoint, QSize, Qt, QTimer
 from PyQt6.QtGui import QColor, QMouseEvent, QPainter, QPainterPath, QRegion
+from PyQt6.QtWebEngineCore import QWebEngineProfile
 from PyQt6.QtWidgets import (QFileDialog, QHBoxLayout, QMainWindow,
                              QMessageBox, QPushButton, QSizePolicy,
                              QStackedLayout, QVBoxLayout, QWidget)
 
+from slides.config.deck_cache import DeckCache
+from slides.config.deck_diff import DeckDiff
 from slides.config.slide_config import SlideConfig
-from slides.markdown.parser import MarkdownParser
+from slides.markdown.cache import RenderCache
+from slides.markdown.disk_cache import DiskRenderCache
+from slides.markdown.highlight import HighlightCache
+from slides.markdown.parser import WARM_UP_SAMPLE, MarkdownParser
 from slides.markdown.renderer import HTMLRenderer
+from slides.presentation.asset_cache import AssetCache
+from slides.presentation.images import VARIANT_PREFIX, ImagePipeline, rebase_image_sources
+from slides.presentation.prefetch import SlidePrefetcher
+from slides.presentation.scheme import SCHEME_NAME, DeckSchemeHandler
+from slides.presentation.session import SessionStore, fingerprint
 from slides.presentation.slide_view import SlideView
+from slides.presentation.watcher import DeckWatcher
+from slides.utils.file_utils import ensure_cache_directory, ensure_config_directory
+from slides.utils.instrumentation import profiler, tracer
 
 
 class PresentationWindow(QMainWindow):
     """Main presentation window"""
 
-    def __init__(self, app_config):
-        """Initialize presentation window"""
+    # Keys that start a slide change, timed from the key press
+    NAVIGATION_KEYS = {
+        Qt.Key.Key_Right, Qt.Key.Key_Space, Qt.Key.Key_Left, Qt.Key.Key_Backspace,
+        Qt.Key.Key_Home, Qt.Key.Key_End,
+    }
+
+    # Keys held while typing, which keep a partly typed slide number
+    MODIFIER_KEYS = {
+        Qt.Key.Key_Shift, Qt.Key.Key_Control, Qt.Key.Key_Alt, Qt.Key.Key_Meta,
+    }
+
+    # Session snapshots are written once navigation has been idle this long
+    SESSION_SAVE_DELAY_MS = 500
+
+    def __init__(self, app_config, deck_path=None, start_slide=None, resume=True):
+        """Initialize presentation window
+
+        deck_path (a deck directory or slides.yaml) and a zero-based start_slide
+        skip the deck prompt; otherwise the last session is resumed if enabled.
+        """
         super().__init__()
 
         self.app_config = app_config
-        self.slide_config = SlideConfig()
-        self.markdown_parser = MarkdownParser()
+        cache_config = app_config.get_cache_config()
+
+        # Parsed decks are cached so reopening an unchanged deck skips YAML parsing
+        deck_cache_dir = None
+        if cache_config.get("deck_disk_enabled", True):
+            deck_cache_dir = ensure_cache_directory("config")
+        self.deck_cache = DeckCache(cache_dir=deck_cache_dir)
+        self.slide_config = SlideConfig(self.deck_cache)
+
+        # "page" replaces the document per slide, "deck" loads many slides into
+        # one document and "pool" swaps between preloaded off-screen views
+        presentation_config = app_config.get_presentation_config()
+        presentation_mode = presentation_config.get("mode", "page")
+        self.deck_mode = presentation_mode == "deck"
+        self.deck_window = presentation_config.get("deck_window", 2)
+        self.view_pool_size = 1
+        if presentation_mode == "pool":
+            self.view_pool_size = max(2, presentation_config.get("view_pool_size", 3))
+
+        disk_cache = None
+        if cache_config.get("disk_enabled", True):
+            disk_cache = DiskRenderCache(max_bytes=cache_config.get("disk_max_bytes"))
+
+        highlight_dir = None
+        if cache_config.get("highlight_disk_enabled", True):
+            highlight_dir = ensure_cache_directory("highlight")
+        self.highlight_cache = HighlightCache(
+            max_entries=cache_config.get("highlight_max_entries"),
+            cache_dir=highlight_dir,
+            disk_max_bytes=cache_config.get("highlight_disk_max_bytes"),
+        )
+
+        self.markdown_parser = MarkdownParser(
+            disk_cache=disk_cache, highlight_cache=self.highlight_cache
+        )
         self.html_renderer = HTMLRenderer()
 
+        self.render_cache = RenderCache(
+            max_entries=cache_config.get("max_entries"),
+            max_bytes=cache_config.get("max_bytes"),
+        )
+
+        # Serve deck images, fonts and stylesheets over glider://deck/
+        self.asset_cache = AssetCache(
+            max_bytes=cache_config.get("asset_max_bytes"),
+            max_mapped=cache_config.get("asset_max_mapped"),
+        )
+        self.scheme_handler = DeckSchemeHandler(self.asset_cache, parent=self)
+        QWebEngineProfile.defaultProfile().installUrlSchemeHandler(
+            SCHEME_NAME, self.scheme_handler
+        )
+
+        # Downscale large images to the window size on a worker pool
+        images_config = app_config.get_images_config()
+        self.image_pipeline = None
+        if images_config.get("enabled", True):
+            self.image_pipeline = ImagePipeline(
+                ensure_cache_directory("images"),
+                max_workers=images_config.get("workers", 2),
+                resize_threshold=images_config.get("resize_threshold", 0.25),
+                max_bytes=images_config.get("disk_max_bytes"),
+                parent=self,
+            )
+            initial_size = app_config.get_window_config()
+            self.image_pipeline.set_target_size(
+                initial_size.get("width", 800), initial_size.get("height", 600)
+            )
+            self.image_pipeline.variants_ready.connect(self._on_image_variants_ready)
+            self.asset_cache.add_root(VARIANT_PREFIX, self.image_pipeline.cache_dir)
+
+        # Pre-render neighbouring slides off the GUI thread
+        prefetch_config = app_config.get_prefetch_config()
+        self.prefetcher = None
+        if prefetch_config.get("enabled", True):
+            ahead = prefetch_config.get("ahead", 2)
+            behind = prefetch_config.get("behind", 1)
+            if self.deck_mode:
+                # Fill the deck window so the next deck document is built from cache
+                ahead = max(ahead, self.deck_window)
+                behind = max(behind, self.deck_window)
+            self.prefetcher = SlidePrefetcher(
+                self._prefetch_job,
+                ahead=ahead,
+                behind=behind,
+                max_workers=prefetch_config.get("workers", 2),
+                parent=self,
+            )
+            self.prefetcher.slide_rendered.connect(self._on_slide_prefetched)
+
+        # Re-render edited slides while rehearsing
+        watch_config = app_config.get_watch_config()
+        self.yaml_path = None
+        self.deck_watcher = None
+        if watch_config.get("enabled", True):
+            self.deck_watcher = DeckWatcher(
+                debounce_ms=watch_config.get("debounce_ms", 250),
+                poll_interval_ms=watch_config.get("poll_interval_ms", 1000),
+                use_polling=watch_config.get("polling", False),
+                parent=self,
+            )
+            self.deck_watcher.files_changed.connect(self._on_deck_files_changed)
+
         self.current_slide_index = 0
 
+        # Rapid navigation is coalesced so only the final target gets rendered
+        navigation_config = app_config.get_navigation_config()
+        self.pending_slide_index = None
+        self.jump_buffer = ""
+        self.navigation_timer = QTimer(self)
+        self.navigation_timer.setSingleShot(True)
+        self.navigation_timer.setInterval(navigation_config.get("settle_ms", 80))
+        self.navigation_timer.timeout.connect(self._on_navigation_settled)
+
+        # The last deck, slide and rendered neighbours are kept for a quick resume
+        session_config = app_config.get_session_config()
+        self.session_store = None
+        if session_config.get("enabled", True):
+            self.session_store = SessionStore(
+                os.path.join(ensure_config_directory(), "session.json")
+            )
+        self.session_timer = QTimer(self)
+        self.session_timer.setSingleShot(True)
+        self.session_timer.setInterval(self.SESSION_SAVE_DELAY_MS)
+        self.session_timer.timeout.connect(self._save_session)
+
         # Variables for window dragging
         self.dragging = False
         self.drag_position = None
@@ -60,8 +212,11 @@ class PresentationWindow(QMainWindow):
         self.main_layout.setSpacing(0)
 
         # Create slide view (main content)
-        self.slide_view = SlideView(self)
+        self.slide_view = SlideView(
+            self, pool_size=self.view_pool_size, asset_cache=self.asset_cache
+        )
         self.main_layout.addWidget(self.slide_view)
+        self.slide_view.slide_shown.connect(tracer.end_navigation)
 
         # Create overlay for navigation buttons
         self.create_navigation_overlay()
@@ -83,9 +238,49 @@ class PresentationWindow(QMainWindow):
 
         # Show the window before prompting for slides.yaml
         self.show()
+        profiler.mark("window shown")
+
+        # Warm up markdown and Pygments once the window has painted
+        QTimer.singleShot(0, self._start_warm_up)
 
-        # Prompt for slides.yaml on startup
-        self.prompt_for_slides_config()
+        # Open the requested deck, resume the last one, or prompt for slides.yaml
+        self._open_initial_deck(
+            deck_path, start_slide, resume and session_config.get("resume", True)
+        )
+
+    def _open_initial_deck(self, deck_path, start_slide, resume):
+        """Open the deck given on the command line, resume the last session, or prompt"""
+        session = self.session_store.load() if self.session_store else None
+        if deck_path:
+            yaml_path = os.path.abspath(deck_path)
+            if os.path.isdir(yaml_path):
+                yaml_path = os.path.join(yaml_path, "slides.yaml")
+            if not os.path.exists(yaml_path):
+                QMessageBox.warning(self, "File Not Found", f"slides.yaml not found: {deck_path}")
+                self.prompt_for_slides_config()
+                return
+        elif resume and session and os.path.exists(session["yaml_path"]):
+            yaml_path = session["yaml_path"]
+        else:
+            self.prompt_for_slides_config()
+            return
+
+        if session and session["yaml_path"] != yaml_path:
+            session = None
+        if start_slide is None:
+            start_slide = session["slide_index"] if session and resume else 0
+        self.load_slides_config(yaml_path, start_slide, session)
+
+    def _start_warm_up(self):
+        """Import and exercise the markdown engine and Pygments off the GUI thread"""
+        threading.Thread(target=self._warm_up, name="glider-warmup", daemon=True).start()
+
+    def _warm_up(self):
+        """Convert a small sample so the first real slide skips module imports"""
+        # A private highlight cache so the sample is always run through Pygments
+        MarkdownParser(highlight_cache=HighlightCache()).parse_text(WARM_UP_SAMPLE)
+        self.html_renderer.get_code_stylesheet()
+        profiler.mark("warm-up finished")
 
     def create_navigation_overlay(self):
         """Create navigation buttons as an overlay on the content"""
@@ -170,6 +365,51 @@ class PresentationWindow(QMainWindow):
         self.overlay_widget.setGeometry(self.central_widget.rect())
         # Call the original resize event
         QWidget.resizeEvent(self.central_widget, event)
+        self._update_image_target()
+
+    def _update_image_target(self):
+        """Resize image variants when the slide area changed significantly"""
+        if not self.image_pipeline:
+            return
+
+        size = self.slide_view.size()
+        if size.width() <= 0 or size.height() <= 0:
+            return
+        changed = self.image_pipeline.set_target_size(
+            size.width(), size.height(), self.devicePixelRatioF()
+        )
+        if changed and self.slide_config.get_slide_count() > 0:
+            # Cache keys include the target size, so this re-renders the slide
+            self.slide_view.invalidate_deck()
+            self.slide_view.forget_slides()
+            self.load_slide(self.current_slide_index)
+
+    def _on_image_variants_ready(self, image_paths):
+        """Re-render slides that reference newly downscaled images"""
+        slide_paths = self.image_pipeline.referencing_slides(image_paths)
+        if not slide_paths:
+            return
+        for path in slide_paths:
+            self.render_cache.invalidate_path(path)
+
+        def is_affected(index):
+            slide = self.slide_config.get_slide(index)
+            return slide is not None and slide.source.key in slide_paths
+
+        # Variants do not change cache keys, so loaded copies of affected
+        # slides are dropped by source while the others stay loaded
+        if any(is_affected(index) for index in self.slide_view.deck_indices):
+            self.slide_view.invalidate_deck()
+        current_affected = is_affected(self.current_slide_index)
+        self.slide_view.forget_slides(
+            keep=[key for key in self._neighbour_keys() if key[0] not in slide_paths],
+            include_current=current_affected
+        )
+
+        if current_affected:
+            self.load_slide(self.current_slide_index)
+        else:
+            self._schedule_neighbours()
 
     def prompt_for_slides_config(self):
         """Prompt user to select slides.yaml file"""
@@ -194,15 +434,33 @@ class PresentationWindow(QMainWindow):
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Error selecting directory: {str(e)}")
 
-    def load_slides_config(self, yaml_path):
-        """Load slides configuration from YAML file"""
+    def load_slides_config(self, yaml_path, slide_index=0, session=None):
+        """Load slides configuration from YAML file and show slide_index
+
+        A saved session for the same deck seeds the render cache with its
+        pre-rendered slides that are still current.
+        """
         try:
+            if self.yaml_path == os.path.abspath(yaml_path) and self.slide_config.get_slide_count():
+                # Reopening the current deck keeps caches and the current slide
+                self._reload_deck(set())
+                return
+
             self.slide_config.load_config(yaml_path)
+            self.asset_cache.set_base_dir(self.slide_config.base_dir)
+            self._serve_slide_directories()
+            self.slide_view.invalidate_deck()
             self.setWindowTitle(self.slide_config.get_title())
+            self.yaml_path = os.path.abspath(yaml_path)
+            self._watch_deck()
+
+            if session:
+                self._restore_session(session)
 
-            # Load first slide
-            if self.slide_config.get_slide_count() > 0:
-                self.load_slide(0)
+            # Load the requested slide, or the first one
+            slide_count = self.slide_config.get_slide_count()
+            if slide_count > 0:
+                self.load_slide(max(0, min(slide_index, slide_count - 1)))
             else:
                 QMessageBox.warning(
                     self, "No Slides", "No slides found in configuration"
@@ -212,8 +470,158 @@ class PresentationWindow(QMainWindow):
                 self, "Error", f"Failed to load slides configuration: {str(e)}"
             )
 
+    def _restore_session(self, session):
+        """Put saved renders whose slide is unchanged back into the render cache"""
+        # Render keys include the image target, so the saved window comes back first
+        self._restore_window(session.get("window"))
+        if self.image_pipeline and session.get("image_target"):
+            self.image_pipeline.restore_target(session["image_target"])
+
+        for entry in session["slides"]:
+            slide = self.slide_config.get_slide(entry.get("index", -1))
+            if slide is None:
+                continue
+            cache_key = self._render_key(slide)
+            if fingerprint(cache_key) == entry.get("fingerprint"):
+                self.render_cache.put(cache_key, entry["html"])
+
+    def _restore_window(self, window):
+        """Move and resize the window to a saved geometry and fullscreen state"""
+        if not window:
+            return
+        try:
+            x, y, width, height = (int(value) for value in window["geometry"])
+        except (KeyError, TypeError, ValueError):
+            return
+        if self.isFullScreen() and not window.get("fullscreen"):
+            self.showNormal()
+        self.setGeometry(x, y, width, height)
+        if window.get("fullscreen"):
+            self.showFullScreen()
+
+    def _save_session(self):
+        """Snapshot the deck, current slide, window and the rendered slides around it"""
+        self.session_timer.stop()
+        if not self.session_store or not self.yaml_path:
+            return
+
+        index = self.current_slide_index
+        rendered = []
+        for neighbour in (index, index + 1, index - 1):
+            slide = self.slide_config.get_slide(neighbour)
+            if slide is None:
+                continue
+            cache_key = self._render_key(slide)
+            html = self.render_cache.peek(cache_key)
+            if html is not None:
+                rendered.append((neighbour, cache_key, html))
+
+        # A fullscreen window is restored from its normal geometry
+        fullscreen = self.isFullScreen()
+        rect = self.normalGeometry() if fullscreen else self.geometry()
+        window = {
+            "geometry": [rect.x(), rect.y(), rect.width(), rect.height()],
+            "fullscreen": fullscreen,
+        }
+        image_target = self.image_pipeline.target if self.image_pipeline else None
+        self.session_store.save(self.yaml_path, index, rendered, image_target, window)
+
+    def _schedule_session_save(self):
+        """Save the session once navigation has settled"""
+        if self.session_store:
+            self.session_timer.start()
+
+    def _serve_slide_directories(self):
+        """Serve the assets of slides in included chapters outside the deck directory"""
+        directories = {os.path.dirname(path) for path in self.slide_config.get_slides().file_paths()}
+        for directory in directories:
+            self.asset_cache.add_slide_directory(directory)
+
+    def _watch_deck(self):
+        """Watch slides.yaml, its includes and glob directories, and every file-backed slide"""
+        if not self.deck_watcher:
+            return
+        paths = [self.yaml_path]
+        paths += self.slide_config.get_dependency_paths()
+        paths += self.slide_config.get_slides().file_paths()
+        self.deck_watcher.watch(paths)
+
+    def _on_deck_files_changed(self, paths):
+        """Invalidate and refresh only the slides affected by changed files"""
+        changed_paths = set(paths)
+        for path in changed_paths:
+            self.render_cache.invalidate_path(path)
+
+        deck_paths = {self.yaml_path, *self.slide_config.get_dependency_paths()}
+        if deck_paths & changed_paths:
+            self._reload_deck(changed_paths)
+            return
+
+        current = self.slide_config.get_slide(self.current_slide_index)
+        self._refresh_after_change(current is not None and current.path in changed_paths)
+
+    def _reload_deck(self, changed_paths):
+        """Reload slides.yaml, keeping unchanged slides' renders and the current slide"""
+        new_config = SlideConfig(self.deck_cache)
+        new_config.load_config(self.yaml_path)
+        if new_config.get_slide_count() == 0:
+            # Keep presenting the old deck while slides.yaml is mid-edit
+            current = self.slide_config.get_slide(self.current_slide_index)
+            self._refresh_after_change(current is not None and current.path in changed_paths)
+            return
+
+        diff = DeckDiff(self.slide_config.get_slides(), new_config.get_slides())
+        for source_key in diff.removed_keys():
+            self.render_cache.invalidate_path(source_key)
+
+        old_index = self.current_slide_index
+        current = self.slide_config.get_slide(old_index)
+        refresh_current = (not diff.is_unchanged(old_index)
+                           or (current is not None and current.path in changed_paths))
+
+        self.slide_config = new_config
+        self.setWindowTitle(self.slide_config.get_title())
+        self._serve_slide_directories()
+        self._watch_deck()
+
+        # Stay on the same logical slide even if slides were inserted before it
+        self.current_slide_index = diff.new_index(old_index)
+        if self.pending_slide_index is not None:
+            self.pending_slide_index = diff.new_index(self.pending_slide_index)
+        if self.deck_mode and not diff.is_identity():
+            # Deck documents number their sections by the old positions
+            refresh_current = True
+        self._refresh_after_change(refresh_current)
+
+    def _refresh_after_change(self, refresh_current):
+        """Drop stale loaded documents and show the current slide again if needed"""
+        # Loaded deck documents may hold a stale copy of a changed slide
+        self.slide_view.invalidate_deck()
+
+        # Preloaded neighbours whose file and style are unchanged keep the same key
+        self.slide_view.forget_slides(keep=self._neighbour_keys())
+
+        if refresh_current:
+            self.load_slide(self.current_slide_index)
+        else:
+            self._update_navigation_state()
+            self._schedule_neighbours()
+            self._schedule_session_save()
+
+    def _update_navigation_state(self):
+        """Enable navigation buttons based on the current position"""
+        self.prev_button.setEnabled(self.current_slide_index > 0)
+        self.next_button.setEnabled(
+            self.current_slide_index < self.slide_config.get_slide_count() - 1
+        )
+
     def load_slide(self, slide_index):
         """Load and display slide"""
+        with tracer.span("load_slide"):
+            return self._load_slide(slide_index)
+
+    def _load_slide(self, slide_index):
+        """Show a slide and schedule its neighbours"""
         if slide_index < 0 or slide_index >= self.slide_config.get_slide_count():
             return False
 
@@ -221,42 +629,302 @@ class PresentationWindow(QMainWindow):
         if not slide:
             return False
 
-        # Parse markdown to HTML
-        html_content = self.markdown_parser.parse_file(slide.path)
-
-        # Apply styling and create complete HTML
-        styled_html = self.html_renderer.create_slide_html(html_content, slide.style)
+        if self.deck_mode:
+            self._show_deck_slide(slide_index)
+        else:
+            styled_html = self.render_slide(slide)
 
-        # Update slide view
-        self.slide_view.set_content(styled_html)
+            # Update slide view
+            self.slide_view.show_slide(self._cache_key(slide), styled_html)
 
         # Update current slide index
         self.current_slide_index = slide_index
 
         # Update navigation buttons
-        self.prev_button.setEnabled(slide_index > 0)
-        self.next_button.setEnabled(
-            slide_index < self.slide_config.get_slide_count() - 1
-        )
+        self._update_navigation_state()
+
+        # Start rendering the neighbours of the new slide
+        self._schedule_neighbours()
+        self._schedule_session_save()
 
         return True
 
+    def _schedule_neighbours(self):
+        """Prefetch and preload the slides around the current one"""
+        if self.prefetcher:
+            self.prefetcher.prefetch(self.slide_config.get_slides(), self.current_slide_index)
+        self._preload_neighbours()
+
+    def _show_deck_slide(self, slide_index):
+        """Show a slide in deck mode, loading a new deck document if needed"""
+        if self.slide_view.has_section(slide_index):
+            self.slide_view.show_section(slide_index)
+            self._extend_deck(slide_index)
+            return
+
+        # Only the target is parsed here; its neighbours come from the prefetcher
+        # and are added to the loaded document as they arrive
+        first, last = self._deck_range(slide_index)
+        sections = []
+        for slide in self.slide_config.get_slides()[first:last]:
+            if slide.index == slide_index:
+                html_content = self.render_section(slide)
+            else:
+                html_content = self.render_cache.peek(self._section_key(slide))
+            if html_content is not None:
+                sections.append((slide.index, html_content, slide.style))
+        with tracer.span("template"):
+            deck_html = self.html_renderer.create_deck_html(sections)
+        self.slide_view.load_deck(
+            deck_html, [index for index, _, _ in sections], slide_index
+        )
+
+    def _deck_range(self, slide_index):
+        """Return the (first, last + 1) indices of the deck window around a slide"""
+        slide_count = self.slide_config.get_slide_count()
+        if self.deck_window <= 0:
+            return 0, slide_count
+        return (max(0, slide_index - self.deck_window),
+                min(slide_count, slide_index + self.deck_window + 1))
+
+    def _extend_deck(self, slide_index):
+        """Add cached sections in the deck window around a slide to the loaded deck document"""
+        first, last = self._deck_range(slide_index)
+        for slide in self.slide_config.get_slides()[first:last]:
+            if self.slide_view.has_section(slide.index):
+                continue
+            html_content = self.render_cache.peek(self._section_key(slide))
+            if html_content is not None:
+                self.slide_view.add_section(slide.index, *self.html_renderer.create_deck_section(
+                    slide.index, html_content, slide.style
+                ))
+
+        # Sections left outside the window are dropped so the document stays bounded
+        self.slide_view.remove_sections([
+            index for index in self.slide_view.deck_indices if not first <= index < last
+        ])
+
+    def render_slide(self, slide):
+        """Return complete HTML for a slide, using the render cache"""
+        cache_key = self._cache_key(slide)
+        styled_html = self.render_cache.get(cache_key)
+        if styled_html is not None:
+            return styled_html
+
+        styled_html = self._build_slide_html(slide)
+        self.render_cache.put(cache_key, styled_html)
+        return styled_html
+
+    def render_section(self, slide):
+        """Return a slide's deck section body, using the render cache"""
+        section_key = self._section_key(slide)
+        html_content = self.render_cache.get(section_key)
+        if html_content is None:
+            html_content = self._parse_slide(slide)
+            self.render_cache.put(section_key, html_content)
+        return html_content
+
+    def _cache_key(self, slide):
+        """Return the render cache key for a slide"""
+        image_target = self.image_pipeline.target if self.image_pipeline else None
+        return RenderCache.make_key(
+            slide.source, slide.style, self.markdown_parser.extensions, image_target
+        )
+
+    def _section_key(self, slide):
+        """Return the render cache key for a slide's deck section body"""
+        image_target = self.image_pipeline.target if self.image_pipeline else None
+        return RenderCache.make_key(
+            slide.source, slide.style, self.markdown_parser.extensions,
+            ("section", image_target)
+        )
+
+    def _render_key(self, slide):
+        """Return the render cache key the current mode shows a slide from"""
+        if self.deck_mode:
+            return self._section_key(slide)
+        return self._cache_key(slide)
+
+    def _parse_slide(self, slide):
+        """Parse a slide's markdown, pointing images at downscaled variants"""
+        with tracer.span("parse"):
+            html_content = self.markdown_parser.parse_source(slide.source)
+
+        # Image paths are relative to the slide's own file, which may be in an included chapter
+        slide_dir = self.slide_config.base_dir
+        if slide.source.path:
+            slide_dir = os.path.dirname(slide.source.path)
+        if self.image_pipeline:
+            html_content = self.image_pipeline.rewrite(html_content, slide_dir, slide.source.key)
+        if slide_dir != self.slide_config.base_dir:
+            html_content = rebase_image_sources(html_content, slide_dir, self.asset_cache.url_for)
+        return html_content
+
+    def _build_slide_html(self, slide):
+        """Parse and template a slide without consulting the cache"""
+        # Parse markdown to HTML
+        html_content = self._parse_slide(slide)
+
+        # Apply styling and create complete HTML
+        with tracer.span("template"):
+            return self.html_renderer.create_slide_html(html_content, slide.style)
+
+    def _prefetch_job(self, slide):
+        """Render a slide for the prefetcher; runs on a worker thread"""
+        if self.deck_mode:
+            # Deck documents are assembled from parsed section bodies
+            section_key = self._section_key(slide)
+            if self.render_cache.contains(section_key):
+                return None
+            return section_key, self._parse_slide(slide)
+
+        cache_key = self._cache_key(slide)
+        if self.render_cache.contains(cache_key):
+            return None
+        return cache_key, self._build_slide_html(slide)
+
+    def _on_slide_prefetched(self, generation, cache_key, styled_html):
+        """Store a prefetched slide delivered on the GUI thread"""
+        if self.prefetcher.is_current(generation):
+            self.render_cache.put(cache_key, styled_html)
+            if self.deck_mode and self.slide_view.deck_indices:
+                self._extend_deck(self.current_slide_index)
+            self._preload_neighbours()
+
+    def _preload_neighbours(self):
+        """Load already rendered neighbours into off-screen views"""
+        if self.view_pool_size < 2:
+            return
+
+        cache_keys = self._neighbour_keys()
+        for cache_key in cache_keys:
+            styled_html = self.render_cache.peek(cache_key)
+            if styled_html is not None:
+                self.slide_view.preload(cache_key, styled_html, keep=cache_keys)
+
+    def _neighbour_keys(self):
+        """Return cache keys of the slides kept preloaded around the current one"""
+        if self.view_pool_size < 2:
+            return []
+
+        # Next slide first, then previous, then further ahead
+        index = self.current_slide_index
+        neighbours = [index + 1, index - 1] + list(range(index + 2, index + self.view_pool_size))
+        slides = [self.slide_config.get_slide(neighbour)
+                  for neighbour in neighbours[:self.view_pool_size - 1]]
+        return [self._cache_key(slide) for slide in slides if slide is not None]
+
+    def request_slide(self, slide_index):
+        """Navigate to a slide, coalescing bursts of navigation requests"""
+        slide_count = self.slide_config.get_slide_count()
+        slide_index = max(0, min(slide_index, slide_count - 1))
+        if slide_count == 0 or slide_index == self._navigation_target():
+            # Already there or heading there, so there is no slide change to time
+            tracer.cancel_navigation()
+            return
+        tracer.begin_navigation("request", replace=False)
+
+        if not self.navigation_timer.isActive():
+            # First request of a burst is rendered straight away
+            self.pending_slide_index = None
+            self.load_slide(slide_index)
+        else:
+            # Inside a burst only already rendered slides are shown
+            self.pending_slide_index = slide_index
+            if slide_index == self.current_slide_index:
+                # Back to the slide on screen, so there is nothing to show
+                self.pending_slide_index = None
+                tracer.cancel_navigation()
+            elif self._is_rendered(slide_index):
+                self.load_slide(slide_index)
+                self.pending_slide_index = None
+        self.navigation_timer.start()
+
+    def _navigation_target(self):
+        """Return the slide navigation is currently heading to"""
+        if self.pending_slide_index is not None:
+            return self.pending_slide_index
+        return self.current_slide_index
+
+    def _is_rendered(self, slide_index):
+        """Return whether a slide can be shown without rendering it"""
+        if self.deck_mode:
+            return self.slide_view.has_section(slide_index)
+        slide = self.slide_config.get_slide(slide_index)
+        return slide is not None and self.render_cache.contains(self._cache_key(slide))
+
+    def _on_navigation_settled(self):
+        """Render the final target once navigation input has settled"""
+        slide_index = self.pending_slide_index
+        self.pending_slide_index = None
+        if slide_index is not None and slide_index != self.current_slide_index:
+            self.load_slide(slide_index)
+        elif slide_index is not None:
+            # The burst came back to the slide on screen
+            tracer.cancel_navigation()
+
     def next_slide(self):
         """Navigate to next slide"""
-        if self.current_slide_index < self.slide_config.get_slide_count() - 1:
-            self.load_slide(self.current_slide_index + 1)
+        self.step_slide(1)
 
     def previous_slide(self):
         """Navigate to previous slide"""
-        if self.current_slide_index > 0:
-            self.load_slide(self.current_slide_index - 1)
+        self.step_slide(-1)
+
+    def step_slide(self, delta):
+        """Move delta slides forward (or back, if negative) from the navigation target"""
+        self.request_slide(self._navigation_target() + delta)
+
+    def go_to_slide(self, slide_index):
+        """Jump directly to a slide without visiting the ones in between"""
+        self.request_slide(slide_index)
+
+    def first_slide(self):
+        """Jump to the first slide"""
+        self.request_slide(0)
+
+    def last_slide(self):
+        """Jump to the last slide"""
+        self.request_slide(self.slide_config.get_slide_count() - 1)
+
+    def closeEvent(self, event):
+        """Stop background work when the window closes"""
+        if self.session_timer.isActive():
+            self._save_session()
+        if self.prefetcher:
+            self.prefetcher.shutdown()
+        if self.image_pipeline:
+            self.image_pipeline.shutdown()
+        super().closeEvent(event)
 
     def keyPressEvent(self, event):
         """Handle key press events"""
-        if event.key() == Qt.Key.Key_Right or event.key() == Qt.Key.Key_Space:
+        if event.key() in self.NAVIGATION_KEYS:
+            tracer.begin_navigation("key")
+
+        # Typing a slide number followed by Enter jumps to that slide; any other
+        # key except a bare modifier drops a partly typed number
+        if Qt.Key.Key_0.value <= event.key() <= Qt.Key.Key_9.value:
+            self.jump_buffer += event.text()
+            return
+        jump_buffer = self.jump_buffer
+        if event.key() not in self.MODIFIER_KEYS:
+            self.jump_buffer = ""
+
+        if event.key() in (Qt.Key.Key_Return, Qt.Key.Key_Enter) and jump_buffer:
+            tracer.begin_navigation("key")
+            self.go_to_slide(int(jump_buffer) - 1)
+        elif event.key() == Qt.Key.Key_Escape and jump_buffer:
+            # Escape only clears the number instead of closing the window
+            pass
+        elif event.key() == Qt.Key.Key_Right or event.key() == Qt.Key.Key_Space:
             self.next_slide()
         elif event.key() == Qt.Key.Key_Left or event.key() == Qt.Key.Key_Backspace:
             self.previous_slide()
+        elif event.key() == Qt.Key.Key_Home:
+            self.first_slide()
+        elif event.key() == Qt.Key.Key_End:
+            self.last_slide()
         elif event.key() == Qt.Key.Key_Escape:
             self.close()
         else:
@@ -3,19 +3,9 @@ Error handling utilities
 """
 
 import logging
-import sys
-
-
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler("slides_error.log"),
-        logging.StreamHandler(sys.stderr)
-    ]
-)
 
+# Handlers are attached by slides.utils.logging_setup.setup_logging(); until
+# then only errors reach stderr, through logging's last-resort handler
 logger = logging.getLogger("slides")
 
 
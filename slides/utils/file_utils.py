@@ -3,6 +3,8 @@ File operation utilities
 """
 
 import os
+import shutil
+import tempfile
 
 
 def ensure_config_directory():
@@ -13,6 +15,43 @@ def ensure_config_directory():
     return config_dir
 
 
+def ensure_cache_directory(*parts):
+    """Ensure cache directory (or a subdirectory of it) exists"""
+    cache_dir = os.path.join(os.path.expanduser("~/.cache/glider"), *parts)
+    if not os.path.exists(cache_dir):
+        os.makedirs(cache_dir)
+    return cache_dir
+
+
+def clear_cache_directory():
+    """Remove everything under the cache directory, keeping the directory itself"""
+    cache_dir = ensure_cache_directory()
+    for name in os.listdir(cache_dir):
+        path = os.path.join(cache_dir, name)
+        if os.path.isdir(path) and not os.path.islink(path):
+            shutil.rmtree(path, ignore_errors=True)
+        else:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+
+def ensure_state_directory():
+    """Ensure the state directory for logs exists
+
+    Uses $XDG_STATE_HOME/glider when XDG_STATE_HOME is set, otherwise the
+    configuration directory.
+    """
+    state_home = os.environ.get("XDG_STATE_HOME")
+    if not state_home:
+        return ensure_config_directory()
+    state_dir = os.path.join(state_home, "glider")
+    if not os.path.exists(state_dir):
+        os.makedirs(state_dir)
+    return state_dir
+
+
 def read_file(file_path):
     """Read file content"""
     with open(file_path, "r", encoding="utf-8") as file:
@@ -31,6 +70,24 @@ def write_file(file_path, content):
         file.write(content)
 
 
+def write_file_atomic(file_path, content):
+    """Write content to file so readers never observe a partial write"""
+    directory = os.path.dirname(file_path) or "."
+    if not os.path.exists(directory):
+        os.makedirs(directory)
+
+    # Write to a sibling temporary file, then rename it over the target
+    fd, temp_path = tempfile.mkstemp(dir=directory, prefix=".tmp-")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as file:
+            file.write(content)
+        os.replace(temp_path, file_path)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+
+
 def file_exists(file_path):
     """Check if file exists"""
     return os.path.isfile(file_path)
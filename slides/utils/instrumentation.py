@@ -0,0 +1,281 @@
+"""
+Navigation latency tracing and startup profiling
+"""
+
+import atexit
+import builtins
+import contextlib
+import csv
+import json
+import os
+import sys
+import threading
+import time
+from collections import deque
+
+# Set to 1 to print a latency summary on exit, or to a .json/.csv path to also dump spans
+TRACE_ENV_VAR = "GLIDER_TRACE"
+
+_NULL_SPAN = contextlib.nullcontext()
+
+
+class Tracer:
+    """Records timed spans of slide navigation into a ring buffer"""
+
+    FIELDS = ("navigation", "name", "start_ms", "duration_ms", "thread", "origin")
+
+    # Spans from other threads are summarized under this prefix
+    WORKER_PREFIX = "worker:"
+
+    def __init__(self, enabled=False, capacity=4096):
+        """Initialize tracer keeping at most capacity spans"""
+        self.enabled = enabled
+        self.spans = deque(maxlen=capacity)
+        self.origin = time.perf_counter()
+        self.navigation_id = 0
+        self.navigation = None
+
+    def set_capacity(self, capacity):
+        """Resize the ring buffer, keeping the most recent spans"""
+        self.spans = deque(self.spans, maxlen=capacity)
+
+    def span(self, name):
+        """Return a context manager timing a stage; free when tracing is off"""
+        if not self.enabled:
+            return _NULL_SPAN
+        return self._span(name)
+
+    @contextlib.contextmanager
+    def _span(self, name):
+        """Time a stage and record it"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, start, time.perf_counter())
+
+    def record(self, name, start, end):
+        """Record a span from perf_counter timestamps"""
+        if not self.enabled:
+            return
+        # Only GUI thread spans belong to the navigation in progress
+        thread = threading.current_thread()
+        on_gui_thread = thread is threading.main_thread()
+        navigation = None
+        if on_gui_thread and self.navigation is not None:
+            navigation = self.navigation[0]
+        self.spans.append((
+            navigation,
+            name,
+            (start - self.origin) * 1000,
+            (end - start) * 1000,
+            thread.name,
+            "gui" if on_gui_thread else "worker",
+        ))
+
+    def begin_navigation(self, source, start=None, replace=True):
+        """Start timing a navigation triggered by source (key, hotkey, ...)
+
+        With replace=False an already open navigation is kept, so the earliest
+        trigger of a slide change is the one measured.
+        """
+        if not self.enabled or (self.navigation is not None and not replace):
+            return
+        self.navigation_id += 1
+        self.navigation = (self.navigation_id, source, start or time.perf_counter())
+
+    def end_navigation(self):
+        """Record the end-to-end span of the open navigation, if any"""
+        if not self.enabled or self.navigation is None:
+            return
+        _, source, start = self.navigation
+        self.record(f"navigation:{source}", start, time.perf_counter())
+        self.navigation = None
+
+    def cancel_navigation(self):
+        """Drop the open navigation without recording it, when it changed nothing"""
+        self.navigation = None
+
+    def get_spans(self):
+        """Return recorded spans as dicts, oldest first"""
+        return [dict(zip(self.FIELDS, span)) for span in list(self.spans)]
+
+    def summary(self):
+        """Return {span name: count, p50, p95, p99 and max in milliseconds}
+
+        GUI thread spans come first under their own name, then spans recorded
+        on worker threads (such as prefetch parsing) prefixed with "worker:",
+        so background work does not skew navigation latencies.
+        """
+        durations = {}
+        for span in list(self.spans):
+            durations.setdefault((span[5] != "gui", span[1]), []).append(span[3])
+
+        summary = {}
+        for (on_worker, name), values in sorted(durations.items()):
+            values.sort()
+            if on_worker:
+                name = self.WORKER_PREFIX + name
+            summary[name] = {
+                "count": len(values),
+                "p50": self._percentile(values, 50),
+                "p95": self._percentile(values, 95),
+                "p99": self._percentile(values, 99),
+                "max": values[-1],
+            }
+        return summary
+
+    def dump(self, path):
+        """Write recorded spans to a .csv file, or JSON for any other extension"""
+        spans = self.get_spans()
+        with open(path, "w", encoding="utf-8", newline="") as file:
+            if path.lower().endswith(".csv"):
+                writer = csv.DictWriter(file, fieldnames=self.FIELDS)
+                writer.writeheader()
+                writer.writerows(spans)
+            else:
+                json.dump({"spans": spans, "summary": self.summary()}, file, indent=2)
+
+    def report(self, stream=None, dump_path=None):
+        """Print a latency summary and optionally dump the spans"""
+        stream = stream or sys.stderr
+        summary = self.summary()
+        if summary:
+            print(f"{'span':<24} {'count':>6} {'p50':>9} {'p95':>9} {'p99':>9} {'max':>9}", file=stream)
+            for name, stats in summary.items():
+                print(f"{name:<24} {stats['count']:>6} {stats['p50']:>7.2f}ms "
+                      f"{stats['p95']:>7.2f}ms {stats['p99']:>7.2f}ms {stats['max']:>7.2f}ms",
+                      file=stream)
+        if dump_path:
+            self.dump(dump_path)
+
+    @staticmethod
+    def _percentile(sorted_values, percent):
+        """Return the nearest-rank percentile of sorted values"""
+        rank = max(1, -(-len(sorted_values) * percent // 100))
+        return sorted_values[int(rank) - 1]
+
+
+class StartupProfiler:
+    """Times startup phases and module imports for --profile-startup
+
+    Imports are timed like ``python -X importtime``: each first import made on
+    the main thread records its own time and its time including the modules it
+    imported in turn.
+    """
+
+    def __init__(self):
+        """Initialize a disabled profiler"""
+        self.enabled = False
+        self.origin = time.perf_counter()
+        self.phases = []
+        self.imports = []
+        self.reported = False
+        self._stack = []
+        self._original_import = None
+        self._thread_id = None
+
+    def start(self):
+        """Start timing imports made on the calling thread"""
+        if self.enabled:
+            return
+        self.enabled = True
+        self._thread_id = threading.get_ident()
+        self._original_import = builtins.__import__
+        builtins.__import__ = self._timed_import
+        # Reported on exit if no slide is ever shown
+        atexit.register(self.report)
+
+    def stop(self):
+        """Stop timing imports"""
+        if self._original_import is not None:
+            builtins.__import__ = self._original_import
+            self._original_import = None
+
+    def phase(self, name):
+        """Return a context manager timing a startup phase; free when profiling is off"""
+        if not self.enabled:
+            return _NULL_SPAN
+        return self._phase(name)
+
+    @contextlib.contextmanager
+    def _phase(self, name):
+        """Time a startup phase"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            end = time.perf_counter()
+            self.phases.append((name, (end - start) * 1000, (end - self.origin) * 1000))
+
+    def mark(self, name):
+        """Record a point in startup, such as the first slide being shown"""
+        if self.enabled:
+            self.phases.append((name, None, (time.perf_counter() - self.origin) * 1000))
+
+    def report(self, stream=None, min_ms=1.0):
+        """Print phase times and imports taking at least min_ms cumulatively"""
+        if not self.enabled or self.reported:
+            return
+        self.reported = True
+        self.stop()
+        stream = stream or sys.stderr
+
+        print(f"{'startup phase':<32} {'took':>10} {'at':>10}", file=stream)
+        for name, duration_ms, at_ms in self.phases:
+            took = f"{duration_ms:8.2f}ms" if duration_ms is not None else ""
+            print(f"{name:<32} {took:>10} {at_ms:8.2f}ms", file=stream)
+
+        print(f"import time: {'self [us]':>9} | {'cumulative':>10} | imported package", file=stream)
+        for depth, name, self_ms, cumulative_ms in self.imports:
+            if cumulative_ms >= min_ms:
+                print(f"import time: {self_ms * 1000:9.0f} | {cumulative_ms * 1000:10.0f} | "
+                      f"{'  ' * depth}{name}", file=stream)
+        total_ms = sum(cumulative_ms for depth, _, _, cumulative_ms in self.imports if depth == 0)
+        print(f"{'imports total':<32} {total_ms:8.2f}ms", file=stream)
+
+    def _timed_import(self, name, globals=None, locals=None, fromlist=(), level=0):
+        """Import a module, timing it when it is imported for the first time"""
+        if level or name in sys.modules or threading.get_ident() != self._thread_id:
+            return self._original_import(name, globals, locals, fromlist, level)
+
+        depth = len(self._stack)
+        self._stack.append(0.0)
+        start = time.perf_counter()
+        try:
+            return self._original_import(name, globals, locals, fromlist, level)
+        finally:
+            elapsed_ms = (time.perf_counter() - start) * 1000
+            children_ms = self._stack.pop()
+            if self._stack:
+                self._stack[-1] += elapsed_ms
+            self.imports.append((depth, name, elapsed_ms - children_ms, elapsed_ms))
+
+
+# Shared tracer used throughout the navigation path
+tracer = Tracer()
+
+# Shared startup profiler, enabled by main.py --profile-startup
+profiler = StartupProfiler()
+
+
+def configure_tracing(config=None):
+    """Enable tracing from the instrumentation config or GLIDER_TRACE"""
+    config = config or {}
+    enabled = config.get("enabled", False)
+    dump_path = config.get("dump_path")
+
+    env_value = os.environ.get(TRACE_ENV_VAR, "")
+    if env_value and env_value != "0":
+        enabled = True
+        if env_value != "1":
+            dump_path = env_value
+
+    if not enabled:
+        return False
+
+    tracer.set_capacity(config.get("capacity", 4096))
+    tracer.enabled = True
+    dump_path = os.path.expanduser(dump_path) if dump_path else None
+    atexit.register(tracer.report, dump_path=dump_path)
+    return True
@@ -0,0 +1,86 @@
+"""
+Non-blocking application logging
+
+Records are put on a queue by the thread that logs them and written to a
+rotating log file and stderr by a background listener thread, so error paths
+on the hotkey listener thread or during rendering never wait on disk.
+"""
+
+import atexit
+import logging
+import logging.handlers
+import os
+import queue
+import sys
+import threading
+
+from slides.utils.file_utils import ensure_state_directory
+
+LOG_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+LOG_FILE_NAME = "glider.log"
+
+_listener = None
+_queue_handler = None
+_lock = threading.Lock()
+
+
+def setup_logging(config=None, log_dir=None):
+    """Route the "slides" logger through a queue to a rotating file; returns the log path
+
+    Safe to call more than once; later calls only change the level.
+    """
+    global _listener, _queue_handler
+    config = config or {}
+    logger = logging.getLogger("slides")
+    logger.setLevel(config.get("level", "INFO"))
+
+    with _lock:
+        if _listener is not None:
+            return _listener.log_path
+
+        log_path = os.path.join(log_dir or ensure_state_directory(), LOG_FILE_NAME)
+        formatter = logging.Formatter(LOG_FORMAT)
+
+        # Opened on the first record, on the listener thread
+        file_handler = logging.handlers.RotatingFileHandler(
+            log_path,
+            maxBytes=config.get("max_bytes", 1048576),
+            backupCount=config.get("backup_count", 3),
+            encoding="utf-8",
+            delay=True
+        )
+        file_handler.setFormatter(formatter)
+        handlers = [file_handler]
+        if config.get("stderr", True):
+            stream_handler = logging.StreamHandler(sys.stderr)
+            stream_handler.setFormatter(formatter)
+            handlers.append(stream_handler)
+
+        records = queue.SimpleQueue()
+        _queue_handler = logging.handlers.QueueHandler(records)
+        _listener = logging.handlers.QueueListener(
+            records, *handlers, respect_handler_level=True
+        )
+        _listener.log_path = log_path
+        _listener.start()
+
+        logger.addHandler(_queue_handler)
+        # Records are handled by the listener only, not again by the root logger
+        logger.propagate = False
+        atexit.register(shutdown_logging)
+        return log_path
+
+
+def shutdown_logging():
+    """Write out queued records and stop the listener thread"""
+    global _listener, _queue_handler
+    with _lock:
+        if _listener is None:
+            return
+        logging.getLogger("slides").removeHandler(_queue_handler)
+        logging.getLogger("slides").propagate = True
+        _listener.stop()
+        for handler in _listener.handlers:
+            handler.close()
+        _listener = None
+        _queue_handler = None
@@ -1,3 +1,8 @@
 """
 Unit tests for the Slides application
 """
+
+import os
+
+# Widget tests create a QApplication, which needs no display when offscreen
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
@@ -0,0 +1,61 @@
+"""
+Tests for headless deck building
+"""
+
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+import yaml
+from slides.build.builder import DeckBuilder
+
+
+class TestDeckBuilder(unittest.TestCase):
+    """Test static deck compilation"""
+    
+    def setUp(self):
+        """Set up test environment"""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.yaml_path = os.path.join(self.temp_dir.name, "slides.yaml")
+        self.output_dir = os.path.join(self.temp_dir.name, "build")
+        
+        with open(os.path.join(self.temp_dir.name, "slide1.md"), "w") as f:
+            f.write("# Slide 1\nContent for slide 1")
+        
+        test_config = {
+            "title": "Build Test",
+            "slides": [
+                {"path": "slide1.md"},
+                {"content": "# Inline\nInline content"}
+            ]
+        }
+        with open(self.yaml_path, "w") as f:
+            yaml.dump(test_config, f)
+    
+    def tearDown(self):
+        """Clean up test environment"""
+        self.temp_dir.cleanup()
+    
+    def test_build(self):
+        """Test building writes one HTML file per slide and a manifest"""
+        manifest = DeckBuilder(self.yaml_path, self.output_dir, max_workers=2).build()
+        
+        self.assertEqual(manifest["title"], "Build Test")
+        self.assertEqual(manifest["slide_count"], 2)
+        
+        with open(os.path.join(self.output_dir, "manifest.json")) as f:
+            self.assertEqual(json.load(f)["slide_count"], 2)
+        
+        with open(os.path.join(self.output_dir, manifest["slides"][1]["file"])) as f:
+            self.assertIn("<h1>Inline</h1>", f.read())
+        
+        for slide in manifest["slides"]:
+            self.assertGreaterEqual(slide["render_ms"], 0)
+    
+    def test_builder_does_not_import_qt(self):
+        """Test the builder can be imported without PyQt6"""
+        code = "import sys, slides.build.builder; sys.exit('PyQt6' in sys.modules)"
+        result = subprocess.run([sys.executable, "-c", code], cwd=os.getcwd())
+        self.assertEqual(result.returncode, 0)
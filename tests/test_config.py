@@ -6,9 +6,14 @@ import os
 import tempfile
 import unittest
 import json
+from unittest.mock import patch
 import yaml
 from slides.config.app_config import AppConfig
-from slides.config.slide_config import SlideConfig
+from slides.config.deck_cache import DeckCache
+from slides.config.deck_diff import DeckDiff
+from slides.config.slide_config import SlideConfig, SlideTable
+from slides.config.style import Style
+from slides.utils.error_handler import ErrorHandler
 
 
 class TestAppConfig(unittest.TestCase):
@@ -138,6 +143,61 @@ class TestSlideConfig(unittest.TestCase):
         self.assertEqual(slides[0].style["font"], "Arial")  # Inherited from global
         self.assertEqual(slides[1].style["backgroundColor"], "#E0E0E0")  # Overridden
     
+    def test_equal_styles_are_shared(self):
+        """Test slides with the same resolved style share one style object"""
+        test_config = {
+            "slides": [
+                {"path": "slide1.md"},
+                {"path": "slide2.md"},
+                {"path": "slide1.md", "style": {"fontSize": 40}}
+            ]
+        }
+        
+        with open(self.yaml_path, "w") as f:
+            yaml.dump(test_config, f)
+        
+        slide_config = SlideConfig()
+        slide_config.load_config(self.yaml_path)
+        slides = slide_config.get_slides()
+        
+        self.assertIs(slides[0].style, slides[1].style)
+        self.assertIsNot(slides[0].style, slides[2].style)
+        self.assertEqual(hash(slides[0].style), hash(slides[1].style))
+    
+    def test_style_chain_is_memoized(self):
+        """Test deriving the same overrides returns the same style without copying"""
+        deck_style = SlideConfig.DEFAULTS.derive({"font": "Arial"})
+        self.assertIs(deck_style, SlideConfig.DEFAULTS.derive({"font": "Arial"}))
+        self.assertIs(deck_style.derive(None), deck_style)
+        self.assertEqual(deck_style["fontSize"], SlideConfig.DEFAULT_STYLE["fontSize"])
+        
+        # Different chains resolving to equal values share one style
+        slide_style = deck_style.derive({"fontSize": 40})
+        self.assertIs(slide_style, SlideConfig.DEFAULTS.derive({"fontSize": 40, "font": "Arial"}))
+        self.assertEqual(deck_style.derive({"fontSize": 40}).to_dict()["font"], "Arial")
+        
+        with patch.object(Style, "intern", wraps=Style.intern) as intern:
+            deck_style.derive({"fontSize": 40})
+        self.assertEqual(intern.call_count, 0)
+    
+    def test_unhashable_style_values_are_rejected(self):
+        """Test a style value that is a list fails to load with a clear error"""
+        test_config = {
+            "slides": [
+                {"path": "slide1.md", "style": {"padding": [10, 20]}}
+            ]
+        }
+        
+        with open(self.yaml_path, "w") as f:
+            yaml.dump(test_config, f)
+        
+        with patch.object(ErrorHandler, "handle_config_error") as handle_error:
+            slide_config = SlideConfig()
+            slide_config.load_config(self.yaml_path)
+        self.assertIsInstance(handle_error.call_args[0][0], ValueError)
+        self.assertIn("'padding'", str(handle_error.call_args[0][0]))
+        self.assertEqual(slide_config.get_slide_count(), 0)
+    
     def test_get_slide(self):
         """Test getting slide by index"""
         # Create test YAML file
@@ -168,3 +228,303 @@ class TestSlideConfig(unittest.TestCase):
         
         self.assertTrue(slide0.path.endswith("slide1.md"))
         self.assertTrue(slide1.path.endswith("slide2.md"))
+    
+    def test_inline_content_stays_in_memory(self):
+        """Test inline slides are served from memory without temporary files"""
+        test_config = {
+            "slides": [
+                {"path": "slide1.md"},
+                {"content": "# Inline"}
+            ]
+        }
+        
+        with open(self.yaml_path, "w") as f:
+            yaml.dump(test_config, f)
+        
+        slide_config = SlideConfig()
+        with patch("tempfile.mkstemp") as mkstemp:
+            slide_config.load_config(self.yaml_path)
+            slides = slide_config.get_slides()
+            
+            self.assertIsNone(slides[1].path)
+            self.assertEqual(slides[1].content, "# Inline")
+            self.assertTrue(slides[1].source.is_inline)
+            self.assertEqual(slides[1].source.read(), "# Inline")
+            self.assertTrue(slides[1].source.key.startswith("inline:"))
+            mkstemp.assert_not_called()
+        
+        self.assertFalse(slides[0].source.is_inline)
+        self.assertEqual(slides[0].source.read(), "# Slide 1\nContent for slide 1")
+        self.assertEqual(slide_config.get_slides().file_paths(), [slides[0].path])
+    
+    def test_paths_and_styles_are_stored_once(self):
+        """Test repeated paths and styles share one table entry"""
+        test_config = {
+            "slides": ["slide1.md", "slide2.md", "slide1.md", "slide1.md"]
+        }
+        
+        with open(self.yaml_path, "w") as f:
+            yaml.dump(test_config, f)
+        
+        slide_config = SlideConfig()
+        slide_config.load_config(self.yaml_path)
+        slides = slide_config.get_slides()
+        
+        self.assertEqual(len(slides), 4)
+        self.assertEqual(len(slides.sources), 2)
+        self.assertEqual(len(slides.styles), 1)
+        self.assertEqual([slide.index for slide in slides[1:3]], [1, 2])
+        self.assertEqual(slides[2].path, slides[0].path)
+
+
+class TestDeckCache(unittest.TestCase):
+    """Test caching of parsed slides.yaml decks"""
+    
+    def setUp(self):
+        """Set up test environment"""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.yaml_path = os.path.join(self.temp_dir.name, "slides.yaml")
+        self.cache_dir = os.path.join(self.temp_dir.name, "cache")
+        self.write_deck({
+            "title": "Cached",
+            "slides": [
+                {"path": "slide1.md", "style": {"fontSize": 40}},
+                {"content": "# Inline"}
+            ]
+        })
+        self.cache = DeckCache(cache_dir=self.cache_dir)
+    
+    def tearDown(self):
+        """Clean up test environment"""
+        self.temp_dir.cleanup()
+    
+    def write_deck(self, config):
+        """Write slides.yaml and date it back so the fast path is trusted"""
+        with open(self.yaml_path, "w") as f:
+            yaml.dump(config, f)
+        os.utime(self.yaml_path, (1000000000, 1000000000))
+    
+    def load(self):
+        """Load the deck through the cache under test"""
+        slide_config = SlideConfig(self.cache)
+        with patch.object(slide_config, "_parse_deck", wraps=slide_config._parse_deck) as parse:
+            slide_config.load_config(self.yaml_path)
+        return slide_config, parse.call_count
+    
+    def test_unchanged_deck_skips_parsing(self):
+        """Test reopening an unchanged deck does not parse YAML again"""
+        _, parses = self.load()
+        self.assertEqual(parses, 1)
+        
+        slide_config, parses = self.load()
+        self.assertEqual(parses, 0)
+        self.assertEqual(slide_config.get_title(), "Cached")
+        self.assertEqual(slide_config.get_slide_count(), 2)
+        
+        # Touching the file without changing it still matches by hash
+        os.utime(self.yaml_path, (1000000100, 1000000100))
+        _, parses = self.load()
+        self.assertEqual(parses, 0)
+        self.assertEqual(self.cache.get_stats()["misses"], 1)
+    
+    def test_changed_deck_is_parsed(self):
+        """Test editing slides.yaml invalidates the cached deck"""
+        self.load()
+        self.write_deck({"title": "Edited", "slides": ["slide1.md"]})
+        
+        slide_config, parses = self.load()
+        self.assertEqual(parses, 1)
+        self.assertEqual(slide_config.get_title(), "Edited")
+        self.assertEqual(slide_config.get_slide_count(), 1)
+    
+    def test_disk_tier(self):
+        """Test a new process can load the deck from disk without parsing"""
+        original, _ = self.load()
+        
+        self.cache = DeckCache(cache_dir=self.cache_dir)
+        slide_config, parses = self.load()
+        self.assertEqual(parses, 0)
+        self.assertEqual(self.cache.get_stats()["disk_hits"], 1)
+        
+        slides = slide_config.get_slides()
+        self.assertEqual(slides[0].path, original.get_slides()[0].path)
+        self.assertIs(slides[0].style, original.get_slides()[0].style)
+        self.assertEqual(slides[1].content, "# Inline")
+
+
+class TestDeckComposition(unittest.TestCase):
+    """Test include: entries and glob paths in slides.yaml"""
+    
+    def setUp(self):
+        """Set up test environment"""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.yaml_path = os.path.join(self.temp_dir.name, "slides.yaml")
+        self.cache = DeckCache()
+    
+    def tearDown(self):
+        """Clean up test environment"""
+        self.temp_dir.cleanup()
+    
+    def write(self, relative_path, content, mtime=1000000000):
+        """Write a file under the deck directory, dated back so its state is trusted"""
+        path = os.path.join(self.temp_dir.name, relative_path)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "w") as f:
+            if isinstance(content, str):
+                f.write(content)
+            else:
+                yaml.dump(content, f)
+        os.utime(path, (mtime, mtime))
+        return path
+    
+    def load(self):
+        """Load the deck through the cache under test"""
+        slide_config = SlideConfig(self.cache)
+        slide_config.load_config(self.yaml_path)
+        return slide_config
+    
+    def test_include_inherits_styles(self):
+        """Test included slides layer deck, include and slide styles in order"""
+        self.write("slides.yaml", {
+            "style": {"font": "Arial", "fontSize": 20},
+            "slides": [
+                "intro.md",
+                {"include": "chapters/one.yaml", "style": {"textColor": "#FF0000"}},
+                "outro.md"
+            ]
+        })
+        self.write("chapters/one.yaml", {
+            "style": {"fontSize": 30, "textColor": "#00FF00"},
+            "slides": ["a.md", {"path": "b.md", "style": {"justify": "center"}}]
+        })
+        
+        slides = self.load().get_slides()
+        chapter_dir = os.path.join(self.temp_dir.name, "chapters")
+        self.assertEqual(
+            [slide.path for slide in slides],
+            [os.path.join(self.temp_dir.name, "intro.md"),
+             os.path.join(chapter_dir, "a.md"),
+             os.path.join(chapter_dir, "b.md"),
+             os.path.join(self.temp_dir.name, "outro.md")]
+        )
+        self.assertEqual(slides[0].style["fontSize"], 20)
+        self.assertEqual(slides[1].style["font"], "Arial")
+        self.assertEqual(slides[1].style["fontSize"], 30)
+        self.assertEqual(slides[1].style["textColor"], "#FF0000")
+        self.assertEqual(slides[2].style["justify"], "center")
+        self.assertEqual(slides[3].style["textColor"], "#000000")
+    
+    def test_glob_uses_natural_order(self):
+        """Test glob paths expand in natural order, so slide2 comes before slide10"""
+        for name in ("slide10.md", "slide2.md", "slide1.md"):
+            self.write(os.path.join("slides", name), f"# {name}")
+        self.write("slides.yaml", {"slides": [{"path": "slides/*.md", "style": {"fontSize": 30}}]})
+        
+        slides = self.load().get_slides()
+        self.assertEqual(
+            [os.path.basename(slide.path) for slide in slides],
+            ["slide1.md", "slide2.md", "slide10.md"]
+        )
+        self.assertEqual(slides[2].style["fontSize"], 30)
+    
+    def test_slide_paths_are_normalized(self):
+        """Test slide paths match the absolute paths reported by the file watcher"""
+        self.write("slides.yaml", {"slides": [
+            "./intro.md", "chapters/../outro.md", {"include": "chapters/one.yaml"}
+        ]})
+        self.write("chapters/one.yaml", {"slides": ["../shared/./a.md"]})
+        
+        slides = self.load().get_slides()
+        self.assertEqual([slide.path for slide in slides], [
+            os.path.join(self.temp_dir.name, "intro.md"),
+            os.path.join(self.temp_dir.name, "outro.md"),
+            os.path.join(self.temp_dir.name, "shared", "a.md"),
+        ])
+    
+    def test_include_cycle_is_an_error(self):
+        """Test a deck that includes itself indirectly fails to load"""
+        self.write("slides.yaml", {"slides": ["intro.md", {"include": "other.yaml"}]})
+        self.write("other.yaml", {"slides": ["other.md", {"include": "slides.yaml"}]})
+        
+        with patch.object(ErrorHandler, "handle_config_error") as handle_error:
+            slide_config = self.load()
+        self.assertIn("Include cycle", str(handle_error.call_args[0][0]))
+        self.assertEqual(slide_config.get_slide_count(), 0)
+    
+    def test_changed_include_reloads_deck(self):
+        """Test editing one chapter reparses only that chapter"""
+        self.write("slides.yaml", {"slides": [{"include": "one.yaml"}, {"include": "two.yaml"}]})
+        self.write("one.yaml", {"slides": ["one.md"]})
+        self.write("two.yaml", {"slides": ["two.md"]})
+        self.assertEqual(self.load().get_slide_count(), 2)
+        
+        self.write("two.yaml", {"slides": ["two.md", "three.md"]}, mtime=1000000100)
+        with patch("yaml.load", wraps=yaml.load) as parse:
+            slide_config = self.load()
+        self.assertEqual(slide_config.get_slide_count(), 3)
+        self.assertEqual(self.cache.get_stats()["misses"], 2)
+        
+        # slides.yaml and two.yaml are parsed again; one.yaml comes from memory
+        self.assertEqual(parse.call_count, 2)
+        self.assertIn(os.path.join(self.temp_dir.name, "two.yaml"), slide_config.get_dependency_paths())
+    
+    def test_new_glob_match_reloads_deck(self):
+        """Test adding a file matching a glob invalidates the cached deck"""
+        self.write(os.path.join("slides", "slide1.md"), "# One")
+        self.write("slides.yaml", {"slides": ["slides/*.md"]})
+        self.assertEqual(self.load().get_slide_count(), 1)
+        
+        self.write(os.path.join("slides", "slide2.md"), "# Two")
+        slide_config = self.load()
+        self.assertEqual(slide_config.get_slide_count(), 2)
+        self.assertIn(os.path.join(self.temp_dir.name, "slides"), slide_config.get_dependency_paths())
+
+
+class TestDeckDiff(unittest.TestCase):
+    """Test matching slides between two versions of a deck"""
+    
+    def table(self, entries):
+        """Build a slide table from paths and ("content", text) pairs"""
+        table = SlideTable()
+        for entry in entries:
+            if isinstance(entry, tuple):
+                table.append_content(entry[1], SlideConfig.DEFAULTS)
+            else:
+                table.append_path(entry, SlideConfig.DEFAULTS)
+        return table
+    
+    def test_insert_before_current_keeps_slide(self):
+        """Test slides inserted earlier move the presenter with their slide"""
+        old = self.table(["a.md", "b.md", "c.md"])
+        new = self.table(["new.md", ("content", "# New"), "a.md", "b.md", "c.md"])
+        diff = DeckDiff(old, new)
+        
+        self.assertEqual(diff.new_index(1), 3)
+        self.assertTrue(all(diff.is_unchanged(index) for index in range(3)))
+        self.assertFalse(diff.is_identity())
+        self.assertEqual(diff.removed_keys(), set())
+    
+    def test_edited_and_removed_slides(self):
+        """Test edited slides stay in place and removed slides move to the next one"""
+        old = self.table(["a.md", ("content", "# Old"), "c.md", "d.md"])
+        new = self.table(["a.md", ("content", "# Edited"), "d.md"])
+        diff = DeckDiff(old, new)
+        
+        self.assertEqual(diff.new_index(1), 1)
+        self.assertFalse(diff.is_unchanged(1))
+        self.assertEqual(diff.new_index(2), 2)
+        self.assertEqual(diff.new_index(3), 2)
+        self.assertEqual(diff.removed_keys(), {old[1].source.key, "c.md"})
+    
+    def test_style_change_is_a_change(self):
+        """Test a slide whose resolved style changed is not matched"""
+        old = self.table(["a.md", "b.md"])
+        new = SlideTable()
+        new.append_path("a.md", SlideConfig.DEFAULTS)
+        new.append_path("b.md", SlideConfig.DEFAULTS.derive({"fontSize": 40}))
+        diff = DeckDiff(old, new)
+        
+        self.assertTrue(diff.is_unchanged(0))
+        self.assertFalse(diff.is_unchanged(1))
+        self.assertEqual(diff.new_index(1), 1)
+        self.assertTrue(DeckDiff(old, self.table(["a.md", "b.md"])).is_identity())
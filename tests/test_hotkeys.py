@@ -2,9 +2,12 @@
 Tests for hotkey management
 """
 
+import threading
 import unittest
 from unittest.mock import MagicMock, patch
+from PyQt6.QtWidgets import QApplication
 from slides.config.app_config import AppConfig
+from slides.hotkeys.dispatcher import HotkeyDispatcher
 from slides.hotkeys.manager import HotkeyManager
 
 
@@ -87,3 +90,135 @@ class TestHotkeyManager(unittest.TestCase):
         # Check previous slide hotkey
         result = self.hotkey_manager._check_hotkey_combination('previous_slide')
         self.assertTrue(result)
+    
+    def test_goto_slide_hotkey(self):
+        """Test goto_slide_<N> hotkeys pass a zero-based index"""
+        from pynput.keyboard import Key, KeyCode
+        
+        self.app_config.get_hotkey_config.return_value = {
+            "goto_slide_12": ["cmd", "1"]
+        }
+        hotkey_manager = HotkeyManager(self.app_config)
+        goto_handler = MagicMock()
+        hotkey_manager.set_goto_handler(goto_handler)
+        
+        hotkey_manager._on_key_press(Key.cmd)
+        hotkey_manager._on_key_press(KeyCode.from_char('1'))
+        
+        goto_handler.assert_called_once_with(11)
+    
+    def test_modifier_variants_are_normalized(self):
+        """Test left/right modifier variants and letter case match a binding"""
+        from pynput.keyboard import Key, KeyCode
+        
+        self.app_config.get_hotkey_config.return_value = {
+            "next_slide": ["cmd", "n"]
+        }
+        hotkey_manager = HotkeyManager(self.app_config)
+        next_handler = MagicMock()
+        hotkey_manager.set_next_handler(next_handler)
+        
+        hotkey_manager._on_key_press(Key.cmd_r)
+        hotkey_manager._on_key_press(KeyCode.from_char('N'))
+        next_handler.assert_called_once_with()
+        
+        # Without the modifier held the trigger key alone does nothing
+        hotkey_manager._on_key_release(Key.cmd_r)
+        hotkey_manager._on_key_press(KeyCode.from_char('n'))
+        next_handler.assert_called_once_with()
+
+    def test_extra_modifiers_still_fire(self):
+        """Test a binding fires while more than its modifiers are held"""
+        from pynput.keyboard import Key, KeyCode
+
+        self.app_config.get_hotkey_config.return_value = {
+            "next_slide": ["cmd", "n"]
+        }
+        hotkey_manager = HotkeyManager(self.app_config)
+        next_handler = MagicMock()
+        hotkey_manager.set_next_handler(next_handler)
+
+        hotkey_manager._on_key_press(Key.cmd)
+        hotkey_manager._on_key_press(Key.shift)
+        hotkey_manager._on_key_press(KeyCode.from_char('n'))
+        next_handler.assert_called_once_with()
+
+    @patch('slides.hotkeys.manager.ErrorHandler.handle_hotkey_error')
+    def test_modifier_only_binding_is_rejected(self, mock_handle_error):
+        """Test a binding ending in a modifier is reported and not compiled"""
+        self.app_config.get_hotkey_config.return_value = {
+            "next_slide": ["cmd", "shift"]
+        }
+        hotkey_manager = HotkeyManager(self.app_config)
+
+        mock_handle_error.assert_called_once()
+        self.assertIsInstance(mock_handle_error.call_args[0][0], ValueError)
+        self.assertEqual(hotkey_manager.bindings, {})
+        self.assertNotIn("next_slide", hotkey_manager.combinations)
+
+    def test_reload_config(self):
+        """Test bindings are recompiled when the configuration changes"""
+        from pynput.keyboard import Key, KeyCode
+        
+        self.app_config.get_hotkey_config.return_value = {
+            "previous_slide": ["cmd", "p"]
+        }
+        self.hotkey_manager.reload_config()
+        
+        self.hotkey_manager._on_key_press(Key.cmd)
+        self.hotkey_manager._on_key_press(KeyCode.from_char('p'))
+        self.previous_handler.assert_called_once_with()
+        self.next_handler.assert_not_called()
+
+
+class TestHotkeyDispatcher(unittest.TestCase):
+    """Test queued hotkey dispatch to the GUI thread"""
+    
+    def setUp(self):
+        """Set up test environment"""
+        self.app = QApplication.instance() or QApplication([])
+        self.dispatcher = HotkeyDispatcher()
+    
+    def test_dispatch_runs_on_gui_thread(self):
+        """Test actions posted from another thread run on the GUI thread"""
+        threads = []
+        post = self.dispatcher.bind('first_slide', lambda: threads.append(threading.current_thread()))
+        
+        listener = threading.Thread(target=post)
+        listener.start()
+        listener.join()
+        self.assertEqual(threads, [])
+        
+        self.app.processEvents()
+        self.assertEqual(threads, [threading.main_thread()])
+    
+    def test_repeated_presses_coalesce(self):
+        """Test consecutive identical presses are merged into one call"""
+        steps = []
+        next_slide = self.dispatcher.bind('next_slide', steps.append, counted=True)
+        goto_slide = self.dispatcher.bind('goto_slide', MagicMock())
+        
+        for _ in range(3):
+            next_slide()
+        goto_slide(4)
+        next_slide()
+        self.app.processEvents()
+        
+        self.assertEqual(steps, [3, 1])
+        self.assertEqual([name for name, _, _ in self.dispatcher.get_latencies()],
+                         ['next_slide', 'goto_slide', 'next_slide'])
+    
+    def test_latency_timestamps(self):
+        """Test dispatched events record hook-to-paint latency once painted"""
+        post = self.dispatcher.bind('last_slide', MagicMock())
+        post()
+        self.app.processEvents()
+        
+        name, dispatch_ms, paint_ms = self.dispatcher.get_latencies()[0]
+        self.assertEqual(name, 'last_slide')
+        self.assertGreaterEqual(dispatch_ms, 0)
+        self.assertIsNone(paint_ms)
+        
+        self.dispatcher.mark_painted()
+        _, _, paint_ms = self.dispatcher.get_latencies()[0]
+        self.assertGreaterEqual(paint_ms, dispatch_ms)
@@ -0,0 +1,163 @@
+"""
+Tests for navigation latency tracing
+"""
+
+import io
+import json
+import os
+import sys
+import tempfile
+import threading
+import unittest
+from slides.utils.instrumentation import StartupProfiler, Tracer
+
+
+class TestTracer(unittest.TestCase):
+    """Test recording and summarizing latency spans"""
+    
+    def setUp(self):
+        """Set up test environment"""
+        self.tracer = Tracer(enabled=True, capacity=8)
+    
+    def test_disabled_tracer_records_nothing(self):
+        """Test spans are ignored when tracing is off"""
+        tracer = Tracer()
+        with tracer.span("parse"):
+            pass
+        tracer.begin_navigation("key")
+        tracer.end_navigation()
+        self.assertEqual(tracer.get_spans(), [])
+    
+    def test_spans_belong_to_navigation(self):
+        """Test spans recorded during a navigation carry its id"""
+        self.tracer.begin_navigation("key")
+        with self.tracer.span("parse"):
+            pass
+        self.tracer.end_navigation()
+        with self.tracer.span("template"):
+            pass
+        
+        spans = self.tracer.get_spans()
+        self.assertEqual([span["name"] for span in spans], ["parse", "navigation:key", "template"])
+        self.assertEqual(spans[0]["navigation"], spans[1]["navigation"])
+        self.assertIsNone(spans[2]["navigation"])
+    
+    def test_open_navigation_is_kept(self):
+        """Test replace=False does not restart an open navigation"""
+        self.tracer.begin_navigation("key", start=1.0)
+        self.tracer.begin_navigation("request", replace=False)
+        self.assertEqual(self.tracer.navigation[1:], ("key", 1.0))
+    
+    def test_ring_buffer(self):
+        """Test only the most recent spans are kept"""
+        for index in range(20):
+            self.tracer.record(f"span{index}", 0.0, 0.001)
+        spans = self.tracer.get_spans()
+        self.assertEqual(len(spans), 8)
+        self.assertEqual(spans[-1]["name"], "span19")
+    
+    def test_summary_percentiles(self):
+        """Test nearest-rank percentiles over span durations"""
+        self.tracer.set_capacity(200)
+        for duration in range(100, 0, -1):
+            self.tracer.record("load_slide", 0.0, duration / 1000)
+        
+        stats = self.tracer.summary()["load_slide"]
+        self.assertEqual(stats["count"], 100)
+        self.assertAlmostEqual(stats["p50"], 50.0)
+        self.assertAlmostEqual(stats["p95"], 95.0)
+        self.assertAlmostEqual(stats["p99"], 99.0)
+        self.assertAlmostEqual(stats["max"], 100.0)
+    
+    def test_worker_spans_are_summarized_separately(self):
+        """Test spans from worker threads do not mix with GUI thread spans"""
+        self.tracer.begin_navigation("key")
+        self.tracer.record("parse", 0.0, 0.001)
+        worker = threading.Thread(target=self.tracer.record, args=("parse", 0.0, 0.050))
+        worker.start()
+        worker.join()
+        self.tracer.end_navigation()
+        
+        summary = self.tracer.summary()
+        self.assertEqual(list(summary)[-1], "worker:parse")
+        self.assertAlmostEqual(summary["parse"]["max"], 1.0)
+        self.assertAlmostEqual(summary["worker:parse"]["max"], 50.0)
+        
+        spans = self.tracer.get_spans()
+        self.assertEqual([span["origin"] for span in spans], ["gui", "worker", "gui"])
+        self.assertIsNone(spans[1]["navigation"])
+    
+    def test_dump_json_and_csv(self):
+        """Test spans are dumped as JSON or CSV by extension"""
+        self.tracer.record("parse", 0.0, 0.002)
+        with tempfile.TemporaryDirectory() as temp_dir:
+            json_path = os.path.join(temp_dir, "trace.json")
+            self.tracer.dump(json_path)
+            with open(json_path) as f:
+                data = json.load(f)
+            self.assertEqual(data["spans"][0]["name"], "parse")
+            self.assertIn("parse", data["summary"])
+            
+            csv_path = os.path.join(temp_dir, "trace.csv")
+            self.tracer.dump(csv_path)
+            with open(csv_path) as f:
+                lines = f.read().splitlines()
+            self.assertEqual(lines[0], "navigation,name,start_ms,duration_ms,thread,origin")
+            self.assertEqual(len(lines), 2)
+        
+        stream = io.StringIO()
+        self.tracer.report(stream=stream)
+        self.assertIn("parse", stream.getvalue())
+
+
+class TestStartupProfiler(unittest.TestCase):
+    """Test timing startup phases and imports"""
+    
+    def setUp(self):
+        """Set up a package of throwaway modules to import"""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        package_dir = os.path.join(self.temp_dir.name, "glider_profile_probe")
+        os.makedirs(package_dir)
+        with open(os.path.join(package_dir, "__init__.py"), "w") as f:
+            f.write("import glider_profile_probe_child\n")
+        with open(os.path.join(self.temp_dir.name, "glider_profile_probe_child.py"), "w") as f:
+            f.write("VALUE = 1\n")
+        sys.path.insert(0, self.temp_dir.name)
+        self.profiler = StartupProfiler()
+    
+    def tearDown(self):
+        """Clean up test environment"""
+        self.profiler.stop()
+        sys.path.remove(self.temp_dir.name)
+        for name in ("glider_profile_probe", "glider_profile_probe_child"):
+            sys.modules.pop(name, None)
+        self.temp_dir.cleanup()
+    
+    def test_disabled_profiler_records_nothing(self):
+        """Test phases are ignored unless profiling was started"""
+        with self.profiler.phase("imports"):
+            pass
+        self.profiler.mark("first slide shown")
+        self.assertEqual(self.profiler.phases, [])
+    
+    def test_imports_are_timed_as_a_tree(self):
+        """Test first imports record self and cumulative time with their depth"""
+        self.profiler.start()
+        with self.profiler.phase("imports"):
+            import glider_profile_probe  # noqa: F401
+        self.profiler.mark("first slide shown")
+        self.profiler.stop()
+        
+        imports = {name: (depth, self_ms, cumulative_ms)
+                   for depth, name, self_ms, cumulative_ms in self.profiler.imports}
+        self.assertEqual(imports["glider_profile_probe"][0], 0)
+        self.assertEqual(imports["glider_profile_probe_child"][0], 1)
+        self.assertGreaterEqual(imports["glider_profile_probe"][2],
+                                imports["glider_profile_probe_child"][2])
+        self.assertEqual([phase[0] for phase in self.profiler.phases],
+                         ["imports", "first slide shown"])
+        
+        stream = io.StringIO()
+        self.profiler.report(stream=stream, min_ms=0)
+        self.assertIn("  glider_profile_probe_child", stream.getvalue())
+        self.assertIn("first slide shown", stream.getvalue())
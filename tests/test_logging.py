@@ -0,0 +1,56 @@
+"""
+Tests for non-blocking logging
+"""
+
+import logging
+import os
+import tempfile
+import threading
+import unittest
+from unittest.mock import patch
+from slides.utils.error_handler import ErrorHandler
+from slides.utils.logging_setup import setup_logging, shutdown_logging
+
+
+class TestLogging(unittest.TestCase):
+    """Test the queued, rotating log pipeline"""
+    
+    def setUp(self):
+        """Set up test environment"""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.log_path = setup_logging({"stderr": False}, log_dir=self.temp_dir.name)
+    
+    def tearDown(self):
+        """Clean up test environment"""
+        shutdown_logging()
+        self.temp_dir.cleanup()
+    
+    def test_errors_are_written_to_log_file(self):
+        """Test handled errors end up in the rotating log file"""
+        ErrorHandler.handle_hotkey_error(ValueError("listener failed"))
+        shutdown_logging()
+        
+        with open(self.log_path, encoding="utf-8") as f:
+            self.assertIn("Hotkey error: listener failed", f.read())
+    
+    def test_files_are_written_on_listener_thread(self):
+        """Test the logging thread only enqueues records"""
+        handler = logging.handlers.RotatingFileHandler
+        threads = []
+        emit = handler.emit
+        
+        def record_thread(self, record):
+            threads.append(threading.current_thread())
+            emit(self, record)
+        
+        with patch.object(handler, "emit", record_thread):
+            ErrorHandler.handle_markdown_error(ValueError("bad"), "slide.md")
+            shutdown_logging()
+        self.assertEqual(len(threads), 1)
+        self.assertIsNot(threads[0], threading.current_thread())
+    
+    def test_setup_is_idempotent(self):
+        """Test repeated setup keeps a single queue handler"""
+        self.assertEqual(setup_logging(log_dir=self.temp_dir.name), self.log_path)
+        self.assertEqual(len(logging.getLogger("slides").handlers), 1)
+        self.assertEqual(os.path.dirname(self.log_path), self.temp_dir.name)
@@ -0,0 +1,30 @@
+"""
+Tests for command line parsing
+"""
+
+import unittest
+from main import parse_arguments
+
+
+class TestParseArguments(unittest.TestCase):
+    """Test command line parsing in the entry point"""
+    
+    def test_deck_and_slide(self):
+        """Test the deck and start slide are parsed"""
+        args, qt_argv = parse_arguments(["main.py", "--deck", "talk", "--slide", "12"])
+        
+        self.assertEqual(args.deck, "talk")
+        self.assertEqual(args.slide, 12)
+        self.assertEqual(qt_argv, ["main.py"])
+    
+    def test_qt_options_pass_through(self):
+        """Test Qt options and their values are handed to Qt unchanged"""
+        argv = ["main.py", "-style", "fusion", "-platform", "offscreen"]
+        args, qt_argv = parse_arguments(argv)
+        
+        self.assertIsNone(args.deck)
+        self.assertEqual(qt_argv, argv)
+        
+        args, qt_argv = parse_arguments(["main.py", "-style", "fusion", "--deck", "talk"])
+        self.assertEqual(args.deck, "talk")
+        self.assertEqual(qt_argv, ["main.py", "-style", "fusion"])
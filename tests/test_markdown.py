@@ -5,6 +5,10 @@ Tests for markdown processing
 import os
 import tempfile
 import unittest
+from slides.config.slide_source import FileSource, InlineSource
+from slides.markdown.cache import RenderCache
+from slides.markdown.disk_cache import DiskRenderCache
+from slides.markdown.highlight import HighlightCache
 from slides.markdown.parser import MarkdownParser
 from slides.markdown.renderer import HTMLRenderer
 
@@ -43,6 +47,14 @@ class TestMarkdownParser(unittest.TestCase):
         self.assertIn("<h1>File Test</h1>", html)
         self.assertIn("<p>This is a test file.</p>", html)
     
+    def test_parse_source(self):
+        """Test parsing file-backed and inline slide sources"""
+        with open(self.markdown_path, "w") as f:
+            f.write("# From File")
+        
+        self.assertIn("<h1>From File</h1>", self.parser.parse_source(FileSource(self.markdown_path)))
+        self.assertIn("<h1>Inline</h1>", self.parser.parse_source(InlineSource("# Inline")))
+    
     def test_parse_code_blocks(self):
         """Test parsing code blocks"""
         markdown_text = "```python\ndef test():\n    return 'Hello'\n```"
@@ -60,6 +72,26 @@ class TestMarkdownParser(unittest.TestCase):
         self.assertIn("<table>", html)
         self.assertIn("<th>Header 1</th>", html)
         self.assertIn("<td>Cell 1</td>", html)
+    
+    def test_engine_reused_between_documents(self):
+        """Test the markdown engine is reused and reset between documents"""
+        first = self.parser.parse_text("[ref]: https://example.com\n\n[link][ref]")
+        second = self.parser.parse_text("[link][ref]")
+        
+        self.assertIn('href="https://example.com"', first)
+        self.assertNotIn("href", second)
+        self.assertIs(self.parser._get_engine(), self.parser._get_engine())
+    
+    def test_engine_per_thread(self):
+        """Test each thread gets its own markdown engine"""
+        import threading
+        
+        engines = []
+        thread = threading.Thread(target=lambda: engines.append(self.parser._get_engine()))
+        thread.start()
+        thread.join()
+        
+        self.assertIsNot(engines[0], self.parser._get_engine())
 
 
 class TestHTMLRenderer(unittest.TestCase):
@@ -103,3 +135,239 @@ class TestHTMLRenderer(unittest.TestCase):
         self.assertIn("<body>", slide_html)
         self.assertIn("background-color: #F0F0F0", slide_html)
         self.assertIn("<h1>Test Slide</h1>", slide_html)
+    
+    def test_stylesheet_compiled_once_per_style(self):
+        """Test equal styles share one compiled stylesheet"""
+        first = self.renderer.get_stylesheet({"font": "Arial", "justify": "center"})
+        second = self.renderer.get_stylesheet({"justify": "center", "font": "Arial"})
+        
+        self.assertIs(first, second)
+        self.assertEqual(len(self.renderer._stylesheets), 1)
+        self.assertIn("margin: 0 auto;", first)
+    
+    def test_create_deck_html(self):
+        """Test creating one document with a section per slide"""
+        deck_html = self.renderer.create_deck_html([
+            (0, "<h1>First</h1>", {"backgroundColor": "#F0F0F0"}),
+            (1, "<h1>Second</h1>", {"backgroundColor": "#F0F0F0"}),
+            (2, "<h1>Third</h1>", {"backgroundColor": "#000000"})
+        ])
+        
+        self.assertEqual(deck_html.count("<section"), 3)
+        self.assertIn('data-index="2"', deck_html)
+        self.assertIn("function gliderShow", deck_html)
+        # Equal styles share one scoped stylesheet
+        self.assertEqual(deck_html.count("section.glider-style-0 {"), 1)
+        self.assertIn("section.glider-style-1 {", deck_html)
+        self.assertNotIn("glider-style-2", deck_html)
+        
+        # Sections added to a loaded deck keep the class names of its styles
+        self.assertIn("function gliderAddSection", deck_html)
+        style_class, _, markup = self.renderer.create_deck_section(3, "<h1>Fourth</h1>", {"backgroundColor": "#000000"})
+        self.assertEqual(style_class, "glider-style-1")
+        self.assertIn('data-index="3"', markup)
+    
+    def test_code_stylesheet(self):
+        """Test Pygments CSS for codehilite classes is included"""
+        slide_html = self.renderer.create_slide_html("<p>Code</p>", {})
+        self.assertIn(".codehilite", slide_html)
+
+
+class TestRenderCache(unittest.TestCase):
+    """Test rendered slide caching"""
+    
+    def setUp(self):
+        """Set up test environment"""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.markdown_path = os.path.join(self.temp_dir.name, "test.md")
+        with open(self.markdown_path, "w") as f:
+            f.write("# Cached")
+    
+    def tearDown(self):
+        """Clean up test environment"""
+        self.temp_dir.cleanup()
+    
+    def test_hit_and_miss(self):
+        """Test cache hits and misses are counted"""
+        cache = RenderCache()
+        key = RenderCache.make_key(self.markdown_path, {"font": "Arial"}, ["tables"])
+        
+        self.assertIsNone(cache.get(key))
+        cache.put(key, "<h1>Cached</h1>")
+        self.assertEqual(cache.get(key), "<h1>Cached</h1>")
+        
+        stats = cache.get_stats()
+        self.assertEqual(stats["hits"], 1)
+        self.assertEqual(stats["misses"], 1)
+    
+    def test_key_changes_with_file(self):
+        """Test cache key changes when the file changes"""
+        key = RenderCache.make_key(self.markdown_path, {}, [])
+        with open(self.markdown_path, "w") as f:
+            f.write("# Changed content")
+        
+        self.assertNotEqual(key, RenderCache.make_key(self.markdown_path, {}, []))
+    
+    def test_key_from_source(self):
+        """Test slide sources supply their own key and state"""
+        self.assertEqual(
+            RenderCache.make_key(FileSource(self.markdown_path), {}, []),
+            RenderCache.make_key(self.markdown_path, {}, [])
+        )
+        
+        inline_key = RenderCache.make_key(InlineSource("# Inline"), {}, [])
+        self.assertEqual(inline_key, RenderCache.make_key(InlineSource("# Inline"), {}, []))
+        self.assertNotEqual(inline_key, RenderCache.make_key(InlineSource("# Other"), {}, []))
+    
+    def test_lru_eviction(self):
+        """Test least recently used entries are evicted first"""
+        cache = RenderCache(max_entries=2)
+        cache.put("a", "A")
+        cache.put("b", "B")
+        cache.get("a")
+        cache.put("c", "C")
+        
+        self.assertEqual(cache.get("a"), "A")
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual(cache.get("c"), "C")
+    
+    def test_byte_budget(self):
+        """Test entries are evicted to stay within the byte budget"""
+        cache = RenderCache(max_bytes=10)
+        cache.put("a", "12345")
+        cache.put("b", "67890")
+        cache.put("c", "abc")
+        
+        self.assertIsNone(cache.get("a"))
+        self.assertLessEqual(cache.get_stats()["bytes"], 10)
+
+
+class TestDiskRenderCache(unittest.TestCase):
+    """Test persistent render caching"""
+    
+    def setUp(self):
+        """Set up test environment"""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.cache = DiskRenderCache(cache_dir=os.path.join(self.temp_dir.name, "cache"))
+        self.markdown_path = os.path.join(self.temp_dir.name, "test.md")
+        with open(self.markdown_path, "w") as f:
+            f.write("# Persisted")
+    
+    def tearDown(self):
+        """Clean up test environment"""
+        self.temp_dir.cleanup()
+    
+    def test_round_trip(self):
+        """Test fragments can be stored and read back"""
+        key = self.cache.make_key("# Persisted", ["tables"])
+        self.assertIsNone(self.cache.get(key))
+        
+        self.cache.put(key, "<h1>Persisted</h1>")
+        self.assertEqual(self.cache.get(key), "<h1>Persisted</h1>")
+    
+    def test_key_covers_extensions(self):
+        """Test keys differ for different extension lists"""
+        self.assertNotEqual(
+            self.cache.make_key("# Text", ["tables"]),
+            self.cache.make_key("# Text", ["tables", "codehilite"])
+        )
+    
+    def test_parser_skips_conversion_on_hit(self):
+        """Test the parser serves cached fragments for unchanged sources"""
+        parser = MarkdownParser(disk_cache=self.cache)
+        first = parser.parse_file(self.markdown_path)
+        
+        key = self.cache.make_key("# Persisted", parser.extensions)
+        self.cache.put(key, "<h1>From cache</h1>")
+        
+        self.assertIn("<h1>Persisted</h1>", first)
+        self.assertEqual(parser.parse_file(self.markdown_path), "<h1>From cache</h1>")
+    
+    def test_prune_to_size_cap(self):
+        """Test least recently used fragments are pruned over the size cap"""
+        cache = DiskRenderCache(cache_dir=os.path.join(self.temp_dir.name, "small"), max_bytes=100)
+        keys = [cache.make_key(str(index), []) for index in range(5)]
+        for key in keys:
+            cache.put(key, "x" * 40)
+        
+        self.assertLessEqual(cache.total_bytes, 100)
+        self.assertEqual(cache.get(keys[-1]), "x" * 40)
+    
+    def test_overwrite_replaces_size(self):
+        """Test storing a key again counts only the new fragment's size"""
+        key = self.cache.make_key("# Text", [])
+        self.cache.put(self.cache.make_key("# Other", []), "y" * 10)
+        self.cache.put(key, "x" * 40)
+        self.cache.put(key, "x" * 25)
+        
+        self.assertEqual(self.cache.total_bytes, 35)
+        self.assertEqual(self.cache.total_bytes, self.cache._scan_size())
+    
+    def test_clear(self):
+        """Test clearing removes all fragments"""
+        key = self.cache.make_key("# Text", [])
+        self.cache.put(key, "<h1>Text</h1>")
+        self.cache.clear()
+        
+        self.assertIsNone(self.cache.get(key))
+
+
+class TestHighlightCache(unittest.TestCase):
+    """Test cached syntax highlighting"""
+    
+    def setUp(self):
+        """Set up test environment"""
+        self.temp_dir = tempfile.TemporaryDirectory()
+    
+    def tearDown(self):
+        """Clean up test environment"""
+        self.temp_dir.cleanup()
+    
+    def test_identical_snippets_highlighted_once(self):
+        """Test repeated code blocks are served from the cache"""
+        cache = HighlightCache()
+        parser = MarkdownParser(highlight_cache=cache)
+        markdown_text = "```python\ndef test():\n    return 'Hello'\n```"
+        
+        first = parser.parse_text(markdown_text)
+        second = parser.parse_text("# Other slide\n\n" + markdown_text)
+        
+        self.assertIn("<span class=\"k\">def</span>", first)
+        self.assertIn("<span class=\"k\">def</span>", second)
+        stats = cache.get_stats()
+        self.assertEqual(stats["misses"], 1)
+        self.assertEqual(stats["hits"], 1)
+    
+    def test_disk_tier(self):
+        """Test highlighted blocks are shared through the disk tier"""
+        cache_dir = os.path.join(self.temp_dir.name, "highlight")
+        options = {"pygments_style": "default", "css_class": "codehilite"}
+        
+        html = HighlightCache(cache_dir=cache_dir).highlight("x = 1\n", "python", options)
+        
+        other = HighlightCache(cache_dir=cache_dir)
+        self.assertEqual(other.highlight("x = 1\n", "python", options), html)
+        self.assertEqual(other.get_stats()["disk_hits"], 1)
+    
+    def test_disk_tier_is_pruned(self):
+        """Test the disk tier is pruned to its size cap"""
+        cache_dir = os.path.join(self.temp_dir.name, "highlight")
+        options = {"pygments_style": "default", "css_class": "codehilite"}
+        cache = HighlightCache(cache_dir=cache_dir, disk_max_bytes=2048)
+        for index in range(20):
+            cache.highlight(f"value_{index} = {index}\n", "python", options)
+        
+        self.assertLessEqual(cache.disk_cache.total_bytes, 2048)
+        self.assertEqual(cache.disk_cache.total_bytes, cache.disk_cache._scan_size())
+    
+    def test_key_covers_language_and_options(self):
+        """Test keys differ by language and style"""
+        options = {"pygments_style": "default"}
+        self.assertNotEqual(
+            HighlightCache.make_key("x", "python", options),
+            HighlightCache.make_key("x", "ruby", options)
+        )
+        self.assertNotEqual(
+            HighlightCache.make_key("x", "python", options),
+            HighlightCache.make_key("x", "python", {"pygments_style": "monokai"})
+        )
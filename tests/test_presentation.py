@@ -0,0 +1,864 @@
+"""
+Tests for presentation helpers
+"""
+
+import os
+import re
+import tempfile
+import threading
+import time
+import unittest
+from unittest.mock import MagicMock, patch
+from PyQt6.QtCore import QEvent, QRect, Qt, QTimer, pyqtSignal
+from PyQt6.QtGui import QColor, QImage, QKeyEvent
+from PyQt6.QtWidgets import QApplication, QWidget
+from slides.presentation.asset_cache import AssetCache
+from slides.config.deck_cache import DeckCache
+from slides.config.slide_config import SlideConfig
+from slides.config.style import Style
+from slides.markdown.cache import RenderCache
+from slides.markdown.parser import MarkdownParser
+from slides.markdown.renderer import HTMLRenderer
+from slides.presentation.images import ImagePipeline
+from slides.presentation.prefetch import SlidePrefetcher
+from slides.presentation.session import SessionStore, fingerprint
+from slides.presentation.watcher import DeckWatcher
+from slides.utils.instrumentation import Tracer
+
+try:
+    from slides.presentation.slide_view import SlideView
+    from slides.presentation.window import PresentationWindow
+except ImportError:
+    # QtWebEngine needs system libraries that headless machines may lack
+    SlideView = PresentationWindow = None
+
+
+class StubWebView(QWidget):
+    """Stands in for QWebEngineView, finishing loads only when told to"""
+    
+    loadFinished = pyqtSignal(bool)
+    
+    def __init__(self):
+        """Initialize stub with no document"""
+        super().__init__()
+        self.html = None
+        self.loads = 0
+        self.scripts = []
+    
+    def setHtml(self, html, base_url=None):
+        """Record the document instead of rendering it"""
+        self.html = html
+        self.loads += 1
+    
+    def page(self):
+        """Return the view itself, standing in for its page"""
+        return self
+    
+    def runJavaScript(self, script, callback=None):
+        """Record a script instead of running it"""
+        self.scripts.append(script)
+    
+    def finish(self):
+        """Report the last load as finished"""
+        self.loadFinished.emit(True)
+
+
+class TestAssetCache(unittest.TestCase):
+    """Test serving deck assets from memory"""
+    
+    def setUp(self):
+        """Set up test environment"""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.deck_dir = os.path.join(self.temp_dir.name, "deck")
+        os.makedirs(os.path.join(self.deck_dir, "images"))
+        
+        self.image_path = os.path.join(self.deck_dir, "images", "logo.png")
+        with open(self.image_path, "wb") as f:
+            f.write(b"\x89PNG fake image")
+        
+        with open(os.path.join(self.temp_dir.name, "secret.txt"), "w") as f:
+            f.write("outside the deck")
+        
+        self.cache = AssetCache(base_dir=self.deck_dir)
+    
+    def tearDown(self):
+        """Clean up test environment"""
+        self.cache.clear()
+        self.temp_dir.cleanup()
+    
+    def test_get_asset(self):
+        """Test assets are served with their MIME type and cached"""
+        data, mime_type = self.cache.get("/images/logo.png")
+        self.assertEqual(bytes(data), b"\x89PNG fake image")
+        self.assertEqual(mime_type, "image/png")
+        
+        self.cache.get("/images/logo.png")
+        self.assertEqual(self.cache.get_stats()["hits"], 1)
+    
+    def test_changed_asset_is_reloaded(self):
+        """Test a changed file is read again"""
+        self.cache.get("/images/logo.png")
+        with open(self.image_path, "wb") as f:
+            f.write(b"\x89PNG a different image")
+        
+        data, _ = self.cache.get("/images/logo.png")
+        self.assertEqual(bytes(data), b"\x89PNG a different image")
+    
+    def test_paths_outside_deck_are_refused(self):
+        """Test requests cannot escape the deck directory"""
+        self.assertIsNone(self.cache.get("/../secret.txt"))
+        self.assertIsNone(self.cache.get("/missing.png"))
+    
+    def test_large_assets_are_mapped(self):
+        """Test large files are memory-mapped instead of copied"""
+        cache = AssetCache(base_dir=self.deck_dir, mmap_threshold=4)
+        data, _ = cache.get("/images/logo.png")
+        
+        self.assertEqual(data[:4], b"\x89PNG")
+        self.assertEqual(cache.get_stats()["bytes"], 0)
+        cache.clear()
+    
+    def test_mapped_assets_are_bounded(self):
+        """Test only max_mapped files stay mapped, dropping the least recently used"""
+        for name in ("a.png", "b.png"):
+            with open(os.path.join(self.deck_dir, "images", name), "wb") as f:
+                f.write(b"\x89PNG " + name.encode())
+        cache = AssetCache(base_dir=self.deck_dir, mmap_threshold=4, max_mapped=2)
+        first, _ = cache.get("/images/logo.png")
+        cache.get("/images/a.png")
+        cache.get("/images/b.png")
+        
+        self.assertEqual(cache.get_stats()["mapped"], 2)
+        self.assertEqual(set(cache.entries), {
+            os.path.join(self.deck_dir, "images", name) for name in ("a.png", "b.png")
+        })
+        
+        # A dropped mapping stays readable while a request still holds it
+        self.assertEqual(first[:], b"\x89PNG fake image")
+        cache.clear()
+        self.assertEqual(cache.get_stats()["mapped"], 0)
+    
+    def test_store_page(self):
+        """Test generated pages can be stored and fetched by name"""
+        name = self.cache.store_page("<html>big page</html>")
+        self.assertEqual(self.cache.get_page(name), b"<html>big page</html>")
+        self.assertIsNone(self.cache.get_page("missing.html"))
+
+
+class TestImagePipeline(unittest.TestCase):
+    """Test downscaled image variants"""
+    
+    def setUp(self):
+        """Set up test environment"""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        for name, width, height in (("big.png", 400, 300), ("small.png", 40, 30)):
+            image = QImage(width, height, QImage.Format.Format_RGB32)
+            image.fill(QColor("red"))
+            image.save(os.path.join(self.temp_dir.name, name))
+        
+        self.pipeline = ImagePipeline(os.path.join(self.temp_dir.name, "variants"))
+        self.pipeline.set_target_size(80, 60)
+    
+    def tearDown(self):
+        """Clean up test environment"""
+        self.pipeline.shutdown()
+        self.temp_dir.cleanup()
+    
+    def test_rewrite_to_variant(self):
+        """Test large images are rewritten once their variant exists"""
+        html = '<img src="big.png"><img src="small.png"><img src="https://example.com/a.png">'
+        
+        # The first pass schedules the variant and keeps the original
+        self.assertEqual(self.pipeline.rewrite(html, self.temp_dir.name, "slide.md"), html)
+        self.pipeline.executor.shutdown(wait=True)
+        
+        rewritten = self.pipeline.rewrite(html, self.temp_dir.name, "slide.md")
+        self.assertIn('src="/__image__/', rewritten)
+        self.assertIn("-80x60.png", rewritten)
+        self.assertIn('src="small.png"', rewritten)
+        self.assertIn('src="https://example.com/a.png"', rewritten)
+        
+        variant = QImage(os.path.join(self.pipeline.cache_dir, os.listdir(self.pipeline.cache_dir)[0]))
+        self.assertEqual((variant.width(), variant.height()), (80, 60))
+        
+        big_path = os.path.join(self.temp_dir.name, "big.png")
+        self.assertEqual(self.pipeline.referencing_slides([big_path]), {"slide.md"})
+    
+    def test_variants_are_pruned(self):
+        """Test least recently used variants are removed once over the size cap"""
+        cache_dir = os.path.join(self.temp_dir.name, "capped")
+        os.makedirs(cache_dir)
+        stale_path = os.path.join(cache_dir, "stale-80x60.png")
+        with open(stale_path, "wb") as f:
+            f.write(b"\0" * 20000)
+        os.utime(stale_path, (1000000000, 1000000000))
+        
+        pipeline = ImagePipeline(cache_dir, max_bytes=30000)
+        pipeline.set_target_size(80, 60)
+        pipeline.rewrite('<img src="big.png">', self.temp_dir.name)
+        pipeline.executor.shutdown(wait=True)
+        
+        self.assertEqual(len(os.listdir(cache_dir)), 1)
+        self.assertFalse(os.path.exists(stale_path))
+        self.assertLessEqual(pipeline.total_bytes, 30000)
+    
+    def test_resize_threshold(self):
+        """Test small resizes keep the current target size"""
+        self.assertFalse(self.pipeline.set_target_size(85, 62))
+        self.assertTrue(self.pipeline.set_target_size(160, 120))
+        self.assertEqual(self.pipeline.target, (160, 120))
+
+
+class TestSessionStore(unittest.TestCase):
+    """Test saving and restoring the session snapshot"""
+    
+    def setUp(self):
+        """Set up test environment"""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.store = SessionStore(os.path.join(self.temp_dir.name, "session.json"))
+    
+    def tearDown(self):
+        """Clean up test environment"""
+        self.temp_dir.cleanup()
+    
+    def test_round_trip(self):
+        """Test the deck, slide and rendered neighbours are restored"""
+        cache_key = ("/deck/slide1.md", (1, 2), Style.intern({"fontSize": 24}), ("tables",), None)
+        window = {"geometry": [10, 20, 800, 600], "fullscreen": True}
+        self.store.save("/deck/slides.yaml", 3, [(3, cache_key, "<p>Slide</p>")], (1920, 1080), window)
+        
+        session = self.store.load()
+        self.assertEqual(session["yaml_path"], os.path.abspath("/deck/slides.yaml"))
+        self.assertEqual(session["slide_index"], 3)
+        self.assertEqual(session["slides"][0]["html"], "<p>Slide</p>")
+        self.assertEqual(session["slides"][0]["fingerprint"], fingerprint(cache_key))
+        self.assertEqual(session["image_target"], [1920, 1080])
+        self.assertEqual(session["window"], window)
+    
+    def test_fingerprint_tracks_render_inputs(self):
+        """Test fingerprints match equal keys and change with file state or style"""
+        style = Style.intern({"fontSize": 24, "font": "Arial"})
+        key = ("/deck/slide1.md", (1, 2), style, ("tables",), (800, 600))
+        self.assertEqual(fingerprint(key), fingerprint(
+            ("/deck/slide1.md", (1, 2), Style.intern({"font": "Arial", "fontSize": 24}),
+             ("tables",), (800, 600))
+        ))
+        self.assertNotEqual(fingerprint(key), fingerprint(
+            ("/deck/slide1.md", (1, 3), style, ("tables",), (800, 600))
+        ))
+        self.assertNotEqual(fingerprint(key), fingerprint(
+            ("/deck/slide1.md", (1, 2), style.derive({"fontSize": 30}), ("tables",), (800, 600))
+        ))
+    
+    def test_missing_or_corrupt_session(self):
+        """Test unreadable snapshots are ignored"""
+        self.assertIsNone(self.store.load())
+        with open(self.store.path, "w") as f:
+            f.write("{not json")
+        self.assertIsNone(self.store.load())
+
+
+class TestDeckWatcher(unittest.TestCase):
+    """Test debounced change reporting for deck sources"""
+    
+    def setUp(self):
+        """Set up test environment"""
+        self.app = QApplication.instance() or QApplication([])
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.slide_path = os.path.join(self.temp_dir.name, "slide.md")
+        with open(self.slide_path, "w") as f:
+            f.write("# Slide")
+        self.batches = []
+    
+    def tearDown(self):
+        """Clean up test environment"""
+        self.temp_dir.cleanup()
+    
+    def make_watcher(self, **kwargs):
+        """Create a watcher that records emitted batches"""
+        watcher = DeckWatcher(**kwargs)
+        watcher.files_changed.connect(self.batches.append)
+        return watcher
+    
+    def wait_for_batches(self, count, timeout=2.0):
+        """Process events until count batches were emitted or timeout passed"""
+        deadline = time.monotonic() + timeout
+        while len(self.batches) < count and time.monotonic() < deadline:
+            self.app.processEvents()
+            time.sleep(0.01)
+    
+    def test_bursts_are_debounced(self):
+        """Test repeated change notifications are reported as one batch"""
+        watcher = self.make_watcher(debounce_ms=50, use_polling=True)
+        watcher.watch([self.slide_path])
+        other_path = os.path.join(self.temp_dir.name, "other.md")
+        for path in (self.slide_path, other_path, self.slide_path):
+            watcher._on_file_changed(path)
+        
+        self.wait_for_batches(1)
+        self.wait_for_batches(2, timeout=0.2)
+        self.assertEqual(self.batches, [sorted([self.slide_path, other_path])])
+    
+    def test_polling_fallback(self):
+        """Test polled paths report edits and files that appear later"""
+        missing_path = os.path.join(self.temp_dir.name, "new.md")
+        watcher = self.make_watcher(debounce_ms=10, poll_interval_ms=20, use_polling=True)
+        watcher.watch([self.slide_path, missing_path])
+        self.assertEqual(set(watcher.polled_paths), {self.slide_path, missing_path})
+        
+        with open(self.slide_path, "w") as f:
+            f.write("# Edited slide")
+        with open(missing_path, "w") as f:
+            f.write("# New")
+        
+        self.wait_for_batches(1)
+        self.assertEqual(sorted(path for batch in self.batches for path in batch),
+                         sorted([self.slide_path, missing_path]))
+    
+    def test_missing_paths_are_polled(self):
+        """Test paths the native watcher cannot take fall back to polling"""
+        missing_path = os.path.join(self.temp_dir.name, "missing.md")
+        watcher = self.make_watcher()
+        watcher.watch([self.slide_path, missing_path])
+        self.assertIn(missing_path, watcher.polled_paths)
+        self.assertNotIn(self.slide_path, watcher.polled_paths)
+        watcher.clear()
+    
+    def test_paths_are_normalized(self):
+        """Test watched paths are reported in the same form as deck slide paths"""
+        watcher = self.make_watcher(debounce_ms=10, poll_interval_ms=20, use_polling=True)
+        relative_path = os.path.join(self.temp_dir.name, "sub", "..", ".", "slide.md")
+        watcher.watch([relative_path])
+        self.assertEqual(watcher.paths, {self.slide_path})
+        
+        with open(self.slide_path, "w") as f:
+            f.write("# Edited slide")
+        self.wait_for_batches(1)
+        self.assertEqual(self.batches, [[self.slide_path]])
+
+
+@unittest.skipIf(SlideView is None, "QtWebEngine is not available")
+class TestSlideViewPool(unittest.TestCase):
+    """Test swapping between preloaded off-screen views"""
+    
+    def setUp(self):
+        """Set up test environment"""
+        self.app = QApplication.instance() or QApplication([])
+        patcher = patch("slides.presentation.slide_view.QWebEngineView", StubWebView)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.view = SlideView(pool_size=3)
+        self.shown = MagicMock()
+        self.view.slide_shown.connect(self.shown)
+    
+    def keys(self):
+        """Return the keys loaded into hidden views"""
+        return {self.view.view_keys[view] for view in self.view.views
+                if view is not self.view.web_view}
+    
+    def test_show_swaps_to_preloaded_view(self):
+        """Test showing a preloaded slide swaps views without loading it again"""
+        self.view.preload("two", "<p>Two</p>")
+        preloaded = self.view._find_view("two")
+        preloaded.finish()
+        self.assertEqual(preloaded.loads, 1)
+        
+        self.view.show_slide("two", "<p>Two</p>")
+        self.assertIs(self.view.web_view, preloaded)
+        self.assertEqual(preloaded.loads, 1)
+        self.shown.assert_called_once_with()
+    
+    def test_current_slide_stays_until_next_has_loaded(self):
+        """Test a slide that is not preloaded is swapped in once it has loaded"""
+        current = self.view.web_view
+        self.view.show_slide("two", "<p>Two</p>")
+        self.assertIs(self.view.web_view, current)
+        self.shown.assert_not_called()
+        
+        self.view._find_view("two").finish()
+        self.assertEqual(self.view.view_keys[self.view.web_view], "two")
+        self.shown.assert_called_once_with()
+    
+    def test_least_recently_used_view_is_reused(self):
+        """Test preloading beyond the pool size evicts the oldest hidden slide"""
+        self.view.preload("one", "<p>One</p>")
+        self.view.preload("two", "<p>Two</p>")
+        self.view.preload("three", "<p>Three</p>")
+        self.assertEqual(self.keys(), {"two", "three"})
+        
+        # Kept slides are only evicted when no other view is free
+        self.view.preload("four", "<p>Four</p>", keep=["two"])
+        self.assertEqual(self.keys(), {"two", "four"})
+    
+    def test_forget_slides_keeps_requested_keys(self):
+        """Test forgetting slides drops every preloaded view except kept ones"""
+        self.view.show_slide("one", "<p>One</p>")
+        self.view._find_view("one").finish()
+        self.view.preload("two", "<p>Two</p>")
+        self.view.preload("three", "<p>Three</p>")
+        
+        self.view.forget_slides(keep=["three"])
+        self.assertEqual(self.keys(), {None, "three"})
+        self.assertEqual(self.view.view_keys[self.view.web_view], "one")
+        
+        self.view.forget_slides(include_current=True)
+        self.assertIsNone(self.view.view_keys[self.view.web_view])
+
+
+class TestSlidePrefetcher(unittest.TestCase):
+    """Test background rendering of neighbouring slides"""
+    
+    def setUp(self):
+        """Set up test environment"""
+        self.app = QApplication.instance() or QApplication([])
+        self.rendered = []
+        self.delivered = []
+    
+    def make_prefetcher(self, render_job, **kwargs):
+        """Create a prefetcher that records delivered results"""
+        prefetcher = SlidePrefetcher(render_job, **kwargs)
+        prefetcher.slide_rendered.connect(
+            lambda generation, key, html: self.delivered.append((generation, key))
+        )
+        self.addCleanup(prefetcher.shutdown)
+        return prefetcher
+    
+    def render(self, slide):
+        """Render job that records which slides were rendered"""
+        self.rendered.append(slide)
+        return slide, f"<p>{slide}</p>"
+    
+    def test_neighbours_are_scheduled_closest_first(self):
+        """Test slides ahead and behind the current one are rendered"""
+        prefetcher = self.make_prefetcher(self.render, ahead=2, behind=1, max_workers=1)
+        prefetcher.prefetch(list(range(10)), 5)
+        prefetcher.executor.shutdown(wait=True)
+        self.app.processEvents()
+        
+        self.assertEqual(self.rendered, [6, 7, 4])
+        self.assertEqual([key for _, key in self.delivered], [6, 7, 4])
+    
+    def test_deck_edges_are_skipped(self):
+        """Test neighbours past either end of the deck are not scheduled"""
+        prefetcher = self.make_prefetcher(self.render, ahead=2, behind=2, max_workers=1)
+        prefetcher.prefetch(list(range(3)), 0)
+        prefetcher.executor.shutdown(wait=True)
+        self.assertEqual(self.rendered, [1, 2])
+    
+    def test_stale_jobs_are_dropped(self):
+        """Test navigating away cancels queued jobs and discards running ones"""
+        release = threading.Event()
+        
+        def render(slide):
+            if slide == 1:
+                release.wait(5)
+            return self.render(slide)
+        
+        prefetcher = self.make_prefetcher(render, ahead=2, behind=1, max_workers=1)
+        slides = list(range(10))
+        prefetcher.prefetch(slides, 0)
+        while not prefetcher.pending[0].running():
+            time.sleep(0.001)
+        
+        prefetcher.prefetch(slides, 5)
+        release.set()
+        prefetcher.executor.shutdown(wait=True)
+        self.app.processEvents()
+        
+        # Slide 2 was still queued and never ran; slide 1 finished too late
+        self.assertEqual(self.rendered, [1, 6, 7, 4])
+        self.assertEqual([key for _, key in self.delivered], [6, 7, 4])
+        self.assertTrue(all(prefetcher.is_current(generation) for generation, _ in self.delivered))
+
+
+@unittest.skipIf(PresentationWindow is None, "QtWebEngine is not available")
+class TestPrefetchIntoRenderCache(unittest.TestCase):
+    """Test prefetched slides are served by the window's render path"""
+    
+    # Window methods on the render path, borrowed without creating widgets
+    RENDER_METHODS = (
+        "render_slide", "render_section", "_cache_key", "_section_key", "_parse_slide",
+        "_build_slide_html", "_prefetch_job", "_on_slide_prefetched",
+        "_preload_neighbours", "_neighbour_keys", "_show_deck_slide", "_deck_range",
+        "_extend_deck",
+    )
+    
+    def setUp(self):
+        """Set up test environment"""
+        self.app = QApplication.instance() or QApplication([])
+        self.temp_dir = tempfile.TemporaryDirectory()
+        for index in range(3):
+            with open(os.path.join(self.temp_dir.name, f"slide{index}.md"), "w") as f:
+                f.write(f"# Slide {index}")
+        with open(os.path.join(self.temp_dir.name, "slides.yaml"), "w") as f:
+            f.write("slides:\n  - slide0.md\n  - slide1.md\n  - slide2.md\n")
+        
+        harness_class = type("WindowHarness", (), {
+            name: getattr(PresentationWindow, name) for name in self.RENDER_METHODS
+        })
+        self.window = harness_class()
+        self.window.slide_config = SlideConfig(DeckCache())
+        self.window.slide_config.load_config(os.path.join(self.temp_dir.name, "slides.yaml"))
+        self.window.render_cache = RenderCache()
+        self.window.markdown_parser = MarkdownParser()
+        self.window.html_renderer = HTMLRenderer()
+        self.window.image_pipeline = None
+        self.window.slide_view = MagicMock(deck_indices=set())
+        self.window.view_pool_size = 1
+        self.window.current_slide_index = 0
+        self.window.prefetcher = SlidePrefetcher(self.window._prefetch_job, ahead=2, behind=0)
+        self.window.prefetcher.slide_rendered.connect(self.window._on_slide_prefetched)
+    
+    def tearDown(self):
+        """Clean up test environment"""
+        self.window.prefetcher.shutdown()
+        self.temp_dir.cleanup()
+    
+    def prefetch(self):
+        """Prefetch the neighbours of the first slide and deliver the results"""
+        self.window.prefetcher.prefetch(self.window.slide_config.get_slides(), 0)
+        self.window.prefetcher.executor.shutdown(wait=True)
+        self.app.processEvents()
+    
+    def test_prefetched_slides_are_cache_hits(self):
+        """Test a prefetched slide is shown from the render cache"""
+        self.window.deck_mode = False
+        self.prefetch()
+        
+        for index in (1, 2):
+            slide = self.window.slide_config.get_slide(index)
+            self.assertTrue(self.window.render_cache.contains(self.window._cache_key(slide)))
+            self.assertIn(f"Slide {index}", self.window.render_slide(slide))
+        self.assertEqual(self.window.render_cache.get_stats()["hits"], 2)
+        self.assertEqual(self.window.render_cache.get_stats()["misses"], 0)
+    
+    def test_prefetched_sections_are_cache_hits(self):
+        """Test deck mode prefetches the section bodies deck pages are built from"""
+        self.window.deck_mode = True
+        self.prefetch()
+        
+        slide = self.window.slide_config.get_slide(1)
+        self.assertFalse(self.window.render_cache.contains(self.window._cache_key(slide)))
+        self.assertIn("Slide 1", self.window.render_section(slide))
+        self.assertEqual(self.window.render_cache.get_stats()["hits"], 1)
+    
+    def test_prefetched_sections_join_loaded_deck(self):
+        """Test sections prefetched after a deck page loaded are added without reloading it"""
+        patcher = patch("slides.presentation.slide_view.QWebEngineView", StubWebView)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.window.slide_view = SlideView()
+        self.window.deck_mode = True
+        self.window.deck_window = 1
+        
+        self.window._show_deck_slide(0)
+        web_view = self.window.slide_view.web_view
+        web_view.finish()
+        loads = web_view.loads
+        self.assertFalse(self.window.slide_view.has_section(1))
+        
+        # Only sections inside the deck window join the page
+        self.prefetch()
+        self.assertTrue(self.window.slide_view.has_section(1))
+        self.assertFalse(self.window.slide_view.has_section(2))
+        self.assertTrue(any(script.startswith("gliderAddSection(1,") for script in web_view.scripts))
+        
+        # Moving on adds the cached section that is now inside the window
+        self.window._show_deck_slide(1)
+        self.assertTrue(self.window.slide_view.has_section(2))
+        self.assertEqual(web_view.loads, loads)
+
+
+@unittest.skipIf(PresentationWindow is None, "QtWebEngine is not available")
+class TestSessionResume(unittest.TestCase):
+    """Test slides saved in a session are render cache hits after a restart"""
+    
+    # Window methods on the session and render paths, borrowed without creating widgets
+    SESSION_METHODS = (
+        "render_slide", "render_section", "_cache_key", "_section_key", "_render_key",
+        "_parse_slide", "_build_slide_html", "_save_session", "_restore_session",
+        "_restore_window",
+    )
+    
+    def setUp(self):
+        """Set up test environment"""
+        self.app = QApplication.instance() or QApplication([])
+        self.temp_dir = tempfile.TemporaryDirectory()
+        with open(os.path.join(self.temp_dir.name, "slides.yaml"), "w") as f:
+            f.write("slides:\n" + "".join(f"  - content: '# Slide {index}'\n" for index in range(3)))
+        self.store = SessionStore(os.path.join(self.temp_dir.name, "session.json"))
+        self.pipelines = []
+    
+    def tearDown(self):
+        """Clean up test environment"""
+        for pipeline in self.pipelines:
+            pipeline.shutdown()
+        self.temp_dir.cleanup()
+    
+    def make_window(self, deck_mode, size, fullscreen):
+        """Return a window harness showing the deck at a slide area size"""
+        harness_class = type("WindowHarness", (), {
+            name: getattr(PresentationWindow, name) for name in self.SESSION_METHODS
+        })
+        window = harness_class()
+        window.yaml_path = os.path.join(self.temp_dir.name, "slides.yaml")
+        window.slide_config = SlideConfig(DeckCache())
+        window.slide_config.load_config(window.yaml_path)
+        window.render_cache = RenderCache()
+        window.markdown_parser = MarkdownParser()
+        window.html_renderer = HTMLRenderer()
+        window.image_pipeline = ImagePipeline(os.path.join(self.temp_dir.name, "images"))
+        window.image_pipeline.set_target_size(*size)
+        self.pipelines.append(window.image_pipeline)
+        window.deck_mode = deck_mode
+        window.current_slide_index = 1
+        window.session_store = self.store
+        window.session_timer = QTimer()
+        window.isFullScreen = MagicMock(return_value=fullscreen)
+        window.normalGeometry = MagicMock(return_value=QRect(10, 20, 800, 600))
+        window.geometry = MagicMock(return_value=QRect(10, 20, 800, 600))
+        window.setGeometry = MagicMock()
+        window.showFullScreen = MagicMock()
+        window.showNormal = MagicMock()
+        return window
+    
+    def test_restored_slide_is_cache_hit(self):
+        """Test a slide saved while fullscreen is a cache hit in a smaller new window"""
+        window = self.make_window(False, (1920, 1080), fullscreen=True)
+        slide = window.slide_config.get_slide(1)
+        window.render_slide(slide)
+        window._save_session()
+        
+        # The new window starts at the configured size until the session is restored
+        restored = self.make_window(False, (800, 600), fullscreen=False)
+        restored._restore_session(self.store.load())
+        restored.setGeometry.assert_called_once_with(10, 20, 800, 600)
+        restored.showFullScreen.assert_called_once_with()
+        self.assertEqual(restored.image_pipeline.target, (1920, 1080))
+        
+        self.assertIn("Slide 1", restored.render_slide(restored.slide_config.get_slide(1)))
+        self.assertEqual(restored.render_cache.get_stats()["hits"], 1)
+        self.assertEqual(restored.render_cache.get_stats()["misses"], 0)
+    
+    def test_restored_section_is_cache_hit(self):
+        """Test deck mode saves and restores the section bodies pages are built from"""
+        window = self.make_window(True, (1024, 768), fullscreen=False)
+        window.render_section(window.slide_config.get_slide(1))
+        window._save_session()
+        
+        restored = self.make_window(True, (800, 600), fullscreen=False)
+        restored._restore_session(self.store.load())
+        restored.showFullScreen.assert_not_called()
+        
+        self.assertIn("Slide 1", restored.render_section(restored.slide_config.get_slide(1)))
+        self.assertEqual(restored.render_cache.get_stats()["hits"], 1)
+        self.assertEqual(restored.render_cache.get_stats()["misses"], 0)
+
+
+@unittest.skipIf(PresentationWindow is None, "QtWebEngine is not available")
+class TestChapterImages(unittest.TestCase):
+    """Test images in included chapters resolve against the chapter's folder"""
+    
+    # Window methods on the parse path, borrowed without creating widgets
+    PARSE_METHODS = ("_parse_slide", "_serve_slide_directories")
+    
+    def setUp(self):
+        """Set up test environment"""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.deck_dir = os.path.join(self.temp_dir.name, "deck")
+        files = {
+            "deck/slides.yaml": "slides:\n  - include: chapters/one.yaml\n  - include: ../shared/extra.yaml\n",
+            "deck/chapters/one.yaml": "slides:\n  - intro.md\n",
+            "deck/chapters/intro.md": "![Diagram](img/diagram.png)",
+            "deck/chapters/img/diagram.png": "chapter image",
+            "shared/extra.yaml": "slides:\n  - extra.md\n",
+            "shared/extra.md": "![Logo](logo.png)",
+            "shared/logo.png": "shared image",
+        }
+        for name, content in files.items():
+            path = os.path.join(self.temp_dir.name, name)
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path, "w") as f:
+                f.write(content)
+        
+        harness_class = type("WindowHarness", (), {
+            name: getattr(PresentationWindow, name) for name in self.PARSE_METHODS
+        })
+        self.window = harness_class()
+        self.window.slide_config = SlideConfig(DeckCache())
+        self.window.slide_config.load_config(os.path.join(self.deck_dir, "slides.yaml"))
+        self.window.markdown_parser = MarkdownParser()
+        self.window.image_pipeline = None
+        self.window.asset_cache = AssetCache(base_dir=self.window.slide_config.base_dir)
+        self.window._serve_slide_directories()
+    
+    def tearDown(self):
+        """Clean up test environment"""
+        self.window.asset_cache.clear()
+        self.temp_dir.cleanup()
+    
+    def served_image(self, slide_index):
+        """Return the image source of a parsed slide and the bytes served for it"""
+        html = self.window._parse_slide(self.window.slide_config.get_slide(slide_index))
+        src = re.search(r'src="([^"]+)"', html).group(1)
+        asset = self.window.asset_cache.get(src)
+        return src, asset and bytes(asset[0])
+    
+    def test_image_in_included_chapter(self):
+        """Test an image next to an included chapter's slide is served"""
+        src, data = self.served_image(0)
+        self.assertEqual(src, "/chapters/img/diagram.png")
+        self.assertEqual(data, b"chapter image")
+    
+    def test_image_in_chapter_outside_deck(self):
+        """Test a chapter outside the deck directory gets its own asset root"""
+        src, data = self.served_image(1)
+        self.assertTrue(src.startswith("/" + AssetCache.DIRECTORY_ROOT_PREFIX))
+        self.assertTrue(src.endswith("/logo.png"))
+        self.assertEqual(data, b"shared image")
+
+
+@unittest.skipIf(PresentationWindow is None, "QtWebEngine is not available")
+class TestNavigationCoalescing(unittest.TestCase):
+    """Test bursts of navigation render only their final target"""
+    
+    # Window navigation methods, borrowed without creating widgets
+    NAVIGATION_METHODS = (
+        "request_slide", "_navigation_target", "_is_rendered", "_on_navigation_settled",
+        "step_slide", "next_slide", "previous_slide", "go_to_slide", "first_slide",
+        "last_slide", "_cache_key", "keyPressEvent", "NAVIGATION_KEYS", "MODIFIER_KEYS",
+    )
+    
+    SETTLE_MS = 50
+    
+    def setUp(self):
+        """Set up test environment"""
+        self.app = QApplication.instance() or QApplication([])
+        self.temp_dir = tempfile.TemporaryDirectory()
+        with open(os.path.join(self.temp_dir.name, "slides.yaml"), "w") as f:
+            f.write("slides:\n" + "".join(f"  - content: '# Slide {index}'\n" for index in range(10)))
+        
+        harness_class = type("WindowHarness", (), {
+            name: getattr(PresentationWindow, name) for name in self.NAVIGATION_METHODS
+        })
+        self.window = harness_class()
+        self.window.slide_config = SlideConfig(DeckCache())
+        self.window.slide_config.load_config(os.path.join(self.temp_dir.name, "slides.yaml"))
+        self.window.render_cache = RenderCache()
+        self.window.markdown_parser = MarkdownParser()
+        self.window.image_pipeline = None
+        self.window.deck_mode = False
+        self.window.current_slide_index = 0
+        self.window.pending_slide_index = None
+        self.window.jump_buffer = ""
+        self.window.navigation_timer = QTimer()
+        self.window.navigation_timer.setSingleShot(True)
+        self.window.navigation_timer.setInterval(self.SETTLE_MS)
+        self.window.navigation_timer.timeout.connect(self.window._on_navigation_settled)
+        
+        self.loads = []
+        self.window.load_slide = self.load_slide
+        
+        self.tracer = Tracer(enabled=True)
+        patcher = patch("slides.presentation.window.tracer", self.tracer)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+    
+    def tearDown(self):
+        """Clean up test environment"""
+        self.temp_dir.cleanup()
+    
+    def press(self, key, text=""):
+        """Send a key press to the window"""
+        self.window.keyPressEvent(QKeyEvent(QEvent.Type.KeyPress, key, Qt.KeyboardModifier.NoModifier, text))
+    
+    def load_slide(self, slide_index):
+        """Record a slide render and make it current"""
+        self.loads.append((slide_index, time.monotonic()))
+        self.window.current_slide_index = slide_index
+    
+    def wait(self, seconds):
+        """Process events for a while"""
+        deadline = time.monotonic() + seconds
+        while time.monotonic() < deadline:
+            self.app.processEvents()
+            time.sleep(0.005)
+    
+    def test_burst_renders_final_target_once(self):
+        """Test only the first step and the final target of a burst are rendered"""
+        for _ in range(5):
+            self.window.next_slide()
+        self.assertEqual([index for index, _ in self.loads], [1])
+        self.assertEqual(self.window._navigation_target(), 5)
+        
+        self.wait(self.SETTLE_MS * 4 / 1000)
+        self.assertEqual([index for index, _ in self.loads], [1, 5])
+        self.assertEqual(self.window.current_slide_index, 5)
+        self.assertIsNone(self.window.pending_slide_index)
+    
+    def test_final_target_waits_for_settle_time(self):
+        """Test the final target is rendered settle_ms after the last request"""
+        self.window.next_slide()
+        self.window.next_slide()
+        last_request = time.monotonic()
+        
+        self.wait(self.SETTLE_MS / 4 / 1000)
+        self.assertEqual(len(self.loads), 1)
+        
+        self.wait(self.SETTLE_MS * 4 / 1000)
+        index, loaded_at = self.loads[-1]
+        self.assertEqual(index, 2)
+        self.assertGreaterEqual((loaded_at - last_request) * 1000, self.SETTLE_MS * 0.9)
+    
+    def test_rendered_slides_are_shown_during_burst(self):
+        """Test slides already in the render cache are shown without waiting"""
+        slide = self.window.slide_config.get_slide(2)
+        self.window.render_cache.put(self.window._cache_key(slide), "<p>Slide 2</p>")
+        
+        self.window.next_slide()
+        self.window.next_slide()
+        self.assertEqual([index for index, _ in self.loads], [1, 2])
+        
+        # Nothing is left to render once the burst settles on a shown slide
+        self.wait(self.SETTLE_MS * 4 / 1000)
+        self.assertEqual([index for index, _ in self.loads], [1, 2])
+    
+    def test_no_op_keys_are_not_timed(self):
+        """Test keys that change no slide leave no navigation open"""
+        self.window.current_slide_index = 9
+        self.press(Qt.Key.Key_Right)
+        self.press(Qt.Key.Key_End)
+        self.assertIsNone(self.tracer.navigation)
+        
+        self.window.current_slide_index = 0
+        self.press(Qt.Key.Key_Left)
+        self.press(Qt.Key.Key_1, "1")
+        self.assertIsNone(self.tracer.navigation)
+        
+        self.assertEqual(self.loads, [])
+        self.assertEqual(self.tracer.get_spans(), [])
+    
+    def test_burst_back_to_current_slide_is_not_timed(self):
+        """Test a burst that returns to the slide on screen closes its navigation"""
+        self.press(Qt.Key.Key_Right)
+        self.tracer.end_navigation()
+        self.press(Qt.Key.Key_Right)
+        self.press(Qt.Key.Key_Left)
+        self.assertIsNone(self.tracer.navigation)
+        self.assertIsNone(self.window.pending_slide_index)
+        
+        self.wait(self.SETTLE_MS * 4 / 1000)
+        self.assertEqual([index for index, _ in self.loads], [1])
+    
+    def test_other_keys_clear_jump_buffer(self):
+        """Test a partly typed slide number is dropped by any non-digit key"""
+        self.press(Qt.Key.Key_1, "1")
+        self.press(Qt.Key.Key_2, "2")
+        self.press(Qt.Key.Key_Right)
+        self.assertEqual(self.window.jump_buffer, "")
+        
+        # The next number typed starts afresh instead of continuing 12
+        self.wait(self.SETTLE_MS * 4 / 1000)
+        self.press(Qt.Key.Key_5, "5")
+        self.press(Qt.Key.Key_Return)
+        self.assertEqual([index for index, _ in self.loads], [1, 4])